@@ -0,0 +1,59 @@
+# python -m algorithms [FILE ...]: chuỗi đối xứng dài nhất của từng dòng (hoặc bản ghi JSONL), xem bulk.py
+import argparse
+import os
+import sys
+
+# Các module trong thư mục này import lẫn nhau bằng tên trần (như khi chạy benchmark.py)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import bulk
+from registry import ENGINES
+
+# "parallel" tự tạo process pool riêng; "batch" là Expand Center vector hoá cho nhiều chuỗi ngắn
+CLI_ENGINES = ["auto", "batch"] + sorted(name for name in ENGINES if name != "parallel")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m algorithms",
+        description="Longest palindromic substring of every line (or JSONL record) of large files.")
+    parser.add_argument("inputs", nargs="*", default=["-"], help="input files ('-' = stdin, the default)")
+    parser.add_argument("-o", "--output", default="-", help="output JSONL file ('-' = stdout)")
+    parser.add_argument("-e", "--engine", choices=CLI_ENGINES, default="auto")
+    parser.add_argument("--jsonl", action="store_true", help="inputs are JSONL; results are added to each record")
+    parser.add_argument("--field", default="text", help="JSONL field holding the text (default: text)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=bulk.CHUNK_BYTES, help="bytes per work unit")
+    parser.add_argument("--unordered", action="store_true", help="write chunks as soon as they finish")
+    parser.add_argument("--progress", action="store_true", help="report progress and throughput on stderr")
+    args = parser.parse_args(argv)
+
+    inputs, output = [], None
+    progress = bulk.Progress(args.progress)
+    try:
+        for name in args.inputs:
+            inputs.append(sys.stdin.buffer if name == "-" else open(name, "rb"))
+        output = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+        bulk.run(inputs, output, args.engine, args.jsonl, args.field, args.workers,
+                 args.chunk_size, not args.unordered, progress)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        for stream in inputs:
+            if stream is not sys.stdin.buffer:
+                stream.close()
+        if output is not None:
+            try:
+                output.flush()
+            except OSError:
+                pass
+            if output is not sys.stdout.buffer:
+                output.close()
+    if args.progress:
+        progress.report()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,98 +1,274 @@
-import time
-import tracemalloc
+import argparse
+import functools
+import gc
+import json
+import math
+import os
+import platform
 import random
+import statistics
 import string
 import sys
-import os
+import time
+import tracemalloc
 
 # Add current directory to path so we can import algorithms
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from brute_force import longest_palindrome as brute
-from dynamic_programming import longest_palindrome as dp
-from expand_center import longest_palindrome as expand
-from manacher import longest_palindrome as manacher
+from registry import solve
+from sliding_window import SlidingWindow
+import expand_center
+import manacher
+import parallel
+
+# (tên hiển thị, engine trong registry, độ dài tối đa): các thuật toán bậc cao chỉ chạy tới ngưỡng còn đo được
+ENGINES = [
+    ("Brute Force", "brute_force", 300),
+    ("DP", "dynamic_programming", 2000),
+    ("DP Bitset", "dp_bitset", 10 ** 5),
+    ("Expand Center", "expand_center", 10_000),
+    ("Manacher", "manacher", 10 ** 6),
+    ("Rolling Hash", "rolling_hash", 10 ** 6),
+    ("Eertree", "eertree", 10 ** 6),
+    ("Auto", "auto", 10 ** 6),
+]
+
+# tracemalloc làm chậm mỗi lần cấp phát hàng chục lần: bỏ qua lượt đo bộ nhớ cho các lần chạy dài hơn
+MEMORY_PASS_MAX_SECONDS = 0.5
 
 def generate_random_string(length):
     return ''.join(random.choices(string.ascii_lowercase, k=length))
 
-def benchmark_algorithm(algo, name, input_str):
-    # Measure memory
+def generate_fibonacci_string(length):
+    # F(k) = F(k-1) + F(k-2): rất nhiều chuỗi đối xứng lồng nhau
+    a, b = "b", "a"
+    while len(b) < length:
+        a, b = b, b + a
+    return b[:length]
+
+def generate_embedded_palindrome(length):
+    # Chuỗi ngẫu nhiên với một chuỗi đối xứng dài length/2 ở giữa
+    half = generate_random_string(length // 4)
+    middle = half + half[::-1]
+    side = generate_random_string((length - len(middle)) // 2)
+    return (side + middle + generate_random_string(length))[:length]
+
+# Random là trường hợp tốt nhất của Expand Center; các họ còn lại là đầu vào đối nghịch
+FAMILIES = {
+    "random": generate_random_string,
+    "same_char": lambda n: "a" * n,
+    "ab_repeat": lambda n: ("ab" * (n // 2 + 1))[:n],
+    "fibonacci": generate_fibonacci_string,
+    "embedded": generate_embedded_palindrome,
+}
+
+def time_runs(algo, input_str, warmup=1, repeats=7, budget=2.0):
+    """Wall-clock samples in seconds: warmup runs are discarded, gc is paused like timeit.
+    Stops early once `budget` seconds are spent, but always keeps at least 3 samples."""
+    for _ in range(warmup):
+        algo(input_str)
+    samples = []
+    spent = 0.0
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while len(samples) < repeats and (len(samples) < 3 or spent < budget):
+            start_time = time.perf_counter()
+            algo(input_str)
+            samples.append(time.perf_counter() - start_time)
+            spent += samples[-1]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+def median_confidence_interval(samples, z=1.96):
+    # Khoảng tin cậy ~95% cho trung vị theo thống kê thứ tự (không giả định phân phối chuẩn)
+    ordered = sorted(samples)
+    n = len(ordered)
+    lo = max(0, math.floor(n / 2 - z * math.sqrt(n) / 2) - 1)
+    hi = min(n - 1, math.ceil(n / 2 + z * math.sqrt(n) / 2))
+    return ordered[lo], ordered[hi]
+
+def summarize(samples):
+    ordered = sorted(samples)
+    ci_low, ci_high = median_confidence_interval(ordered)
+    p95 = ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+    return {
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": p95 * 1000,
+        "ci_ms": [ci_low * 1000, ci_high * 1000],
+        "repeats": len(ordered),
+    }
+
+def peak_memory_kb(algo, input_str):
+    # Lượt đo riêng: tracemalloc làm chậm chương trình nên không được bật khi đo thời gian
     tracemalloc.start()
-    start_time = time.perf_counter()
-    
-    # Run algorithm
     try:
-        ret = algo(input_str)
-        # Handle return type difference
-        if isinstance(ret, tuple):
-            _ = ret[0]
-        else:
-            _ = ret
-    except Exception as e:
-        print(f"Error in {name}: {e}")
-        return None, None
-
-    end_time = time.perf_counter()
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    
-    time_taken = (end_time - start_time) * 1000 # ms
-    peak_memory = peak / 1024 # KB
-    
-    return time_taken, peak_memory
-
-def run_benchmarks():
-    lengths = [100, 500, 1000, 2000]
-    algorithms = [
-        ("Brute Force", brute),
-        ("DP", dp),
-        ("Expand Center", expand),
-        ("Manacher", manacher)
-    ]
-    
-    print(f"{'Algorithm':<15} | {'Length':<8} | {'Time (ms)':<10} | {'Memory (KB)':<10}")
-    print("-" * 55)
-    
-    for length in lengths:
-        input_str = generate_random_string(length)
-        
-        for name, algo in algorithms:
-            # Skip Brute Force for large inputs as it's too slow (O(n^3))
-            if name == "Brute Force" and length > 1000:
-                print(f"{name:<15} | {length:<8} | {'SKIPPED':<10} | {'-':<10}")
-                continue
-                
-            time_taken, peak_memory = benchmark_algorithm(algo, name, input_str)
-            
-            if time_taken is not None:
-                print(f"{name:<15} | {length:<8} | {time_taken:<10.4f} | {peak_memory:<10.2f}")
-            else:
-                print(f"{name:<15} | {length:<8} | {'ERROR':<10} | {'ERROR':<10}")
-        print("-" * 55)
+        algo(input_str)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+def fit_exponent(points):
+    """Hệ số k của time ~ c * n^k, bình phương tối thiểu trên log-log. None nếu < 2 điểm."""
+    points = [(n, t) for n, t in points if n > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    if sxx == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sxx
+
+def run_suite(lengths, families=None, engines=None, repeats=7, warmup=1, memory=True, seed=0, log=print):
+    """Chạy mọi (thuật toán, họ đầu vào, độ dài) và trả về kết quả dạng dict (ghi được ra JSON)."""
+    families = families or list(FAMILIES)
+    engines = [e for e in ENGINES if engines is None or e[0] in engines]
+    results = []
+    log(f"{'Algorithm':<14} | {'Input':<10} | {'Length':>8} | {'Median ms':>10} | {'95% CI ms':>19} | {'p95 ms':>10} | {'Peak KB':>9}")
+    log("-" * 96)
+    for family in families:
+        for length in lengths:
+            random.seed(seed)  # Mọi lần chạy (và baseline) dùng cùng một đầu vào
+            input_str = FAMILIES[family](length)
+            for name, engine, max_length in engines:
+                if length > max_length:
+                    continue
+                algo = functools.partial(solve, engine=engine)
+                entry = {"engine": name, "family": family, "length": length}
+                entry.update(summarize(time_runs(algo, input_str, warmup, repeats)))
+                measure = memory and entry["median_ms"] <= MEMORY_PASS_MAX_SECONDS * 1000
+                entry["peak_kb"] = peak_memory_kb(algo, input_str) if measure else None
+                results.append(entry)
+                ci = f"{entry['ci_ms'][0]:.3f}-{entry['ci_ms'][1]:.3f}"
+                peak = f"{entry['peak_kb']:.1f}" if measure else "-"
+                log(f"{name:<14} | {family:<10} | {length:>8} | {entry['median_ms']:>10.3f} | {ci:>19} | {entry['p95_ms']:>10.3f} | {peak:>9}")
+        log("-" * 96)
+
+    exponents = {}
+    for name, _, _ in engines:
+        for family in families:
+            points = [(r["length"], r["median_ms"]) for r in results if r["engine"] == name and r["family"] == family]
+            k = fit_exponent(points)
+            if k is not None:
+                exponents.setdefault(name, {})[family] = round(k, 3)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "lengths": list(lengths),
+            "seed": seed,
+        },
+        "results": results,
+        "exponents": exponents,
+    }
+
+def compare_to_baseline(current, baseline, tolerance=0.25):
+    """Các phép đo chậm hơn baseline: cận dưới CI hiện tại vượt cận trên CI cũ quá `tolerance`."""
+    previous = {(r["engine"], r["family"], r["length"]): r for r in baseline["results"]}
+    regressions = []
+    for r in current["results"]:
+        old = previous.get((r["engine"], r["family"], r["length"]))
+        if old is None:
+            continue
+        if r["ci_ms"][0] > old["ci_ms"][1] * (1 + tolerance):
+            regressions.append({
+                "engine": r["engine"], "family": r["family"], "length": r["length"],
+                "baseline_ms": old["median_ms"], "median_ms": r["median_ms"],
+                "ratio": r["median_ms"] / old["median_ms"],
+            })
+    return regressions
+
+def run_parallel_scaling(length=2_000_000, families=("random", "same_char", "ab_repeat", "embedded")):
+    # Đo thời gian của parallel.longest_palindrome_span với 1..N tiến trình, so với Manacher tuần tự;
+    # các họ lặp lại cho thấy chi phí khi bản song song phải quay về Manacher tuần tự
+    max_workers = os.cpu_count() or 1
+    print(f"{'Family':<10} | {'Workers':<8} | {'Length':<9} | {'Time (ms)':<10} | {'Speedup':<8}")
+    print("-" * 58)
+    for family in families:
+        input_str = FAMILIES[family](length)
+        start_time = time.perf_counter()
+        manacher.longest_palindrome_span(input_str)
+        baseline = (time.perf_counter() - start_time) * 1000
+        print(f"{family:<10} | {'serial':<8} | {length:<9} | {baseline:<10.1f} | {1:<8.2f}")
+        workers = 1
+        while True:
+            start_time = time.perf_counter()
+            parallel.longest_palindrome_span(input_str, workers=workers)
+            time_taken = (time.perf_counter() - start_time) * 1000
+            print(f"{family:<10} | {workers:<8} | {length:<9} | {time_taken:<10.1f} | {baseline / time_taken:<8.2f}")
+            if workers == max_workers:
+                break
+            workers = min(workers * 2, max_workers)
+
+def run_sliding_window(length=20_000, widths=(64, 1024), families=("random", "same_char"), budget=2.0):
+    # Cửa sổ trượt: SlidingWindow.push + longest mỗi ký tự, so với tính lại Expand Center trên s[-W:]
+    # (bản tính lại dừng sau `budget` giây; thời gian được tính trung bình trên số ký tự đã chạy)
+    print(f"{'Family':<10} | {'Width':<6} | {'Sliding (us/char)':<18} | {'Recompute (us/char)':<20} | {'Speedup':<8}")
+    print("-" * 75)
+    for family in families:
+        input_str = FAMILIES[family](length)
+        for width in widths:
+            window = SlidingWindow(width)
+            start_time = time.perf_counter()
+            for ch in input_str:
+                window.push(ch)
+                window.longest()
+            sliding = (time.perf_counter() - start_time) / length * 1e6
+            done = 0
+            start_time = time.perf_counter()
+            while done < length and time.perf_counter() - start_time < budget:
+                done += 1
+                expand_center.longest_palindrome(input_str[max(0, done - width):done])
+            recompute = (time.perf_counter() - start_time) / done * 1e6
+            print(f"{family:<10} | {width:<6} | {sliding:<18.1f} | {recompute:<20.1f} | {recompute / sliding:<8.2f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the longest palindromic substring engines.")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6])
+    parser.add_argument("--quick", action="store_true", help="lengths up to 10^4 only")
+    parser.add_argument("--families", nargs="+", choices=list(FAMILIES))
+    parser.add_argument("--engines", nargs="+", choices=[name for name, _, _ in ENGINES])
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="fail if slower than the results saved in this file")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--parallel", action="store_true", help="only run the multi-process scaling benchmark")
+    parser.add_argument("--sliding", action="store_true", help="only run the sliding-window benchmark")
+    args = parser.parse_args(argv)
+
+    if args.parallel:
+        run_parallel_scaling()
+        return 0
+    if args.sliding:
+        run_sliding_window()
+        return 0
+
+    lengths = [n for n in args.lengths if n <= 10 ** 4] if args.quick else args.lengths
+    report = run_suite(lengths, args.families, args.engines, args.repeats, args.warmup, not args.no_memory)
+    print("Scaling exponents (time ~ n^k):")
+    for name, by_family in report["exponents"].items():
+        print(f"  {name:<14} " + ", ".join(f"{family}={k:.2f}" for family, k in by_family.items()))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_to_baseline(report, json.load(f), args.tolerance)
+        for r in regressions:
+            print(f"REGRESSION {r['engine']} {r['family']} n={r['length']}: "
+                  f"{r['baseline_ms']:.3f} ms -> {r['median_ms']:.3f} ms (x{r['ratio']:.2f})")
+        if regressions:
+            return 1
+    return 0
 
 if __name__ == "__main__":
-    run_benchmarks()
-
-# Algorithm       | Length   | Time (ms)  | Memory (KB)
-# -------------------------------------------------------
-# Brute Force     | 100      | 0.5659     | 0.07      
-# DP              | 100      | 1.1756     | 85.00     
-# Expand Center   | 100      | 0.0589     | 0.04      
-# Manacher        | 100      | 0.0906     | 2.03      
-# -------------------------------------------------------
-# Brute Force     | 500      | 14.1833    | 0.04      
-# DP              | 500      | 23.9610    | 1980.83   
-# Expand Center   | 500      | 0.3078     | 0.04      
-# Manacher        | 500      | 0.5112     | 9.06      
-# -------------------------------------------------------
-# Brute Force     | 1000     | 37.9312    | 0.04      
-# DP              | 1000     | 93.6372    | 7872.08   
-# Expand Center   | 1000     | 0.3515     | 0.04      
-# Manacher        | 1000     | 0.7213     | 17.85     
-# -------------------------------------------------------
-# Brute Force     | 2000     | SKIPPED    | -         
-# DP              | 2000     | 346.4019   | 31371.43  
-# Expand Center   | 2000     | 0.6699     | 0.04      
-# Manacher        | 2000     | 1.5313     | 35.43     
-# -------------------------------------------------------
+    sys.exit(main())
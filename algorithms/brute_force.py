@@ -16,6 +16,36 @@ def longest_palindrome(s, trace = False):
     if n < 1:
         return "", {}
 
+    start, maxLen = longest_palindrome_span(s)
+    return s[start:start + maxLen], {}
+
+# Như check_palindrome nhưng cộng số phép so sánh ký tự vào counters["comparisons"]
+def _counting_check(counters):
+    def check(s, low, high):
+        compared = 0
+        while low < high:
+            compared += 1
+            if s[low] != s[high]:
+                counters["comparisons"] = counters.get("comparisons", 0) + compared
+                return False
+            low += 1
+            high -= 1
+        counters["comparisons"] = counters.get("comparisons", 0) + compared
+        return True
+    return check
+
+# Trả về (start, length) của chuỗi đối xứng dài nhất
+# counters (dict): nếu có, được cộng thêm số chuỗi con đã kiểm tra và số phép so sánh ký tự
+def longest_palindrome_span(s, counters=None):
+    n = len(s)
+    check = check_palindrome
+    if counters is not None:
+        check = _counting_check(counters)
+        counters["substrings"] = counters.get("substrings", 0) + n * (n + 1) // 2
+        counters.setdefault("comparisons", 0)
+    if n < 1:
+        return 0, 0
+
     # Tất cả chuỗi con dài 1 ký tự đều là chuỗi đối xứng
     maxLen = 1
     start = 0
@@ -26,11 +56,11 @@ def longest_palindrome(s, trace = False):
             
             # Kiểm tra nếu chuỗi con s[i..j] là chuỗi đối xứng
             # Và kiểm tra nếu độ dài của nó lớn hơn maxLen hiện tại
-            if check_palindrome(s, i, j) and (j - i + 1) > maxLen:
+            if check(s, i, j) and (j - i + 1) > maxLen:
                 start = i
                 maxLen = j - i + 1
                 
-    return s[start:start + maxLen], {}
+    return start, maxLen
 
 # Ví dụ sử dụng
 if __name__ == "__main__":
@@ -0,0 +1,22 @@
+# Helpers for running the engines directly on binary buffers
+# bytes, bytearray, memoryview and mmap.mmap are scanned in place through a
+# memoryview, so a large file can be searched without decoding or copying it.
+
+# 1-D buffers of these item types are compared item by item (e.g. array('I')
+# of comparison keys from normalize.py); anything else is compared byte-wise
+INTEGER_FORMATS = frozenset('bBhHiIlLqQ')
+
+def as_sequence(s):
+    """Return s unchanged for str, otherwise a flat memoryview over it.
+
+    The view is over bytes, unless s is a 1-D integer array (e.g. array('I')),
+    whose items are kept. Slicing the returned view is zero-copy; the slice
+    keeps the buffer exported, so release it before closing an mmap it was
+    taken from.
+    """
+    if isinstance(s, str):
+        return s
+    view = memoryview(s)
+    if view.ndim != 1 or view.format not in INTEGER_FORMATS:
+        view = view.cast('B')
+    return view
@@ -0,0 +1,178 @@
+# Bulk mode: chuỗi đối xứng dài nhất của từng dòng trong các file văn bản / JSONL rất lớn
+# (giao diện dòng lệnh: python -m algorithms, xem __main__.py)
+# Tiến trình chính chỉ đọc các khối byte lớn (cắt tại ký tự xuống dòng) và ghi kết quả;
+# giải mã, tính toán và mã hoá JSON đều chạy trong ProcessPoolExecutor. Số khối đang xử lý
+# bị giới hạn (IN_FLIGHT_PER_WORKER mỗi tiến trình), nên bộ nhớ không phụ thuộc kích thước file.
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import batch
+from registry import AUTO_SHORT_LEN, solve
+
+CHUNK_BYTES = 4 << 20
+IN_FLIGHT_PER_WORKER = 2
+PROGRESS_INTERVAL = 1.0  # Giây giữa hai dòng tiến độ
+
+
+def read_chunks(stream, chunk_bytes=CHUNK_BYTES):
+    """Sinh các khối bytes chỉ gồm dòng hoàn chỉnh (trừ khối cuối nếu file không kết thúc bằng '\\n').
+    Một dòng dài hơn chunk_bytes được gom lại cho tới khi gặp '\\n'."""
+    # Các mảnh chưa có '\n' chỉ được nối một lần khi dòng kết thúc (tránh nối lại O(n²) với dòng rất dài)
+    pieces = []
+    while True:
+        block = stream.read(chunk_bytes)
+        if not block:
+            break
+        cut = block.rfind(b"\n") + 1
+        if cut == 0:
+            pieces.append(block)
+            continue
+        pieces.append(block[:cut])
+        yield b"".join(pieces) if len(pieces) > 1 else pieces[0]
+        pieces = [block[cut:]] if cut < len(block) else []
+    if pieces:
+        yield b"".join(pieces)
+
+
+def solve_chunk(data, first_index, engine="auto", jsonl=False, field="text"):
+    """Kết quả (một dòng JSON mỗi bản ghi, dạng bytes) và số bản ghi của một khối.
+    Dòng văn bản -> {"index", "start", "length", "palindrome"}; với JSONL, ba trường kết quả
+    được thêm vào chính bản ghi đầu vào (văn bản nằm ở trường `field`)."""
+    lines = data.decode("utf-8", errors="replace").split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    records, texts = [], []
+    for k, line in enumerate(lines):
+        if line.endswith("\r"):
+            line = line[:-1]
+        if jsonl:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                text = record[field]
+                if not isinstance(text, str):
+                    raise TypeError(f"field {field!r} is {type(text).__name__}, not a string")
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"line {first_index + k + 1}: {e!r}") from None
+        else:
+            record, text = {"index": first_index + k}, line
+        records.append(record)
+        texts.append(text)
+
+    if engine == "batch":
+        spans = list(zip(*batch.longest_palindromes(texts))) if texts else []
+    elif engine == "auto":
+        # auto chọn Expand Center cho chuỗi ngắn: chạy chúng cùng lúc bằng batch (cùng kết quả)
+        spans = [None] * len(texts)
+        short = [k for k, text in enumerate(texts) if len(text) <= AUTO_SHORT_LEN]
+        if short:
+            for k, start, length in zip(short, *batch.longest_palindromes([texts[k] for k in short])):
+                spans[k] = (start, length)
+        for k, text in enumerate(texts):
+            if spans[k] is None:
+                result = solve(text)
+                spans[k] = (result.start, result.length)
+    else:
+        spans = [(r.start, r.length) for r in (solve(text, engine) for text in texts)]
+    out = []
+    for record, text, (start, length) in zip(records, texts, spans):
+        start, length = int(start), int(length)
+        record["start"], record["length"] = start, length
+        record["palindrome"] = text[start:start + length]
+        out.append(json.dumps(record, ensure_ascii=False))
+    body = ("\n".join(out) + "\n").encode("utf-8") if out else b""
+    return body, len(out)
+
+
+class Progress:
+    # Tiến độ và thông lượng, in ra stderr tối đa mỗi PROGRESS_INTERVAL giây
+    def __init__(self, enabled, stream=None):
+        self.enabled = enabled
+        self.stream = stream or sys.stderr
+        self.records = self.bytes = 0
+        self.start = self.last = time.perf_counter()
+
+    def update(self, records, nbytes):
+        self.records += records
+        self.bytes += nbytes
+        now = time.perf_counter()
+        if self.enabled and now - self.last >= PROGRESS_INTERVAL:
+            self.last = now
+            self.report(now)
+
+    def report(self, now=None):
+        elapsed = max((now or time.perf_counter()) - self.start, 1e-9)
+        mb = self.bytes / (1 << 20)
+        print(f"{self.records:,} records, {mb:,.1f} MB, {elapsed:.1f} s: "
+              f"{self.records / elapsed:,.0f} records/s, {mb / elapsed:,.1f} MB/s", file=self.stream)
+
+
+def run(inputs, output, engine="auto", jsonl=False, field="text", workers=1,
+        chunk_bytes=CHUNK_BYTES, ordered=True, progress=None):
+    """Xử lý các stream nhị phân `inputs` lần lượt, ghi JSONL vào stream nhị phân `output`.
+    ordered=False ghi mỗi khối ngay khi xong (các dòng vẫn có "index"). Trả về Progress."""
+    progress = progress or Progress(False)
+
+    def chunks():
+        index = 0
+        for stream in inputs:
+            data = b""
+            for data in read_chunks(stream, chunk_bytes):
+                yield data, index
+                index += data.count(b"\n")
+            # Dòng cuối không có '\n' vẫn là một bản ghi
+            if data and not data.endswith(b"\n"):
+                index += 1
+
+    def write(result, nbytes):
+        body, count = result
+        output.write(body)
+        progress.update(count, nbytes)
+
+    if workers <= 1:
+        for data, first in chunks():
+            write(solve_chunk(data, first, engine, jsonl, field), len(data))
+        return progress
+
+    limit = workers * IN_FLIGHT_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque() if ordered else set()
+
+        def drain(everything=False):
+            if ordered:
+                while pending and (everything or len(pending) >= limit):
+                    future, nbytes = pending.popleft()
+                    write(future.result(), nbytes)
+            else:
+                while pending and (everything or len(pending) >= limit):
+                    done, _ = wait({future for future, _ in pending}, return_when=FIRST_COMPLETED)
+                    for item in [item for item in pending if item[0] in done]:
+                        pending.remove(item)
+                        write(item[0].result(), item[1])
+
+        try:
+            for data, first in chunks():
+                drain()
+                item = (pool.submit(solve_chunk, data, first, engine, jsonl, field), len(data))
+                if ordered:
+                    pending.append(item)
+                else:
+                    pending.add(item)
+            drain(everything=True)
+        except BaseException:
+            # Lỗi của một khối (ValueError từ worker) dừng ngay, không chờ các khối còn lại
+            pool.shutdown(cancel_futures=True)
+            raise
+    return progress
+
+
+# Ví dụ sử dụng
+if __name__ == "__main__":
+    import io
+    out = io.BytesIO()
+    run([io.BytesIO("babad\ncbbd\nracecarXYZ\n日本語本日".encode("utf-8"))], out)
+    print(out.getvalue().decode("utf-8"))
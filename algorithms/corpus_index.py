@@ -0,0 +1,174 @@
+# CorpusIndex: chuỗi đối xứng lặp lại và chung giữa nhiều văn bản
+# T = d0 + sep0 + d1 + sep1 + ... (mỗi sep là một mã âm riêng, nên không tiền tố chung nào vượt qua nó).
+# Mảng hậu tố + LCP của T (lce.suffix_array, lce.lcp_array) và bán kính Manacher của từng văn bản.
+# Với độ dài L cố định, các hậu tố có cùng L ký tự đầu nằm liền nhau trong mảng hậu tố: khối mới bắt
+# đầu khi lcp[r] < L. Mỗi tâm có P[k] >= L (cùng tính chẵn lẻ) cho một chuỗi đối xứng độ dài L, và
+# mọi lần xuất hiện của nó là khối chứa vị trí bắt đầu đó. Cắt hai đầu một chuỗi đối xứng vẫn được chuỗi
+# đối xứng xuất hiện ít nhất chừng đó lần / trong chừng đó văn bản, nên có thể tìm nhị phân L theo
+# từng tính chẵn lẻ; mỗi lần kiểm tra là vài phép NumPy O(m), tổng cộng O(m log m) sau khi dựng chỉ mục.
+#   - longest_repeated(k): chuỗi đối xứng dài nhất xuất hiện >= k lần (tính cả các lần chồng nhau)
+#   - longest_common(k): chuỗi đối xứng dài nhất có mặt trong >= k văn bản (mặc định: tất cả)
+# save/load lưu mọi mảng dưới dạng số nguyên little-endian; load dùng np.memmap nên không đọc cả file.
+import struct
+from array import array
+
+import numpy as np
+
+from lce import lcp_array, suffix_array
+from manacher import manacher_radii
+
+MAGIC = b'LPSC'
+VERSION = 1
+_HEADER = struct.Struct('<4sBxxxQQ')  # magic, version, padding, len(T), số văn bản
+
+
+def _codes(doc):
+    if isinstance(doc, str):
+        return np.frombuffer(doc.encode('utf-32-le'), dtype='<u4').astype(np.int32)
+    return np.frombuffer(memoryview(doc).cast('B'), dtype=np.uint8).astype(np.int32)
+
+
+class CorpusIndex:
+    def __init__(self, documents=None, arrays=None):
+        if arrays is not None:
+            self.offsets, self.codes, self.sa, self.rank, self.lcp, self.P = arrays
+            self._prev = None
+            return
+        documents = list(documents)
+        parts, offsets = [], [0]
+        for d, doc in enumerate(documents):
+            parts += [_codes(doc), [-1 - d]]
+            offsets.append(offsets[-1] + len(parts[-2]) + 1)
+        # offsets[d] = vị trí của văn bản d trong T
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.codes = np.concatenate(parts).astype(np.int32) if parts else np.zeros(0, dtype=np.int32)
+        sa, rank = suffix_array(self.codes)
+        self.sa, self.rank = sa.astype(np.int32), rank.astype(np.int32)
+        self.lcp = np.asarray(lcp_array(self.codes, sa, rank), dtype=np.int32)
+        # P[2 * offsets[d] + k] = bán kính tâm k của văn bản d; tâm tại các sep giữ 0
+        P = array('i', bytes(4 * (2 * len(self.codes) + 1)))
+        view = memoryview(P)
+        for d, doc in enumerate(documents):
+            lo = 2 * int(self.offsets[d])
+            manacher_radii(doc, out=view[lo:lo + 2 * len(doc) + 1])
+        view.release()
+        self.P = np.frombuffer(P, dtype=np.int32)
+        self._prev = None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def _doc_of(self, positions):
+        return np.searchsorted(self.offsets, positions, side='right') - 1
+
+    def _starts(self, length):
+        # Vị trí bắt đầu (trong T) của mọi chuỗi đối xứng độ dài `length` nằm giữa một tâm
+        centers = np.flatnonzero(self.P >= length)
+        centers = centers[centers % 2 == length % 2]
+        return (centers - length) // 2
+
+    def _blocks(self, length):
+        # blocks[r] = số thứ tự khối của hậu tố hạng r (cùng `length` ký tự đầu)
+        return np.cumsum(self.lcp < length) - 1
+
+    def _repeated(self, length, k):
+        starts = self._starts(length)
+        blocks = self._blocks(length)
+        sizes = np.bincount(blocks)
+        found = starts[sizes[blocks[self.rank[starts]]] >= k]
+        return found[0] if len(found) else None
+
+    def _previous_same_doc(self):
+        # prev[r] = hạng lớn nhất < r của một hậu tố cùng văn bản (-1 nếu không có); không phụ thuộc L
+        if self._prev is None:
+            docs = self._doc_of(self.sa)
+            order = np.argsort(docs, kind='stable')
+            prev = np.full(len(docs), -1, dtype=np.int64)
+            same = docs[order[1:]] == docs[order[:-1]]
+            prev[order[1:][same]] = order[:-1][same]
+            self._prev = prev
+        return self._prev
+
+    def _common(self, length, k):
+        starts = self._starts(length)
+        blocks = self._blocks(length)
+        # Một hậu tố là lần đầu văn bản của nó có mặt trong khối nếu hậu tố trước cùng văn bản thuộc khối khác
+        # (sep nằm trong khối riêng của nó nên không bị đếm nhầm)
+        prev = self._previous_same_doc()
+        first = (prev < 0) | (blocks[prev] != blocks)
+        docs = np.bincount(blocks, weights=first)
+        found = starts[docs[blocks[self.rank[starts]]] >= k]
+        return found[0] if len(found) else None
+
+    def _longest(self, test, k):
+        # Tìm nhị phân độ dài lớn nhất thoả test, riêng cho độ dài lẻ và độ dài chẵn
+        best, start = 0, None
+        top = int(self.P.max()) if len(self.P) else 0
+        for parity in (1, 2):
+            lo, hi = 0, (top - parity) // 2  # Độ dài = parity + 2 * bước
+            if hi < 0 or test(parity, k) is None:
+                continue
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if test(parity + 2 * mid, k) is None:
+                    hi = mid - 1
+                else:
+                    lo = mid
+            length = parity + 2 * lo
+            found = test(length, k)
+            if length > best or (length == best and found < start):
+                best, start = length, found
+        if start is None:
+            return 0, 0, 0
+        d = int(self._doc_of(start))
+        return d, int(start - self.offsets[d]), best
+
+    def longest_repeated(self, k=2):
+        """(doc, start, length) của chuỗi đối xứng dài nhất xuất hiện ít nhất k lần trong toàn bộ
+        corpus (các lần xuất hiện có thể chồng nhau). Khi bằng nhau, lấy lần xuất hiện đầu tiên;
+        (0, 0, 0) nếu không có."""
+        return self._longest(self._repeated, max(k, 1))
+
+    def longest_common(self, k=None):
+        """(doc, start, length) của chuỗi đối xứng dài nhất có mặt trong ít nhất k văn bản
+        (mặc định: mọi văn bản); (0, 0, 0) nếu không có."""
+        return self._longest(self._common, len(self) if k is None else max(k, 1))
+
+    def document(self, d):
+        """Văn bản d, dựng lại từ mã ký tự (dùng được cả sau khi load)."""
+        codes = self.codes[self.offsets[d]:self.offsets[d + 1] - 1]
+        return codes.astype('<u4').tobytes().decode('utf-32-le')
+
+    def save(self, path):
+        # Header cố định + offsets (int64) + codes, sa, rank, lcp, P (int32), tất cả little-endian
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(self.codes), len(self)))
+            self.offsets.astype('<i8').tofile(f)
+            for a in (self.codes, self.sa, self.rank, self.lcp, self.P):
+                np.asarray(a).astype('<i4').tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            magic, version, m, docs = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a corpus index file")
+        data = np.memmap(path, dtype=np.uint8, mode='r')
+        pos = _HEADER.size
+        offsets = data[pos:pos + 8 * (docs + 1)].view('<i8')
+        pos += offsets.nbytes
+        arrays = [offsets]
+        for size in (m, m, m, m, 2 * m + 1):
+            arrays.append(data[pos:pos + 4 * size].view('<i4'))
+            pos += 4 * size
+        return cls(arrays=arrays)
+
+
+# Ví dụ sử dụng
+if __name__ == "__main__":
+    docs = ["xxracecaryyabbazz", "abba racecar", "level up, abba!"]
+    index = CorpusIndex(docs)
+    d, start, length = index.longest_common()
+    print(f"Chung cho mọi văn bản: '{docs[d][start:start + length]}'")
+    d, start, length = index.longest_repeated(k=2)
+    print(f"Xuất hiện >= 2 lần: '{docs[d][start:start + length]}'")
@@ -0,0 +1,214 @@
+# Chế độ DNA: chuỗi đối xứng bù ngược (reverse-complement palindrome) trên dữ liệu nén 2 bit
+# Trong sinh học, GAATTC là "đối xứng" vì đọc ngược mạch bù (A<->T, C<->G) cho lại chính nó.
+# Không base nào bù với chính nó nên mọi chuỗi như vậy có độ dài chẵn: chỉ cần Manacher trên
+# các tâm chẵn (giữa hai base), so sánh "bù nhau" thay cho "bằng nhau".
+#   - Mã hóa A=0, C=1, G=2, T=3 => a bù b khi và chỉ khi a ^ b == 3; 4 base mỗi byte (NumPy uint8)
+#   - Base không phải ACGT (N, R, Y, ...) được ghi lại thành các đoạn "gaps"; không chuỗi nào đi qua chúng
+#   - Bán kính chỉ được giữ trong một vòng đệm (ring buffer) cho RING tâm gần nhất, nên bộ nhớ
+#     làm việc là n / 4 byte cho chuỗi nén cộng 1 MB cố định (bộ gen vi khuẩn 5 Mb: khoảng 2.3 MB)
+#   - read_fasta đọc FASTA từ đĩa theo từng khối, không bao giờ giữ toàn bộ văn bản gốc
+import os
+from array import array
+
+import numpy as np
+
+# Số tâm gần nhất còn giữ bán kính (lũy thừa của 2). Tâm đối xứng xa hơn thì mở rộng lại từ đầu:
+# vẫn đúng, nhưng chỉ tuyến tính khi không có chuỗi bù ngược nào dài hơn RING base.
+RING = 1 << 18
+
+_CODES = np.full(256, 4, dtype=np.uint8)
+for _code, _base in enumerate(b"ACGT"):
+    _CODES[_base] = _CODES[_base + 32] = _code  # Chữ hoa và chữ thường
+_LETTERS = np.frombuffer(b"ACGT", dtype=np.uint8)
+
+
+class PackedSequence:
+    def __init__(self, data, length, gaps=()):
+        # data: NumPy uint8, base i nằm ở bit 2 * (i % 4) của byte i // 4
+        self.data = data
+        self.length = length
+        # Các đoạn [start, end) gồm base không phải ACGT, tăng dần và không liền nhau
+        self.gaps = list(gaps)
+
+    @classmethod
+    def from_string(cls, seq):
+        """Nén str hoặc bytes; ký tự ngoài ACGT/acgt trở thành gap."""
+        if isinstance(seq, str):
+            seq = seq.encode('ascii', 'replace')
+        packer = _Packer()
+        packer.feed(seq)
+        return packer.finish()
+
+    def __len__(self):
+        return self.length
+
+    def segments(self):
+        """Sinh (lo, hi) cho các đoạn chỉ gồm ACGT."""
+        pos = 0
+        for lo, hi in self.gaps:
+            if lo > pos:
+                yield pos, lo
+            pos = hi
+        if pos < self.length:
+            yield pos, self.length
+
+    def decode(self, start=0, end=None):
+        """Giải nén seq[start:end] thành str; base trong gap được trả về là 'N'."""
+        end = self.length if end is None else min(end, self.length)
+        if end <= start:
+            return ""
+        index = np.arange(start, end)
+        out = _LETTERS[(self.data[index >> 2] >> ((index & 3) << 1)) & 3]
+        for lo, hi in self.gaps:
+            if lo < end and hi > start:
+                out[max(lo, start) - start:min(hi, end) - start] = ord('N')
+        return out.tobytes().decode('ascii')
+
+
+class _Packer:
+    # Nén dần từng khối: phần dư (< 4 base) được giữ lại cho khối sau
+    def __init__(self):
+        self.data = bytearray()
+        self.length = 0
+        self.gaps = []
+        self._tail = np.empty(0, dtype=np.uint8)
+
+    def feed(self, raw):
+        codes = _CODES[np.frombuffer(raw, dtype=np.uint8)]
+        bad = np.flatnonzero(codes == 4)
+        if len(bad):
+            # Gom các vị trí liên tiếp thành đoạn, nối với đoạn cuối của khối trước nếu liền nhau
+            breaks = np.flatnonzero(np.diff(bad) != 1)
+            starts = bad[np.r_[0, breaks + 1]] + self.length
+            ends = bad[np.r_[breaks, len(bad) - 1]] + self.length + 1
+            for lo, hi in zip(starts.tolist(), ends.tolist()):
+                if self.gaps and self.gaps[-1][1] == lo:
+                    self.gaps[-1] = (self.gaps[-1][0], hi)
+                else:
+                    self.gaps.append((lo, hi))
+            codes[bad] = 0
+        self.length += len(codes)
+        codes = np.concatenate((self._tail, codes))
+        whole = len(codes) & ~3
+        self._pack(codes[:whole])
+        self._tail = codes[whole:]
+
+    def _pack(self, codes):
+        c = codes.reshape(-1, 4)
+        self.data += (c[:, 0] | (c[:, 1] << 2) | (c[:, 2] << 4) | (c[:, 3] << 6)).astype(np.uint8).tobytes()
+
+    def finish(self):
+        if len(self._tail):
+            self._pack(np.concatenate((self._tail, np.zeros(4 - len(self._tail), dtype=np.uint8))))
+            self._tail = self._tail[:0]
+        return PackedSequence(np.frombuffer(self.data, dtype=np.uint8), self.length, self.gaps)
+
+
+def pack(seq):
+    """PackedSequence của seq (str, bytes hoặc PackedSequence có sẵn)."""
+    return seq if isinstance(seq, PackedSequence) else PackedSequence.from_string(seq)
+
+
+def read_fasta(source, chunk_size=1 << 20):
+    """Sinh (name, PackedSequence) cho từng bản ghi của một file FASTA (đường dẫn hoặc file đã mở).
+
+    Dòng trình tự được gom tới khoảng chunk_size byte rồi nén ngay, nên ngoài chuỗi đã nén
+    (n / 4 byte) chỉ có một khối văn bản gốc nằm trong bộ nhớ. Dòng bắt đầu bằng ';' bị bỏ qua;
+    trình tự trước header đầu tiên thuộc về bản ghi có tên rỗng.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            yield from read_fasta(f, chunk_size)
+        return
+    name, packer = None, None
+    pending, size = [], 0
+    for line in source:
+        if isinstance(line, str):
+            line = line.encode('ascii', 'replace')
+        line = line.strip()
+        if not line or line.startswith(b';'):
+            continue
+        if line.startswith(b'>'):
+            if packer is not None:
+                packer.feed(b''.join(pending))
+                yield name, packer.finish()
+            name, packer = line[1:].strip().decode('utf-8', 'replace'), _Packer()
+            pending, size = [], 0
+            continue
+        if packer is None:
+            name, packer = "", _Packer()
+        pending.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            packer.feed(b''.join(pending))
+            pending, size = [], 0
+    if packer is not None:
+        packer.feed(b''.join(pending))
+        yield name, packer.finish()
+
+
+def _scan(data, lo, hi, H, min_length, improving):
+    # Manacher trên các tâm chẵn c = lo..hi (giữa base c - 1 và c) của đoạn ACGT [lo, hi).
+    # h là nửa độ dài: chuỗi tại tâm c là [c - h, c + h). H là vòng đệm bán kính (RING phần tử).
+    ring = len(H)
+    mask = ring - 1
+    C = R = lo  # Tâm và biên phải của chuỗi đã biết có biên phải xa nhất
+    for c in range(lo, hi + 1):
+        h = 0
+        if c < R:
+            mirror = 2 * C - c
+            # Chuỗi tại tâm C là bù ngược của chính nó, nên tâm đối xứng cho cận dưới như Manacher thường
+            if c - mirror <= ring:
+                h = R - c
+                m = H[mirror & mask]
+                if m < h:
+                    h = m
+        low, high = c - h - 1, c + h
+        while (low >= lo and high < hi
+               and ((data[low >> 2] >> ((low & 3) << 1)) ^ (data[high >> 2] >> ((high & 3) << 1))) & 3 == 3):
+            low -= 1
+            high += 1
+        h = high - c
+        H[c & mask] = h
+        if c + h > R:
+            C, R = c, c + h
+        if 2 * h >= min_length:
+            yield c - h, 2 * h
+            if improving:
+                min_length = 2 * h + 1
+
+
+def rc_palindromes(seq, min_length=2):
+    """Sinh (start, length) cho chuỗi bù ngược cực đại tại mỗi tâm có length >= min_length, theo thứ tự tâm."""
+    seq = pack(seq)
+    data, H = memoryview(seq.data), array('I', bytes(4 * RING))
+    for lo, hi in seq.segments():
+        yield from _scan(data, lo, hi, H, max(min_length, 2), False)
+
+
+def longest_rc_palindrome(seq):
+    """(start, length) của chuỗi bù ngược dài nhất (trái nhất khi bằng nhau); (0, 0) nếu không có."""
+    seq = pack(seq)
+    data, H = memoryview(seq.data), array('I', bytes(4 * RING))
+    best = (0, 0)
+    for lo, hi in seq.segments():
+        # Chỉ nhận chuỗi dài hơn kết quả hiện tại; kết quả cuối cùng được sinh ra là dài nhất
+        for best in _scan(data, lo, hi, H, max(best[1] + 1, 2), True):
+            pass
+    return best
+
+
+def reverse_complement(seq):
+    """Mạch bù ngược của một chuỗi ACGT (dùng để kiểm tra)."""
+    return seq[::-1].translate(str.maketrans("ACGTacgt", "TGCAtgca"))
+
+
+# Ví dụ sử dụng
+if __name__ == "__main__":
+    text = "TTGAATTCAANNGGATCC"
+    seq = pack(text)
+    print("Nén:", len(text), "base ->", seq.data.nbytes, "byte, gaps", seq.gaps)
+    for start, length in rc_palindromes(seq, 4):
+        print(f"  {start}: {seq.decode(start, start + length)}")
+    start, length = longest_rc_palindrome(seq)
+    print(f"Dài nhất: '{seq.decode(start, start + length)}'")
@@ -0,0 +1,81 @@
+# Bit-parallel Dynamic Programming for Longest Palindromic Substring
+# Thay vì bảng n x n, mỗi đường chéo của bảng dp (mọi chuỗi con cùng độ dài L) là một số nguyên Python:
+#   bit i của D[L] = 1 nếu s[i:i+L] là chuỗi đối xứng
+#   D[L] = (D[L-2] >> 1) & E[L-1], với bit i của E[k] = 1 nếu s[i] == s[i+k]
+# Cả đường chéo được cập nhật bằng vài phép AND/XOR/dịch bit (O(n / 64) từ máy) và chỉ giữ
+# hai đường chéo gần nhất => bộ nhớ O(n log σ) bit thay vì n^2 giá trị bool.
+
+def _bitplanes(s):
+    # Mã hóa mỗi ký tự bằng thứ hạng của nó, mặt phẳng b chứa bit b của mọi mã (bit i <-> s[i])
+    ranks = {}
+    codes = [ranks.setdefault(ch, len(ranks)) for ch in s]
+    planes = []
+    for b in range(max(1, (len(ranks) - 1).bit_length())):
+        planes.append(int(''.join('1' if code >> b & 1 else '0' for code in reversed(codes)), 2))
+    return planes
+
+def diagonals(s, start=None):
+    """Sinh (L, D) cho L = 1, 2, ...: D là bitmask các vị trí bắt đầu chuỗi đối xứng độ dài L.
+    Dừng khi hai đường chéo liên tiếp đều rỗng (không thể còn chuỗi đối xứng dài hơn).
+    start=(L, D[L-2], D[L-1]) tiếp tục từ đường chéo L thay vì bắt đầu lại từ 1."""
+    n = len(s)
+    if n == 0:
+        return
+    planes = _bitplanes(s)
+    full = (1 << n) - 1
+    if start is None or start[0] == 1:
+        older, old = (1 << (n + 1)) - 1, full  # D[0] (chuỗi rỗng) và D[1]
+        yield 1, old
+        first = 2
+    else:
+        first, older, old = start
+    for length in range(first, n + 1):
+        k = length - 1
+        # s[i] != s[i+k] khi có ít nhất một mặt phẳng bit khác nhau
+        diff = 0
+        for plane in planes:
+            diff |= plane ^ (plane >> k)
+        D = (older >> 1) & ~diff & (full >> k)
+        yield length, D
+        if not D and not old:
+            return
+        older, old = old, D
+
+def set_bits(mask):
+    # Chỉ số các bit 1 của mask, tăng dần
+    bits = bin(mask)[:1:-1]
+    return [i for i, bit in enumerate(bits) if bit == '1']
+
+def longest_palindrome_span(s, trace=False, counters=None):
+    """(start, length) của chuỗi đối xứng dài nhất (trái nhất khi bằng nhau, giống dynamic_programming).
+    Với trace=True trả về thêm danh sách sự kiện: mỗi đường chéo một sự kiện chứa các ô True.
+    counters (dict): nếu có, được cộng thêm số đường chéo và số ô dp đã tính (mỗi bit là một ô)."""
+    start, best = 0, 0
+    steps = []
+    length = 0
+    for length, D in diagonals(s):
+        if trace:
+            steps.append({"event": "dp-diagonal", "length": length, "cells": set_bits(D)})
+        if D:
+            start, best = (D & -D).bit_length() - 1, length
+    if counters is not None:
+        # Đường chéo L có n - L + 1 ô
+        n = len(s)
+        counters["diagonals"] = counters.get("diagonals", 0) + length
+        counters["cells"] = counters.get("cells", 0) + length * (2 * n - length + 1) // 2
+    return ((start, best), steps) if trace else (start, best)
+
+def longest_palindrome(s, trace=False):
+    if trace:
+        (start, length), steps = longest_palindrome_span(s, trace=True)
+        return s[start:start + length], {"steps": steps}
+    start, length = longest_palindrome_span(s)
+    return s[start:start + length]
+
+# Ví dụ sử dụng
+if __name__ == "__main__":
+    input_str = "日本語本日"
+    result, meta = longest_palindrome(input_str, trace=True)
+    print(f"Chuỗi con đối xứng dài nhất trong '{input_str}' là: '{result}'")
+    for event in meta["steps"]:
+        print(f"Độ dài {event['length']}: các vị trí bắt đầu {event['cells']}")
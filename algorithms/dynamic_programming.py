@@ -1,8 +1,20 @@
 # Dynamic Programming Algorithm for Longest Palindromic Substring
 def longest_palindrome(s, trace = False):
+    if trace:
+        (start, maxLen), meta = longest_palindrome_span(s, trace)
+        return s[start:start + maxLen], meta
+    start, maxLen = longest_palindrome_span(s)
+    return s[start:start + maxLen]
+
+# Trả về (start, length) của chuỗi đối xứng dài nhất, kèm {"steps": ...} khi trace=True
+# counters (dict): nếu có, được cộng thêm số ô đã điền và số phép so sánh ký tự (cả hai chỉ phụ thuộc n)
+def longest_palindrome_span(s, trace = False, counters = None):
     n = len(s)
+    if counters is not None:
+        counters["cells"] = counters.get("cells", 0) + n * (n + 1) // 2
+        counters["comparisons"] = counters.get("comparisons", 0) + n * (n - 1) // 2
     if n == 0:
-        return ("", {"steps": []}) if trace else ""
+        return ((0, 0), {"steps": []}) if trace else (0, 0)
     # Bảng để lưu trữ thông tin về chuỗi con đối xứng, ban đầu tất cả là False với kích thước n x n
     # dp[i][j] = True nếu s[i..j] là chuỗi đối xứng
     dp = [[False] * n for _ in range(n)]
@@ -55,8 +67,7 @@ def longest_palindrome(s, trace = False):
                 start = i
                 maxLen = length
                     
-    result = s[start:start + maxLen]
-    return (result, {"steps": steps}) if trace else result
+    return ((start, maxLen), {"steps": steps}) if trace else (start, maxLen)
 
 # Ví dụ sử dụng
 if __name__ == "__main__":
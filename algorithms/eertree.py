@@ -0,0 +1,209 @@
+# Eertree (Palindromic Tree) for Longest Palindromic Substring
+# Mỗi nút là một chuỗi đối xứng phân biệt; append(ch) chạy trong O(1) khấu hao.
+# Các nút được lưu trong mảng array('i') thay vì một đối tượng Python cho mỗi nút,
+# nên có thể xử lý chuỗi dài hàng triệu ký tự.
+# Cạnh cũng vậy: mỗi nút có đúng một cạnh đi vào (nút cha + ký tự), nên bảng băm địa chỉ mở
+# `slots` (array('i'), dò tuyến tính) chỉ cần chứa số hiệu nút con; khoá được đọc lại từ
+# parent / label. Khoảng 8-16 byte mỗi cạnh thay vì ~100 byte của một mục dict với khoá int.
+from array import array
+
+# Nút 0: gốc ảo có độ dài -1, nút 1: gốc chuỗi rỗng có độ dài 0
+IMAGINARY, EMPTY = 0, 1
+# Không nút gốc nào là nút con, nên 0 (IMAGINARY) đánh dấu ô trống trong `slots`
+NO_CHILD = IMAGINARY
+# Băm nhân: các bit thấp của node * số lẻ trải đều các nút liên tiếp, code được trộn bằng số lẻ thứ hai
+HASH_NODE, HASH_CODE = 0x9E3779B1, 0x85EBCA77
+
+
+class Eertree:
+    def __init__(self, s=""):
+        self.text = array('I')          # Các code point đã thêm vào
+        self.length = array('i', [-1, 0])   # Độ dài chuỗi đối xứng của mỗi nút
+        self.link = array('i', [IMAGINARY, IMAGINARY])  # Suffix link
+        self.count = array('i', [0, 0])     # Số lần là hậu tố đối xứng dài nhất
+        self.end = array('i', [-1, -1])     # Vị trí kết thúc của lần xuất hiện đầu tiên
+        self.parent = array('i', [IMAGINARY, IMAGINARY])  # Nút cha (cạnh đi vào)
+        self.label = array('I', [0, 0])     # Ký tự của cạnh đi vào
+        self.slots = array('i', bytes(4 * 16))  # Bảng băm cạnh: số hiệu nút con, NO_CHILD = trống
+        self.suffix = array('i')        # Độ dài hậu tố đối xứng dài nhất sau mỗi ký tự
+        self.last = EMPTY               # Nút của hậu tố đối xứng dài nhất hiện tại
+        self.best = EMPTY               # Nút của chuỗi đối xứng dài nhất
+        self._occurrences = None
+        self.extend(s)
+
+    def _find(self, node, pos):
+        # Đi theo suffix link cho tới khi text[pos - len - 1] == text[pos]
+        text, length, link = self.text, self.length, self.link
+        code = text[pos]
+        while True:
+            k = pos - length[node] - 1
+            if k >= 0 and text[k] == code:
+                return node
+            node = link[node]
+
+    def _slot(self, node, code):
+        # Ô của cạnh (node, code): ô chứa nút con đó, hoặc ô trống đầu tiên trên đường dò
+        slots, parent, label = self.slots, self.parent, self.label
+        mask = len(slots) - 1
+        i = (node * HASH_NODE + code * HASH_CODE) & mask
+        while True:
+            child = slots[i]
+            if child == NO_CHILD or (parent[child] == node and label[child] == code):
+                return i
+            i = (i + 1) & mask
+
+    def child(self, node, code):
+        """Nút con của node qua ký tự có code point `code`, hoặc NO_CHILD."""
+        # Cùng phép dò với _slot, viết lại để mỗi bước append chỉ tốn một lời gọi hàm
+        slots, parent, label = self.slots, self.parent, self.label
+        mask = len(slots) - 1
+        i = (node * HASH_NODE + code * HASH_CODE) & mask
+        while True:
+            child = slots[i]
+            if child == NO_CHILD or (parent[child] == node and label[child] == code):
+                return child
+            i = (i + 1) & mask
+
+    def _add_child(self, node, code, child):
+        self.parent.append(node)
+        self.label.append(code)
+        # Giữ hệ số tải <= 1/2; tăng gấp đôi rồi chèn lại mọi cạnh
+        if 2 * (child - 1) > len(self.slots):
+            self.slots = array('i', bytes(8 * len(self.slots)))
+            for other in range(2, child):
+                self.slots[self._slot(self.parent[other], self.label[other])] = other
+        self.slots[self._slot(node, code)] = child
+
+    def append(self, ch):
+        """Thêm một ký tự, trả về độ dài hậu tố đối xứng dài nhất."""
+        code = ord(ch)
+        pos = len(self.text)
+        self.text.append(code)
+        self._occurrences = None
+
+        cur = self._find(self.last, pos)
+        node = self.child(cur, code)
+        if node == NO_CHILD:
+            # Tạo nút mới: len = len(cur) + 2
+            node = len(self.length)
+            new_len = self.length[cur] + 2
+            if new_len == 1:
+                suffix_link = EMPTY
+            else:
+                parent = self._find(self.link[cur], pos)
+                suffix_link = self.child(parent, code)
+            self.length.append(new_len)
+            self.link.append(suffix_link)
+            self.count.append(0)
+            self.end.append(pos)
+            self._add_child(cur, code, node)
+            if new_len > self.length[self.best]:
+                self.best = node
+
+        self.count[node] += 1
+        self.last = node
+        self.suffix.append(self.length[node])
+        return self.length[node]
+
+    def extend(self, s):
+        for ch in s:
+            self.append(ch)
+
+    def __len__(self):
+        return len(self.text)
+
+    @property
+    def distinct_count(self):
+        """Số chuỗi con đối xứng phân biệt (không tính chuỗi rỗng)."""
+        return len(self.length) - 2
+
+    def longest(self):
+        """Trả về (start, length) của chuỗi đối xứng dài nhất."""
+        node = self.best
+        if node == EMPTY:
+            return 0, 0
+        length = self.length[node]
+        return self.end[node] - length + 1, length
+
+    def longest_palindrome(self):
+        start, length = self.longest()
+        return ''.join(map(chr, self.text[start:start + length]))
+
+    def occurrences(self):
+        """Số lần xuất hiện của mỗi nút, cộng dồn dọc theo suffix link."""
+        if self._occurrences is None:
+            occ = array('i', self.count)
+            link = self.link
+            # Nút con luôn được tạo sau suffix link của nó nên duyệt ngược là đủ
+            for node in range(len(occ) - 1, 1, -1):
+                occ[link[node]] += occ[node]
+            self._occurrences = occ
+        return self._occurrences
+
+    def palindromes(self):
+        """Sinh (start, length, occurrences) cho mỗi chuỗi đối xứng phân biệt."""
+        occ = self.occurrences()
+        length, end = self.length, self.end
+        for node in range(2, len(length)):
+            yield end[node] - length[node] + 1, length[node], occ[node]
+
+    def count_of(self, p):
+        """Số lần chuỗi đối xứng p xuất hiện (0 nếu p không phải chuỗi con đối xứng)."""
+        n = len(p)
+        if n == 0:
+            return 0
+        # Đi từ tâm ra ngoài: độ dài lẻ bắt đầu từ gốc ảo, độ dài chẵn từ gốc rỗng
+        node = IMAGINARY if n % 2 else EMPTY
+        for i in range((n - 1) // 2, -1, -1):
+            if p[i] != p[n - 1 - i]:
+                return 0
+            node = self.child(node, ord(p[i]))
+            if node == NO_CHILD:
+                return 0
+        return self.occurrences()[node]
+
+
+class _CountingEertree(Eertree):
+    # Giống Eertree nhưng đếm số phép so sánh ký tự và số bước theo suffix link trong _find;
+    # chỉ dùng khi cần counters nên Eertree thường không phải trả chi phí đếm
+    def __init__(self, s=""):
+        self.comparisons = self.link_steps = 0
+        super().__init__(s)
+
+    def _find(self, node, pos):
+        text, length, link = self.text, self.length, self.link
+        code = text[pos]
+        while True:
+            k = pos - length[node] - 1
+            if k >= 0:
+                self.comparisons += 1
+                if text[k] == code:
+                    return node
+            node = link[node]
+            self.link_steps += 1
+
+
+def longest_palindrome_span(s, counters=None):
+    """(start, length); counters (dict) nếu có được cộng thêm comparisons, link_steps và nodes."""
+    if counters is None:
+        return Eertree(s).longest()
+    tree = _CountingEertree(s)
+    counters["comparisons"] = counters.get("comparisons", 0) + tree.comparisons
+    counters["link_steps"] = counters.get("link_steps", 0) + tree.link_steps
+    counters["nodes"] = counters.get("nodes", 0) + tree.distinct_count
+    return tree.longest()
+
+
+def longest_palindrome(s):
+    start, length = longest_palindrome_span(s)
+    return s[start:start + length]
+
+
+# Ví dụ sử dụng
+if __name__ == "__main__":
+    tree = Eertree()
+    for ch in "abacaba":
+        print(f"append('{ch}') -> hậu tố đối xứng dài nhất: {tree.append(ch)}")
+    print(f"Chuỗi đối xứng dài nhất: '{tree.longest_palindrome()}'")
+    print(f"Số chuỗi đối xứng phân biệt: {tree.distinct_count}")
+    print(f"'aba' xuất hiện {tree.count_of('aba')} lần")
@@ -1,6 +1,21 @@
 # Expand Around Centers Algorithm for Longest Palindromic Substring
+from buffers import as_sequence
+
 def longest_palindrome(s):
+    # str -> str; bytes, bytearray, memoryview, mmap -> zero-copy memoryview slice
+    s = as_sequence(s)
+    start, maxLen = longest_palindrome_span(s)
+    return s[start:start + maxLen]
+
+def longest_palindrome_span(s, counters=None):
+    # Trả về (start, length) của chuỗi đối xứng dài nhất
+    # counters (dict): nếu có, được cộng thêm số phép so sánh ký tự và số bước mở rộng
+    s = as_sequence(s)
     n = len(s)
+    if counters is not None:
+        return _span_counted(s, counters)
+    if n == 0:
+        return 0, 0
     
     start, maxLen = 0, 1 #maxLen = 1 vì tất cả chuỗi con dài 1 ký tự đều là chuỗi đối xứng
     
@@ -20,7 +35,29 @@ def longest_palindrome(s):
                 low -= 1
                 high += 1
                 
-    return s[start:start + maxLen]
+    return start, maxLen
+
+def _span_counted(s, counters):
+    # Cùng vòng lặp như trên nhưng đếm từng phép so sánh; tách riêng để bản thường không tốn chi phí đếm
+    n = len(s)
+    start, maxLen = 0, min(n, 1)
+    comparisons = expansions = 0
+    for i in range(n):
+        for j in range(2):
+            low, high = i, i + j
+            while low >= 0 and high < n:
+                comparisons += 1
+                if s[low] != s[high]:
+                    break
+                expansions += 1
+                if high - low + 1 > maxLen:
+                    start = low
+                    maxLen = high - low + 1
+                low -= 1
+                high += 1
+    counters["comparisons"] = counters.get("comparisons", 0) + comparisons
+    counters["expansions"] = counters.get("expansions", 0) + expansions
+    return start, maxLen
 
 # Test
 if __name__ == "__main__":
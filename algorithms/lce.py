@@ -0,0 +1,147 @@
+# Longest Common Extension (LCE) index và tìm chuỗi đối xứng gần đúng
+# T = s + sep + reverse(s). Mảng hậu tố (nhân đôi tiền tố bằng NumPy) + LCP (Kasai) + sparse table
+# cho phép hỏi LCE(i, j) = độ dài tiền tố chung của T[i:] và T[j:] trong O(1).
+# Ký tự s[p], s[p-1], ... (đọc ngược từ p) chính là T[2n - p:], nên số bước mở rộng ra hai phía
+# của một tâm là một truy vấn LCE; mỗi lỗi (mismatch) được bỏ qua bằng một bước nhảy nữa.
+#   - longest_palindrome_k_mismatch: chuỗi dài nhất mà hai nửa khác nhau ở tối đa k cặp ký tự
+#   - longest_gapped_palindrome: u + v + reverse(u) với khoảng giữa min_gap <= |v| <= max_gap
+# Mỗi tâm tốn O(k + 1) truy vấn LCE thay vì O(n) phép so sánh.
+from array import array
+
+import numpy as np
+
+
+def _codes(s):
+    if isinstance(s, str):
+        return np.frombuffer(s.encode('utf-32-le'), dtype='<u4').astype(np.int64)
+    return np.frombuffer(memoryview(s).cast('B'), dtype=np.uint8).astype(np.int64)
+
+
+def suffix_array(T):
+    """Mảng hậu tố và mảng hạng của dãy số nguyên T (nhân đôi tiền tố, O(m log^2 m))."""
+    m = len(T)
+    rank = np.asarray(T, dtype=np.int64)
+    k = 1
+    while True:
+        # Hậu tố ngắn hơn k đứng trước mọi hậu tố dài hơn cùng tiền tố
+        second = np.full(m, np.iinfo(np.int64).min, dtype=np.int64)
+        second[:m - k] = rank[k:]
+        sa = np.lexsort((second, rank))
+        first, second = rank[sa], second[sa]
+        new_rank = np.empty(m, dtype=np.int64)
+        new_rank[sa] = np.concatenate(([0], np.cumsum((first[1:] != first[:-1]) | (second[1:] != second[:-1]))))
+        rank = new_rank
+        if m == 0 or rank[sa[-1]] == m - 1 or k >= m:
+            return sa, rank
+        k *= 2
+
+
+def lcp_array(T, sa, rank):
+    """lcp[r] = độ dài tiền tố chung của hậu tố sa[r - 1] và sa[r] (Kasai, O(m)); lcp[0] = 0."""
+    T, sa, rank = list(T), sa.tolist(), rank.tolist()
+    m = len(T)
+    lcp = [0] * m
+    h = 0
+    for i in range(m):
+        r = rank[i]
+        if r == 0:
+            h = 0
+            continue
+        j = sa[r - 1]
+        while i + h < m and j + h < m and T[i + h] == T[j + h]:
+            h += 1
+        lcp[r] = h
+        if h:
+            h -= 1
+    return lcp
+
+
+class LCEIndex:
+    def __init__(self, s):
+        codes = _codes(s)
+        self.n = n = len(codes)
+        # Ký tự phân cách -1 không trùng với bất kỳ mã nào nên mọi phần mở rộng dừng tại biên
+        T = np.concatenate((codes, [-1], codes[::-1]))
+        self.m = len(T)
+        sa, rank = suffix_array(T)
+        self.rank = array('i', rank.astype(np.int32).tobytes())
+        # table[j][r] = min lcp[r .. r + 2^j - 1]
+        level = np.asarray(lcp_array(T, sa, rank), dtype=np.int32)
+        self._table = [array('i', level.tobytes())]
+        half = 1
+        while 2 * half <= self.m:
+            level = np.minimum(level[:-half], level[half:])
+            self._table.append(array('i', level.tobytes()))
+            half *= 2
+
+    def lce(self, i, j):
+        """Độ dài tiền tố chung của T[i:] và T[j:]."""
+        if i == j:
+            return self.m - i
+        a, b = self.rank[i], self.rank[j]
+        if a > b:
+            a, b = b, a
+        # min lcp[a + 1 .. b]
+        j = (b - a).bit_length() - 1
+        level = self._table[j]
+        x, y = level[a + 1], level[b - (1 << j) + 1]
+        return x if x < y else y
+
+    def extend(self, left, right, mismatches=0):
+        """Mở rộng s[left] <-> s[right] ra ngoài (left giảm, right tăng), bỏ qua tối đa `mismatches`
+        cặp khác nhau. Trả về (left, right) đầu tiên không thể mở rộng tiếp: s[left+1:right] là kết quả."""
+        n = self.n
+        while True:
+            if left < 0 or right >= n:
+                return left, right
+            step = self.lce(right, 2 * n - left)
+            left -= step
+            right += step
+            if left < 0 or right >= n or mismatches == 0:
+                return left, right
+            mismatches -= 1
+            left -= 1
+            right += 1
+
+
+def longest_palindrome_k_mismatch(s, k, index=None):
+    """(start, length) của chuỗi con dài nhất có s[start + t] != s[start + length - 1 - t] ở tối đa k cặp
+    (trái nhất khi bằng nhau). k = 0 cho đúng kết quả của Manacher."""
+    index = index or LCEIndex(s)
+    n = index.n
+    best_start, best_len = 0, 0
+    for i in range(n):
+        # Tâm lẻ tại ký tự i, rồi tâm chẵn giữa i - 1 và i
+        for left, right in ((i - 1, i + 1), (i - 1, i)):
+            low, high = index.extend(left, right, k)
+            if high - low - 1 > best_len:
+                best_start, best_len = low + 1, high - low - 1
+    return best_start, best_len
+
+
+def longest_gapped_palindrome(s, max_gap, min_gap=0, mismatches=0, index=None):
+    """(start, arm, gap) của u + v + reverse(u) dài nhất với min_gap <= |v| = gap <= max_gap (u có thể lệch
+    tối đa `mismatches` cặp). Ưu tiên arm dài nhất, rồi gap ngắn nhất, rồi vị trí trái nhất.
+    Chuỗi kết quả là s[start:start + 2 * arm + gap]; (0, 0, 0) nếu không có."""
+    index = index or LCEIndex(s)
+    n = index.n
+    best = (0, 0, 0)
+    for gap in range(min_gap, max_gap + 1):
+        for i in range(1, n - gap):
+            # u kết thúc tại i - 1, reverse(u) bắt đầu tại i + gap
+            low, high = index.extend(i - 1, i + gap, mismatches)
+            arm = i - 1 - low
+            # gap tăng dần rồi i tăng dần, nên chỉ cần so sánh chặt để giữ thứ tự ưu tiên
+            if arm > best[1]:
+                best = (low + 1, arm, gap)
+    return best
+
+
+# Ví dụ sử dụng
+if __name__ == "__main__":
+    text = "xxabcdefdcbaxx"
+    start, length = longest_palindrome_k_mismatch(text, 1)
+    print(f"1 lỗi: '{text[start:start + length]}'")
+    text = "xyzabcQWERcbazz"
+    start, arm, gap = longest_gapped_palindrome(text, 5, min_gap=1)
+    print(f"Có khoảng giữa: '{text[start:start + 2 * arm + gap]}' (arm {arm}, gap {gap})")
@@ -1,5 +1,14 @@
 # Manacher's Algorithm for Longest Palindromic Substring
+import mmap
+from array import array
+from buffers import as_sequence
+
 def longest_palindrome(s):
+    if not isinstance(s, str):
+        # bytes, bytearray, memoryview, mmap -> zero-copy memoryview slice
+        view = as_sequence(s)
+        start, max_len = longest_palindrome_span(view)
+        return view[start:start+max_len]
     def transform(s):
         return '#'.join('^{}$'.format(s))
     T = transform(s) # Transform
@@ -26,3 +35,140 @@ def longest_palindrome(s):
     start = (center_index - max_len) // 2
 
     return s[start:start+max_len]   
+
+def _fill_radii(s, P):
+    # Same scan as longest_palindrome, but over the virtual string '#s0#s1#...#'
+    # without building it: odd positions are characters of s, even positions are
+    # separators, so only character pairs ever need comparing.
+    # P[k] is the length (in characters of s) of the palindrome centered at k.
+    n = len(s)
+    C = 0 # Center
+    R = 0 # Right boundary
+    best, best_center = 0, 0
+    for i in range(2 * n + 1):
+        r = i & 1 # A character center covers at least itself
+        if i < R:
+            r = R - i
+            if P[2*C - i] < r:
+                r = P[2*C - i]
+
+        # Attempt to expand: compare the characters just outside the palindrome
+        low = ((i - r) >> 1) - 1
+        high = (i + r) >> 1
+        while low >= 0 and high < n and s[low] == s[high]:
+            low -= 1
+            high += 1
+        r = high - low - 1
+        P[i] = r
+
+        # Update center and right boundary if needed
+        if i + r > R:
+            C = i
+            R = i + r
+        if r > best:
+            best, best_center = r, i
+    return best, best_center
+
+def _fill_radii_counted(s, P, counters):
+    # _fill_radii with every step counted; kept separate so the plain scan has no counting overhead
+    n = len(s)
+    C = 0
+    R = 0
+    best, best_center = 0, 0
+    comparisons = expansions = mirror_reuses = 0
+    for i in range(2 * n + 1):
+        r = i & 1
+        if i < R:
+            mirror_reuses += 1
+            r = R - i
+            if P[2*C - i] < r:
+                r = P[2*C - i]
+
+        low = ((i - r) >> 1) - 1
+        high = (i + r) >> 1
+        while low >= 0 and high < n:
+            comparisons += 1
+            if s[low] != s[high]:
+                break
+            expansions += 1
+            low -= 1
+            high += 1
+        r = high - low - 1
+        P[i] = r
+
+        if i + r > R:
+            C = i
+            R = i + r
+        if r > best:
+            best, best_center = r, i
+    counters["comparisons"] = counters.get("comparisons", 0) + comparisons
+    counters["expansions"] = counters.get("expansions", 0) + expansions
+    counters["mirror_reuses"] = counters.get("mirror_reuses", 0) + mirror_reuses
+    return best, best_center
+
+def longest_palindrome_span(s, counters=None):
+    """(start, length) of the longest palindrome; accepts str or any byte buffer.
+
+    If `counters` is a dict, the work done by the scan is added to it:
+    - comparisons: character pairs compared
+    - expansions: successful comparisons (each grows a palindrome by 2)
+    - mirror_reuses: centers that started from their mirror's radius
+    """
+    s = as_sequence(s)
+    P = array('i', bytes(4 * (2 * len(s) + 1)))
+    if counters is None:
+        best, center = _fill_radii(s, P)
+    else:
+        best, center = _fill_radii_counted(s, P, counters)
+    return (center - best) // 2, best
+
+def manacher_radii(s, out=None):
+    """Radius array of s as array('i') of length 2*len(s) + 1.
+
+    Palindrome centered at k has length P[k] and starts at (k - P[k]) // 2.
+    `out` may be any writable int buffer of that length (e.g. a memoryview
+    cast to 'i' over an mmap) to keep the radii off the Python heap.
+    """
+    P = array('i', bytes(4 * (2 * len(s) + 1))) if out is None else out
+    _fill_radii(s, P)
+    return P
+
+def _read_chunks(source, chunk_size):
+    if hasattr(source, 'read'):
+        return iter(lambda: source.read(chunk_size), source.read(0))
+    return iter(source)
+
+def longest_palindrome_stream(source, chunk_size=1 << 20, radii_file=None):
+    """Longest palindrome of text read from a file object or an iterable of chunks.
+
+    Chunks may be str or bytes (not mixed); the result has the same type.
+    The separator-transformed string is never built and the radii live in a
+    compact int32 buffer. Pass an open binary file as `radii_file` to back
+    the radii with a memory-mapped file instead of RAM.
+    """
+    chunks = _read_chunks(source, chunk_size)
+    first = next(chunks, None)
+    if first is None:
+        return source.read(0) if hasattr(source, 'read') else ""
+    if isinstance(first, str):
+        text = first + ''.join(chunks)
+    else:
+        text = bytearray(first)
+        for chunk in chunks:
+            text += chunk
+
+    m = 2 * len(text) + 1
+    if radii_file is None:
+        best, center = _fill_radii(text, array('i', bytes(4 * m)))
+    else:
+        radii_file.truncate(4 * m)
+        with mmap.mmap(radii_file.fileno(), 4 * m) as buf:
+            P = memoryview(buf).cast('i')
+            try:
+                best, center = _fill_radii(text, P)
+            finally:
+                P.release()
+
+    start = (center - best) // 2
+    result = text[start:start + best]
+    return result if isinstance(result, str) else bytes(result)
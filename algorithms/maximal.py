@@ -0,0 +1,98 @@
+# Liệt kê chuỗi đối xứng từ mảng bán kính Manacher (một lần quét, sinh kết quả lười)
+# - maximal_palindromes: chuỗi đối xứng cực đại (dài nhất tại mỗi tâm) có độ dài >= min_length
+# - longest_occurrences: mọi vị trí xuất hiện của độ dài lớn nhất
+# - top_k: k chuỗi đối xứng cực đại dài nhất (dài trước, trái trước khi bằng nhau)
+# Tất cả nhận chuỗi s hoặc mảng bán kính có sẵn (manacher_radii, PalindromeIndex.P), và chạy
+# trong O(n + số kết quả). backend="numpy" lọc và sắp xếp bằng NumPy thay cho vòng lặp Python.
+from manacher import manacher_radii
+
+BACKENDS = ("python", "numpy")
+
+
+def _radii(s, radii):
+    # P[k] = độ dài chuỗi đối xứng dài nhất có tâm k trong chuỗi ảo '#s0#s1#...#'
+    return manacher_radii(s) if radii is None else radii
+
+
+def _check_backend(backend):
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}; expected one of {BACKENDS}")
+
+
+def maximal_palindromes(s=None, min_length=1, radii=None, backend="python"):
+    """Sinh (start, length) cho mỗi tâm có chuỗi đối xứng cực đại dài >= min_length, theo thứ tự tâm."""
+    _check_backend(backend)
+    P = _radii(s, radii)
+    min_length = max(min_length, 1)
+    if backend == "numpy":
+        import numpy as np
+        P = np.asarray(P)
+        centers = np.flatnonzero(P >= min_length)
+        lengths = P[centers]
+        starts = (centers - lengths) // 2
+        yield from zip(starts.tolist(), lengths.tolist())
+        return
+    for k, length in enumerate(P):
+        if length >= min_length:
+            yield (k - length) // 2, length
+
+
+def longest_occurrences(s=None, radii=None, backend="python"):
+    """Sinh (start, length) cho mọi lần xuất hiện của chuỗi đối xứng dài nhất, từ trái sang phải."""
+    _check_backend(backend)
+    P = _radii(s, radii)
+    if len(P) < 3:  # Chuỗi rỗng
+        return
+    if backend == "numpy":
+        import numpy as np
+        best = int(np.asarray(P).max())
+    else:
+        best = max(P)
+    # Mỗi tâm cho một vị trí bắt đầu khác nhau, nên không có kết quả trùng lặp
+    yield from maximal_palindromes(min_length=best, radii=P, backend=backend)
+
+
+def top_k(s=None, k=10, radii=None, backend="python"):
+    """Sinh tối đa k cặp (start, length) dài nhất trong các chuỗi đối xứng cực đại."""
+    _check_backend(backend)
+    P = _radii(s, radii)
+    if k <= 0 or len(P) < 3:
+        return
+    if backend == "numpy":
+        import numpy as np
+        P = np.asarray(P)
+        centers = np.flatnonzero(P > 0)
+        if k < len(centers):
+            # Chỉ giữ các tâm có độ dài >= độ dài thứ k, rồi sắp xếp phần nhỏ đó
+            kth = np.partition(P[centers], len(centers) - k)[len(centers) - k]
+            centers = centers[P[centers] >= kth]
+        lengths = P[centers]
+        order = np.lexsort((centers, -lengths))[:k]
+        centers, lengths = centers[order], lengths[order]
+        yield from zip(((centers - lengths) // 2).tolist(), lengths.tolist())
+        return
+    # Sắp xếp đếm theo độ dài: O(n) để dựng, mỗi kết quả sau đó là O(1)
+    n = (len(P) - 1) // 2
+    buckets = [None] * (n + 1)
+    for center in range(len(P) - 1, -1, -1):
+        length = P[center]
+        if length:
+            # Duyệt tâm từ phải sang trái và chèn vào đầu => mỗi bucket theo thứ tự tâm tăng dần
+            buckets[length] = (center, buckets[length])
+    emitted = 0
+    for length in range(n, 0, -1):
+        node = buckets[length]
+        while node is not None:
+            center, node = node
+            yield (center - length) // 2, length
+            emitted += 1
+            if emitted == k:
+                return
+
+
+# Ví dụ sử dụng
+if __name__ == "__main__":
+    text = "abacdcabaxyx"
+    print("Dài nhất:", [text[i:i + L] for i, L in longest_occurrences(text)])
+    print("Top 4:", [text[i:i + L] for i, L in top_k(text, 4)])
+    print("Cực đại, độ dài >= 3:", [text[i:i + L] for i, L in maximal_palindromes(text, 3)])
@@ -0,0 +1,205 @@
+# Chuỗi đối xứng "tự nhiên": bỏ qua hoa/thường, dấu câu và khoảng trắng, có thể theo cụm grapheme
+# normalize(text) tạo trong một lượt:
+#   - keys: mảng số nguyên gọn (array 'B', 'H' hoặc 'I') gồm khoá so sánh của từng đơn vị giữ lại
+#   - offsets: array('I'), offsets[k] là vị trí trong text của đơn vị sinh ra keys[k]
+# Manacher / Expand Center chạy thẳng trên keys (buffers.as_sequence giữ nguyên phần tử số nguyên),
+# rồi kết quả được đổi về đoạn (start, length) của text gốc; không tạo bản sao chuẩn hoá nào của text.
+#   - Đơn vị là một code point, hoặc một cụm grapheme nếu graphemes=True (ký tự gốc + dấu kết hợp,
+#     chuỗi nối ZWJ, emoji modifier, tag, cặp regional indicator: xấp xỉ UAX #29, không có quy tắc
+#     Hangul/Indic). Cụm được so sánh theo NFC(casefold(cụm)), nên "é" dựng sẵn và "e" + U+0301 bằng nhau.
+#   - Mỗi đơn vị có đúng một khoá: casefold sinh nhiều code point ("ß" -> "ss", "ﬃ" -> "ffi") cho một
+#     khoá riêng, như cụm grapheme. Bán kính Manacher vì thế tính theo đơn vị trọn vẹn, kết quả không bao
+#     giờ cắt ngang một ký tự, và "ß" bằng "ẞ" nhưng khác "ss" viết bằng hai chữ s.
+#   - ignore_punctuation bỏ mọi đơn vị có ký tự gốc không phải chữ, số hay dấu kết hợp (L*, N*, M*).
+# Văn bản được xử lý theo khối BLOCK_SIZE ký tự bằng NumPy, với bảng tra theo code point được điền
+# dần (mỗi code point mới chỉ tính một lần), nên thời gian tuyến tính và bộ nhớ tạm bị chặn theo khối.
+# Các bảng tra (~8 MB) được giữ lại giữa các lần gọi, mỗi bộ tuỳ chọn một bảng; khoá của cụm nhiều
+# code point chỉ có hiệu lực trong một lần gọi normalize, nên bộ nhớ không tăng theo số lần gọi.
+import unicodedata
+from array import array
+from functools import lru_cache
+
+import numpy as np
+
+import expand_center
+import manacher
+
+BLOCK_SIZE = 1 << 20
+UNICODE_SIZE = 0x110000
+ZWJ = 0x200D
+CLUSTER_BASE = 2 * UNICODE_SIZE  # Khoá của cụm trong một lần gọi; khoá cố định của code point nằm dưới mức này
+ENGINES = {
+    "manacher": manacher.longest_palindrome_span,
+    "expand_center": expand_center.longest_palindrome_span,
+}
+
+
+def _extends(ch):
+    # Ký tự nối vào cụm grapheme phía trước (dấu kết hợp, ZWJ, emoji modifier, tag)
+    cp = ord(ch)
+    return (unicodedata.category(ch).startswith('M') or cp == ZWJ
+            or 0x1F3FB <= cp <= 0x1F3FF or 0xE0020 <= cp <= 0xE007F)
+
+
+def _is_regional(cp):
+    return 0x1F1E6 <= cp <= 0x1F1FF
+
+
+def _cluster_end(text, i):
+    # Vị trí sau cụm grapheme bắt đầu tại i (bản vô hướng của quy tắc trong _Tables.boundaries)
+    n = len(text)
+    j = i + 1
+    if j < n and _is_regional(ord(text[i])) and _is_regional(ord(text[j])):
+        j += 1
+    while j < n and (_extends(text[j]) or ord(text[j - 1]) == ZWJ):
+        j += 1
+    return j
+
+
+class _Tables:
+    # Bảng tra theo code point, chỉ điền cho các code point đã gặp
+    def __init__(self, casefold, ignore_punctuation, graphemes):
+        self.casefold = casefold
+        self.ignore_punctuation = ignore_punctuation
+        self.graphemes = graphemes
+        self.known = np.zeros(UNICODE_SIZE, dtype=bool)
+        self.keep = np.zeros(UNICODE_SIZE, dtype=bool)      # False = bỏ qua
+        self.key = np.zeros(UNICODE_SIZE, dtype=np.uint32)
+        self.extend = np.zeros(UNICODE_SIZE, dtype=bool)
+        # Chuỗi so sánh nhiều code point của một code point -> khoá (>= UNICODE_SIZE); bị chặn bởi
+        # số code point có casefold mở rộng, nên dùng chung giữa các lần gọi được
+        self.interned = {}
+
+    def fold(self, unit):
+        if not self.graphemes:
+            return unit.casefold() if self.casefold else unit
+        return unicodedata.normalize('NFC', unit.casefold() if self.casefold else unit)
+
+    def unit_key(self, folded, clusters=None):
+        # Một code point -> chính nó; nhiều code point -> khoá cố định nếu đã là khoá của một code point,
+        # nếu không thì khoá riêng trong `clusters` (từ điển của lần gọi normalize hiện tại)
+        if len(folded) == 1:
+            return ord(folded)
+        key = self.interned.get(folded)
+        if key is not None:
+            return key
+        if clusters is None:
+            return self.interned.setdefault(folded, UNICODE_SIZE + len(self.interned))
+        return clusters.setdefault(folded, CLUSTER_BASE + len(clusters))
+
+    def learn(self, codes):
+        new = np.unique(codes[~self.known[codes]])
+        for cp in new.tolist():
+            ch = chr(cp)
+            self.extend[cp] = _extends(ch)
+            if self.ignore_punctuation and unicodedata.category(ch)[0] not in 'LNM':
+                continue
+            self.keep[cp], self.key[cp] = True, self.unit_key(self.fold(ch))
+        self.known[new] = True
+
+    def boundaries(self, codes):
+        # cont[i]: ký tự i thuộc cùng cụm với ký tự i - 1
+        cont = self.extend[codes]
+        cont[1:] |= codes[:-1] == ZWJ
+        regional = (codes >= 0x1F1E6) & (codes <= 0x1F1FF)
+        if regional.any():
+            idx = np.arange(len(codes))
+            first = regional.copy()
+            first[1:] &= ~regional[:-1]
+            run_start = np.maximum.accumulate(np.where(first, idx, 0))
+            cont |= regional & ((idx - run_start) % 2 == 1)
+        cont[0] = False
+        return np.flatnonzero(~cont)
+
+
+@lru_cache(maxsize=8)
+def _tables(casefold, ignore_punctuation, graphemes):
+    # Các bảng chỉ chứa khoá cố định theo code point, nên dùng chung giữa các lần gọi được
+    return _Tables(casefold, ignore_punctuation, graphemes)
+
+
+class Normalized:
+    """keys / offsets của text (xem đầu file); span(start, length) đổi kết quả về text gốc."""
+
+    def __init__(self, text, keys, offsets, graphemes):
+        self.text, self.keys, self.offsets, self.graphemes = text, keys, offsets, graphemes
+
+    def __len__(self):
+        return len(self.keys)
+
+    def span(self, start, length):
+        """(start, length) trong text gốc của keys[start:start + length]."""
+        if length == 0:
+            return 0, 0
+        first, last = self.offsets[start], self.offsets[start + length - 1]
+        end = _cluster_end(self.text, last) if self.graphemes else last + 1
+        return first, end - first
+
+
+def _append(keys, block_keys):
+    # Chuyển keys sang kiểu lớn hơn khi cần, để mảng luôn gọn nhất có thể
+    if len(block_keys) and block_keys.max() >= 1 << (8 * keys.itemsize):
+        code = 'H' if block_keys.max() < 1 << 16 else 'I'
+        keys = array(code, keys)
+    keys.frombytes(block_keys.astype(np.dtype(keys.typecode)).tobytes())
+    return keys
+
+
+def normalize(text, casefold=True, ignore_punctuation=True, graphemes=False, block_size=BLOCK_SIZE):
+    tables = _tables(casefold, ignore_punctuation, graphemes)
+    keys, offsets = array('B'), array('I')
+    clusters = {}
+    pos, n = 0, len(text)
+    size = block_size
+    while pos < n:
+        block = text[pos:pos + size]
+        codes = np.frombuffer(block.encode('utf-32-le'), dtype='<u4')
+        tables.learn(codes)
+        if graphemes:
+            starts = tables.boundaries(codes)
+            # Cụm cuối có thể còn tiếp ở khối sau: để nó lại; cả khối là một cụm thì đọc khối lớn hơn
+            if pos + len(block) < n:
+                if len(starts) == 1:
+                    size *= 2
+                    continue
+                codes = codes[:starts[-1]]
+                starts = starts[:-1]
+            size = block_size
+            ends = np.append(starts[1:], len(codes))
+            base = codes[starts]
+            block_keys = tables.key[base].astype(np.uint32)
+            keep = tables.keep[base]
+            # Cụm nhiều code point: khoá theo chuỗi so sánh của cả cụm
+            for k in np.flatnonzero(keep & (ends - starts > 1)).tolist():
+                unit = block[starts[k]:ends[k]]
+                block_keys[k] = tables.unit_key(tables.fold(unit), clusters)
+            block_offsets = starts[keep] + pos
+            block_keys = block_keys[keep]
+            pos += len(codes)
+        else:
+            keep = tables.keep[codes]
+            block_offsets = np.flatnonzero(keep) + pos
+            block_keys = tables.key[codes][keep]
+            pos += len(codes)
+        keys = _append(keys, block_keys)
+        offsets.frombytes(block_offsets.astype(np.uint32).tobytes())
+    return Normalized(text, keys, offsets, graphemes)
+
+
+def longest_palindrome_span(text, engine="manacher", casefold=True, ignore_punctuation=True, graphemes=False):
+    """(start, length) trong text của chuỗi đối xứng dài nhất sau khi chuẩn hoá."""
+    normalized = normalize(text, casefold, ignore_punctuation, graphemes)
+    if not len(normalized):
+        return 0, 0
+    return normalized.span(*ENGINES[engine](normalized.keys))
+
+
+def longest_palindrome(text, engine="manacher", **options):
+    start, length = longest_palindrome_span(text, engine, **options)
+    return text[start:start + length]
+
+
+# Ví dụ sử dụng
+if __name__ == "__main__":
+    for s in ["A man, a plan, a canal: Panama!", "Was it a car or a cat I saw?", "Straße: eẞarts", "xe\u0301te\u0301y"]:
+        print(f"'{s}' -> '{longest_palindrome(s)}' / graphemes: '{longest_palindrome(s, graphemes=True)}'")
@@ -0,0 +1,100 @@
+# PalindromeIndex: precompute Manacher radii once, answer range queries fast
+# - is_palindrome(i, j): s[i:j] có phải chuỗi đối xứng không, O(1)
+# - longest_in_range(l, r): chuỗi đối xứng dài nhất nằm trong s[l:r], O(log n)
+#   bằng sparse table (chỉ số của giá trị lớn nhất) trên mảng bán kính.
+import struct
+import sys
+from array import array
+
+from manacher import manacher_radii
+
+MAGIC = b'LPSI'
+VERSION = 1
+_HEADER = struct.Struct('<4sBxxxQ')  # magic, version, padding, len(P)
+
+
+class PalindromeIndex:
+    def __init__(self, s=None, radii=None):
+        # P[k] là độ dài chuỗi đối xứng dài nhất có tâm k trong chuỗi ảo '#s0#s1#...#'
+        self.P = manacher_radii(s) if radii is None else radii
+        self.n = (len(self.P) - 1) // 2
+        self._table = None
+
+    def __len__(self):
+        return self.n
+
+    def is_palindrome(self, i, j):
+        """s[i:j] là chuỗi đối xứng? (chuỗi rỗng được coi là đối xứng)"""
+        if j <= i:
+            return True
+        # Tâm của s[i:j] trong chuỗi ảo là i + j
+        return self.P[i + j] >= j - i
+
+    def _build(self):
+        # table[j][k] = chỉ số có P lớn nhất (trái nhất khi bằng nhau) trong [k, k + 2^j)
+        P = self.P
+        level = array('i', range(len(P)))
+        table = [level]
+        half = 1
+        while 2 * half <= len(P):
+            level = array('i', [a if P[a] >= P[b] else b for a, b in zip(level, level[half:])])
+            table.append(level)
+            half *= 2
+        self._table = table
+
+    def _argmax(self, lo, hi):
+        # Chỉ số có P lớn nhất trong đoạn [lo, hi] (hai đầu đều tính)
+        j = (hi - lo + 1).bit_length() - 1
+        level = self._table[j]
+        a, b = level[lo], level[hi - (1 << j) + 1]
+        return a if self.P[a] >= self.P[b] else b
+
+    def longest_in_range(self, l, r):
+        """(start, length) của một chuỗi đối xứng dài nhất nằm trong s[l:r]."""
+        l, r = max(l, 0), min(r, self.n)
+        if r <= l:
+            return l, 0
+        if self._table is None:
+            self._build()
+        P = self.P
+        # Có chuỗi đối xứng dài >= L trong s[l:r] khi và chỉ khi
+        # max P[2l + L .. 2r - L] >= L, và điều kiện này đơn điệu theo L
+        lo, hi = 1, r - l
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if P[self._argmax(2 * l + mid, 2 * r - mid)] >= mid:
+                lo = mid
+            else:
+                hi = mid - 1
+        center = self._argmax(2 * l + lo, 2 * r - lo)
+        return (center - lo) // 2, lo
+
+    def save(self, path):
+        # Header cố định + P dưới dạng int32 little-endian
+        P = array('i', self.P)
+        if sys.byteorder == 'big':
+            P.byteswap()
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(P)))
+            P.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            magic, version, size = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a palindrome index file")
+            P = array('i')
+            P.fromfile(f, size)
+        if sys.byteorder == 'big':
+            P.byteswap()
+        return cls(radii=P)
+
+
+# Ví dụ sử dụng
+if __name__ == "__main__":
+    text = "xabacabaybb"
+    index = PalindromeIndex(text)
+    print(f"is_palindrome(1, 8) -> {index.is_palindrome(1, 8)} ('{text[1:8]}')")
+    start, length = index.longest_in_range(3, 11)
+    print(f"Chuỗi đối xứng dài nhất trong '{text[3:11]}': '{text[start:start + length]}'")
@@ -0,0 +1,56 @@
+# Thống kê chuỗi đối xứng trong O(n) từ mảng bán kính Manacher
+# Tâm k có chuỗi đối xứng cực đại dài L = P[k] thì cũng có các chuỗi dài L - 2, L - 4, ... (cùng tính chẵn lẻ).
+# Vị trí bắt đầu (và kết thúc) của chúng là một đoạn liên tiếp, nên mỗi tâm chỉ cần cập nhật hai đầu
+# của một mảng hiệu (difference array); tổng tiền tố cho ra kết quả cho mọi vị trí.
+import numpy as np
+
+from manacher import manacher_radii
+
+
+def palindrome_stats(s=None, radii=None):
+    """Thống kê mọi chuỗi con đối xứng (tính theo vị trí xuất hiện, không phân biệt nội dung):
+    - total: tổng số chuỗi con đối xứng
+    - starts[i] / ends[i]: số chuỗi đối xứng bắt đầu / kết thúc tại chỉ số i
+    - histogram[L]: số chuỗi đối xứng độ dài L (histogram[0] = 0)
+    Các mảng là NumPy int64."""
+    P = np.asarray(manacher_radii(s) if radii is None else radii, dtype=np.int64)
+    n = (len(P) - 1) // 2
+    k = np.flatnonzero(P)
+    L = P[k]
+    # Độ dài ngắn nhất tại tâm k: 1 cho tâm là ký tự (k lẻ), 2 cho tâm là khoảng trống
+    shortest = 2 - (k & 1)
+    counts = (L - shortest) // 2 + 1
+
+    # starts nằm trong [(k - L) / 2, (k - shortest) / 2], ends trong [(k + shortest) / 2 - 1, (k + L) / 2 - 1]
+    first_start, last_start = (k - L) // 2, (k - shortest) // 2
+    first_end, last_end = (k + shortest) // 2 - 1, (k + L) // 2 - 1
+    starts = _ranges(first_start, last_start, n)
+    ends = _ranges(first_end, last_end, n)
+
+    # histogram: mỗi tâm cộng 1 cho shortest, shortest + 2, ..., L => mảng hiệu với bước 2
+    diff = np.bincount(shortest, minlength=n + 3) - np.bincount(L + 2, minlength=n + 3)
+    histogram = np.zeros(n + 3, dtype=np.int64)
+    histogram[0::2] = np.cumsum(diff[0::2])
+    histogram[1::2] = np.cumsum(diff[1::2])
+    return {
+        "total": int(counts.sum()),
+        "starts": starts,
+        "ends": ends,
+        "histogram": histogram[:n + 1],
+    }
+
+
+def _ranges(first, last, n):
+    # Số đoạn [first, last] chứa mỗi chỉ số 0..n-1
+    diff = np.bincount(first, minlength=n + 1) - np.bincount(last + 1, minlength=n + 1)
+    return np.cumsum(diff[:n]).astype(np.int64)
+
+
+# Ví dụ sử dụng
+if __name__ == "__main__":
+    text = "abaaba"
+    stats = palindrome_stats(text)
+    print(f"'{text}': {stats['total']} chuỗi con đối xứng")
+    print("bắt đầu tại mỗi chỉ số:", stats["starts"].tolist())
+    print("kết thúc tại mỗi chỉ số:", stats["ends"].tolist())
+    print("theo độ dài:", dict((L, c) for L, c in enumerate(stats["histogram"].tolist()) if c))
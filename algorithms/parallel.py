@@ -0,0 +1,144 @@
+# Parallel Manacher for a single huge string
+# Chuỗi được đặt một lần vào multiprocessing.shared_memory; mỗi tiến trình quét một đoạn
+# tâm [lo, hi) của chuỗi ảo '#s0#s1#...#' nhưng được phép so sánh ký tự ở bất kỳ đâu
+# trong chuỗi, nên chuỗi đối xứng vượt qua biên giữa các đoạn vẫn được tính chính xác.
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import manacher
+
+# Dưới ngưỡng này chi phí tạo tiến trình lớn hơn lợi ích
+MIN_PARALLEL_LEN = 200_000
+# Số bước mở rộng (mỗi tâm trong đoạn) cho phép trước khi một đoạn bỏ cuộc, xem _scan_segment
+STEPS_PER_CENTER = 2
+
+def _scan_segment(s, lo, hi, overlap):
+    # Manacher trên các tâm start..hi-1, với start = lo - overlap: các tâm chồng lấn
+    # chỉ dùng để có giá trị đối xứng, kết quả chỉ tính từ tâm lo trở đi.
+    # Tâm trước start không được tính nên chỉ dùng đối xứng khi chỉ số nằm trong đoạn;
+    # C được dời tới tâm mới nhất chạm R (>=) để chỉ số đối xứng luôn ở gần i.
+    # Manacher tuần tự mở rộng tổng cộng khoảng một bước mỗi ký tự, nhưng một đoạn thì không: khi đối xứng
+    # rơi trước start, tâm phải mở rộng lại từ đầu phần đã biết trong R, và tâm đầu tiên của đoạn có thể
+    # mở rộng ra xa ngoài đoạn ("a" * n). Cả hai thành O(n) mỗi đoạn, nên tổng số bước mở rộng của đoạn
+    # bị chặn bởi STEPS_PER_CENTER bước mỗi tâm; hết ngân sách thì trả về None để tiến trình cha
+    # chạy Manacher tuần tự, nên tổng thời gian vẫn tuyến tính.
+    n = len(s)
+    start = max(0, lo - overlap)
+    P = [0] * (hi - start)
+    C = R = start
+    best, best_center = -1, lo
+    budget = STEPS_PER_CENTER * (hi - start)
+    for i in range(start, hi):
+        r = i & 1
+        if i < R:
+            mirror = 2*C - i
+            if mirror >= start:
+                r = R - i
+                if P[mirror - start] < r:
+                    r = P[mirror - start]
+
+        low = ((i - r) >> 1) - 1
+        high = (i + r) >> 1
+        # Giới hạn high thay vì đếm từng bước, để vòng lặp trong không chậm hơn Manacher
+        limit = high + budget
+        if limit > n:
+            limit = n
+        first = high
+        while low >= 0 and high < limit and s[low] == s[high]:
+            low -= 1
+            high += 1
+        budget -= high - first
+        if budget <= 0:
+            return None
+        r = high - low - 1
+        P[i - start] = r
+
+        if i + r >= R:
+            C = i
+            R = i + r
+        if r > best and i >= lo:
+            best, best_center = r, i
+    return best, best_center
+
+def _worker(name, fmt, n, lo, hi, overlap):
+    # Tiến trình con chỉ mượn vùng nhớ; tiến trình cha chịu trách nhiệm unlink
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf.cast(fmt)[:n]
+    try:
+        return _scan_segment(view, lo, hi, overlap)
+    finally:
+        view.release()
+        shm.close()
+
+def _encode(s):
+    # Trả về (dữ liệu, format) để chia sẻ mà không cần pickle chuỗi
+    if not isinstance(s, str):
+        return memoryview(s).cast('B'), 'B'
+    try:
+        return s.encode('latin-1'), 'B'
+    except UnicodeEncodeError:
+        return s.encode('utf-32-le'), 'I'
+
+def longest_palindrome_span(s, workers=None, segments_per_worker=4, overlap=1 << 12, counters=None):
+    """(start, length) of the longest palindrome, computed with `workers` processes.
+
+    The center range is split into workers * segments_per_worker segments,
+    each warmed up on `overlap` centers before it. Matches
+    manacher.longest_palindrome exactly, including which of several equally
+    long palindromes is returned. `counters` (dict) gets the number of
+    segments and of warm-up centers scanned twice; short inputs that fall
+    back to Manacher report Manacher's counters instead. Repetitive input
+    (sampled once with registry.repetitiveness) is scanned by serial Manacher
+    without starting any process; a segment that still runs out of its
+    expansion budget gives up, and the whole string is then scanned by serial
+    Manacher. Both count as `serial_fallbacks`.
+    """
+    from registry import AUTO_REPETITIVE_STEPS, repetitiveness  # registry imports this module
+
+    workers = workers or os.cpu_count() or 1
+    n = len(s)
+    if workers == 1 or n < MIN_PARALLEL_LEN:
+        return manacher.longest_palindrome_span(s, counters)
+    if repetitiveness(s) >= AUTO_REPETITIVE_STEPS:
+        if counters is not None:
+            counters["serial_fallbacks"] = counters.get("serial_fallbacks", 0) + 1
+        return manacher.longest_palindrome_span(s, counters)
+
+    data, fmt = _encode(s)
+    shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+    try:
+        shm.buf[:len(data)] = data
+        m = 2 * n + 1
+        parts = workers * segments_per_worker
+        bounds = [m * k // parts for k in range(parts + 1)]
+        if counters is not None:
+            segments = [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if lo < hi]
+            counters["segments"] = counters.get("segments", 0) + len(segments)
+            counters["warmup_centers"] = counters.get("warmup_centers", 0) + sum(min(lo, overlap) for lo, _ in segments)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_worker, shm.name, fmt, n, lo, hi, overlap)
+                       for lo, hi in zip(bounds, bounds[1:]) if lo < hi]
+            # Các đoạn theo thứ tự tâm, nên giữ kết quả đầu tiên khi bằng nhau như Manacher
+            best, center, fallback = 0, 0, False
+            for future in futures:
+                result = future.result()
+                if result is None:
+                    fallback = True
+                    pool.shutdown(cancel_futures=True)
+                    break
+                length, c = result
+                if length > best:
+                    best, center = length, c
+    finally:
+        shm.close()
+        shm.unlink()
+    if fallback:
+        if counters is not None:
+            counters["serial_fallbacks"] = counters.get("serial_fallbacks", 0) + 1
+        return manacher.longest_palindrome_span(s, counters)
+    return (center - best) // 2, best
+
+def longest_palindrome(s, workers=None):
+    start, length = longest_palindrome_span(s, workers)
+    return s[start:start + length]
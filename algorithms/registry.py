@@ -0,0 +1,119 @@
+# Engine registry: một API chung cho mọi thuật toán
+#   solve(s, engine="auto") -> Result(start, length, engine, stats)
+# Mỗi engine là một hàm span(s, counters=None) -> (start, length); "auto" chọn engine theo độ dài
+# chuỗi và một phép thăm dò rẻ về mức độ lặp lại của chuỗi. Nếu counters là một dict, engine cộng
+# số thao tác đã làm (comparisons, expansions, cells, ...) vào đó.
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Tuple
+
+import brute_force
+import dynamic_programming
+import dp_bitset
+import eertree
+import expand_center
+import manacher
+import parallel
+import rolling_hash
+
+# Chuỗi ngắn: Expand Center luôn nhanh hơn vì không phải cấp phát mảng bán kính
+AUTO_SHORT_LEN = 64
+# Chuỗi dài: phần không được thăm dò có thể chứa một đoạn lặp dài => dùng Manacher O(n) cho an toàn
+AUTO_LONG_LEN = 100_000
+AUTO_PROBE_CENTERS = 32
+AUTO_PROBE_CAP = 8
+# Số bước mở rộng trung bình mỗi vị trí (tâm lẻ + tâm chẵn): văn bản ngẫu nhiên khoảng 1 (26 chữ cái)
+# tới 3 (nhị phân), "ab"*k khoảng 8, "a"*n khoảng 16
+AUTO_REPETITIVE_STEPS = 5.0
+
+
+@dataclass
+class Result:
+    start: int
+    length: int
+    engine: str
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+    def substring(self, s):
+        return s[self.start:self.start + self.length]
+
+
+Span = Callable[[Any], Tuple[int, int]]
+
+ENGINES: Dict[str, Span] = {}
+
+
+def register(name: str, span: Span) -> None:
+    """Thêm (hoặc thay thế) một engine: span(s, counters=None) trả về (start, length)."""
+    ENGINES[name] = span
+
+
+register("brute_force", brute_force.longest_palindrome_span)
+register("dynamic_programming", dynamic_programming.longest_palindrome_span)
+register("dp_bitset", dp_bitset.longest_palindrome_span)
+register("expand_center", expand_center.longest_palindrome_span)
+register("manacher", manacher.longest_palindrome_span)
+register("rolling_hash", rolling_hash.longest_palindrome_span)
+register("eertree", eertree.longest_palindrome_span)
+register("parallel", parallel.longest_palindrome_span)
+
+
+def repetitiveness(s, centers=AUTO_PROBE_CENTERS, cap=AUTO_PROBE_CAP):
+    """Số bước mở rộng trung bình tại các vị trí lấy mẫu đều (tối đa `cap` bước mỗi tâm).
+    Đây chính là chi phí mỗi tâm của Expand Center, nên ước lượng trực tiếp thời gian của nó."""
+    n = len(s)
+    if n < 2:
+        return 0.0
+    total = 0
+    samples = min(centers, n)
+    for k in range(samples):
+        i = k * n // samples
+        # Giống vòng lặp của Expand Center: j = 0 cho tâm lẻ, j = 1 cho tâm chẵn
+        for j in range(2):
+            low, high = i, i + j
+            steps = 0
+            while steps < cap and low >= 0 and high < n and s[low] == s[high]:
+                low -= 1
+                high += 1
+                steps += 1
+            total += steps
+    return total / samples
+
+
+def choose_engine(s):
+    """(engine, lý do) cho chế độ auto."""
+    n = len(s)
+    if n <= AUTO_SHORT_LEN:
+        return "expand_center", {"reason": "short"}
+    if n >= AUTO_LONG_LEN:
+        return "manacher", {"reason": "long"}
+    score = repetitiveness(s)
+    if score >= AUTO_REPETITIVE_STEPS:
+        return "manacher", {"reason": "repetitive", "probe": score}
+    return "expand_center", {"reason": "low_repetition", "probe": score}
+
+
+def solve(s, engine="auto", counters=False):
+    """Chuỗi đối xứng dài nhất của s bằng engine đã chọn (mặc định: auto).
+    counters=True thêm stats["counters"]; elapsed_ms khi đó gồm cả chi phí đếm."""
+    stats = {}
+    if engine == "auto":
+        engine, stats["auto"] = choose_engine(s)
+    span = ENGINES.get(engine)
+    if span is None:
+        raise ValueError(f"Unknown engine {engine!r}; expected 'auto' or one of {sorted(ENGINES)}")
+    start_time = time.perf_counter()
+    if counters:
+        stats["counters"] = {}
+        start, length = span(s, counters=stats["counters"])
+    else:
+        start, length = span(s)
+    stats["elapsed_ms"] = (time.perf_counter() - start_time) * 1000
+    return Result(start, length, engine, stats)
+
+
+# Ví dụ sử dụng
+if __name__ == "__main__":
+    for input_str in ["babad", "ab" * 50, "a" * 1000 + "b"]:
+        result = solve(input_str)
+        print(f"{result.engine:<14} {result.stats['auto']['reason']:<15} '{result.substring(input_str)[:20]}' (length {result.length})")
@@ -0,0 +1,115 @@
+# Rolling Hash + Binary Search Algorithm for Longest Palindromic Substring
+# Băm đa thức xuôi và ngược (mảng NumPy uint64), rồi tìm nhị phân bán kính tại mọi tâm.
+# Mỗi vòng tìm nhị phân kiểm tra tất cả các tâm cùng lúc => O(n log n) phép toán vector.
+import random
+
+import numpy as np
+
+import manacher
+
+# Hai modulo nguyên tố < 2^31: tích của hai phần dư vẫn vừa uint64
+MODS = (2147483647, 1000000007)
+MAX_RETRIES = 3
+
+def _codes(s):
+    if isinstance(s, str):
+        return np.frombuffer(s.encode('utf-32-le'), dtype='<u4').astype(np.uint64)
+    return np.frombuffer(memoryview(s).cast('B'), dtype=np.uint8).astype(np.uint64)
+
+def _powers(base, mod, count):
+    # pw[k] = base^k mod p, tính bằng cách nhân đôi đoạn đã có
+    pw = np.ones(count, dtype=np.uint64)
+    filled = 1
+    while filled < count:
+        step = pw[filled - 1] * np.uint64(base) % np.uint64(mod)  # base^filled
+        size = min(filled, count - filled)
+        pw[filled:filled + size] = pw[:size] * step % np.uint64(mod)
+        filled += size
+    return pw
+
+class _Hasher:
+    def __init__(self, codes, base, mod):
+        n = len(codes)
+        self.mod = np.uint64(mod)
+        self.pw = _powers(base, mod, n + 1)
+        # F[i] = sum c[k] * B^k, G[i] = sum c[k] * B^(n-1-k) với k < i
+        self.F = np.zeros(n + 1, dtype=np.uint64)
+        self.G = np.zeros(n + 1, dtype=np.uint64)
+        np.cumsum(codes * self.pw[:n] % self.mod, out=self.F[1:])
+        np.cumsum(codes * self.pw[n - 1::-1][:n] % self.mod, out=self.G[1:])
+        self.F %= self.mod
+        self.G %= self.mod
+        self.n = n
+
+    def is_palindrome(self, a, b):
+        # s[a:b] đối xứng <=> sum c[k] B^(k-a) == sum c[k] B^(b-1-k), nhân hai vế với B^(n-b+a)
+        mod = self.mod
+        fwd = (self.F[b] + mod - self.F[a]) % mod
+        rev = (self.G[b] + mod - self.G[a]) % mod
+        return fwd * self.pw[self.n - b] % mod == rev * self.pw[a] % mod
+
+def _radii(codes, seed, counters=None):
+    # Độ dài chuỗi đối xứng tại mọi tâm k của chuỗi ảo '#s0#s1#...#' (như Manacher)
+    # counters: số vòng tìm nhị phân và số phép so sánh hash (một phép mỗi tâm còn hoạt động mỗi vòng)
+    n = len(codes)
+    rng = random.Random(seed)
+    hashers = [_Hasher(codes, rng.randrange(256, mod - 1), mod) for mod in MODS]
+    k = np.arange(2 * n + 1, dtype=np.int64)
+    parity = k & 1
+    # Tìm nhị phân nửa độ dài h, độ dài L = 2h + parity
+    lo = np.zeros(2 * n + 1, dtype=np.int64)
+    hi = (np.minimum(k, 2 * n - k) - parity) // 2
+    active = np.flatnonzero(lo < hi)
+    while len(active):
+        if counters is not None:
+            counters["rounds"] = counters.get("rounds", 0) + 1
+            counters["hash_checks"] = counters.get("hash_checks", 0) + len(active)
+        mid = (lo[active] + hi[active] + 1) // 2
+        L = 2 * mid + parity[active]
+        a = (k[active] - L) // 2
+        b = a + L
+        ok = hashers[0].is_palindrome(a, b) & hashers[1].is_palindrome(a, b)
+        lo[active] = np.where(ok, mid, lo[active])
+        hi[active] = np.where(ok, hi[active], mid - 1)
+        active = active[lo[active] < hi[active]]
+    return 2 * lo + parity
+
+def longest_palindrome_span(s, verify=True, seed=None, counters=None):
+    """(start, length) of the longest palindrome.
+
+    A hash collision can only over-estimate a radius, so with verify=True the
+    winning substring is checked directly; on a collision the hashes are
+    re-seeded, and after MAX_RETRIES the Manacher engine answers instead.
+    If `counters` is a dict, binary-search rounds, hash checks, verification
+    attempts and Manacher fallbacks are added to it; a fallback also adds
+    the Manacher scan's own counters.
+    """
+    codes = _codes(s)
+    if counters is not None:
+        for key in ("rounds", "hash_checks", "verifications", "fallbacks"):
+            counters.setdefault(key, 0)
+    if len(codes) == 0:
+        return 0, 0
+    rng = random.Random(seed)
+    for _ in range(MAX_RETRIES):
+        P = _radii(codes, rng.random(), counters)
+        center = int(P.argmax())  # Tâm đầu tiên có độ dài lớn nhất, giống Manacher
+        length = int(P[center])
+        start = (center - length) // 2
+        window = codes[start:start + length]
+        if counters is not None and verify:
+            counters["verifications"] = counters.get("verifications", 0) + 1
+        if not verify or np.array_equal(window, window[::-1]):
+            return start, length
+    if counters is not None:
+        counters["fallbacks"] += 1
+    return manacher.longest_palindrome_span(s, counters=counters)
+
+def longest_palindrome(s, verify=True):
+    start, length = longest_palindrome_span(s, verify)
+    return s[start:start + length]
+
+# Ví dụ sử dụng
+if __name__ == "__main__":
+    for input_str in ["babad", "xyzabcdedcbapqr", "a" * 10 + "b" + "a" * 10]:
+        print(f"'{input_str}' -> '{longest_palindrome(input_str)}'")
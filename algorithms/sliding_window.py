@@ -0,0 +1,191 @@
+# Chuỗi đối xứng dài nhất trong cửa sổ trượt của một luồng ký tự
+# SlidingWindow.push(ch) thêm ký tự bên phải, pop() bỏ ký tự bên trái; longest() trả về chuỗi
+# đối xứng dài nhất trong cửa sổ hiện tại. Không sao chép cửa sổ và không chạy lại từ đầu:
+#   - Manacher trực tuyến trên bộ đệm u = s[base:]: tâm k được "chốt" (P[k] không đổi nữa) ngay khi
+#     chuỗi tại k gặp ký tự không khớp. Tâm mở i duy nhất là chuỗi đối xứng hậu tố dài nhất của u.
+#   - Sparse table (chỉ số của P lớn nhất) được nối thêm O(log W) mỗi tâm chốt.
+#   - Truy vấn: tìm nhị phân độ dài len (như PalindromeIndex.longest_in_range) trên các tâm đã chốt,
+#     tâm mở i, và các tâm sau i; bán kính của tâm c > i suy ra từ tâm đối xứng 2i - c (đã chốt).
+#     Mỗi push/pop chỉ đổi kết quả tối đa 2 (bỏ hai đầu của một chuỗi đối xứng vẫn còn chuỗi đối xứng),
+#     nên khi truy vấn sau mỗi ký tự, khoảng tìm kiếm chỉ có vài giá trị.
+#   - Khi phần đã trượt qua chiếm quá nửa bộ đệm, bộ đệm được dựng lại từ cửa sổ hiện tại.
+# Mỗi ký tự tốn O(log W) khấu hao, thay vì O(W) (hoặc O(W^2)) khi tính lại trên s[-W:].
+from array import array
+
+# Bộ đệm chỉ được dựng lại khi dài hơn cỡ này, để cửa sổ nhỏ không phải dựng lại liên tục
+MIN_REBUILD = 64
+
+
+class SlidingWindow:
+    def __init__(self, capacity=None):
+        # capacity: push tự động pop khi cửa sổ dài hơn capacity (None = không giới hạn)
+        self.capacity = capacity
+        self.left = 0   # Chỉ số tuyệt đối của ký tự đầu cửa sổ
+        self.right = 0  # Chỉ số tuyệt đối sau ký tự cuối cửa sổ
+        # Cận dưới / cận trên đã biết của độ dài dài nhất
+        self._lower = self._upper = 0
+        self._reset(0)
+
+    def _reset(self, base):
+        self._base = base
+        self._chars = []
+        # P[k] của các tâm đã chốt 0..len(P)-1, trong chuỗi ảo '#u0#u1#...#'
+        self._P = array('i')
+        self._table = []
+        # Tâm mở (chuỗi đối xứng hậu tố dài nhất của u) và bán kính của nó; tâm 0 là khoảng trống đầu
+        self._open = 0
+        self._radius = 0
+        self._C = self._R = 0  # Tâm và biên phải xa nhất, như trong manacher._fill_radii
+        self._best = None
+
+    def __len__(self):
+        return self.right - self.left
+
+    def push(self, ch):
+        """Thêm ch vào cuối cửa sổ (và bỏ ký tự đầu nếu vượt capacity)."""
+        self._append(ch)
+        self.right += 1
+        self._best = None
+        self._upper += 2
+        if self.capacity is not None and self.right - self.left > self.capacity:
+            self.pop()
+
+    def pop(self):
+        """Bỏ và trả về ký tự đầu cửa sổ."""
+        if self.left == self.right:
+            raise IndexError("pop from an empty window")
+        ch = self._chars[self.left - self._base]
+        self.left += 1
+        self._best = None
+        self._lower = max(self._lower - 2, 0)
+        if self.left - self._base > max(self.right - self.left, MIN_REBUILD):
+            self._rebuild()
+        return ch
+
+    def window(self):
+        return self._chars[self.left - self._base:]
+
+    def _rebuild(self):
+        chars = self.window()
+        self._reset(self.left)
+        for ch in chars:
+            self._append(ch)
+
+    def _append(self, ch):
+        u, P = self._chars, self._P
+        u.append(ch)
+        n = len(u)
+        i, r = self._open, self._radius
+        # Tâm mở chạm tới cuối u trước khi thêm ch: thử mở rộng thêm đúng một bước
+        low = (i - r) // 2 - 1
+        if low >= 0 and u[low] == ch:
+            r += 2
+        else:
+            while True:
+                # Chốt tâm i, chuyển sang tâm tiếp theo với cận dưới từ tâm đối xứng (Manacher)
+                self._finalize(r)
+                i += 1
+                r = i & 1
+                if i < self._R:
+                    r = self._R - i
+                    if P[2 * self._C - i] < r:
+                        r = P[2 * self._C - i]
+                low, high = (i - r) // 2 - 1, (i + r) // 2
+                while low >= 0 and high < n and u[low] == u[high]:
+                    low -= 1
+                    high += 1
+                r = high - low - 1
+                if high == n:  # Chạm tới cuối: đây là tâm mở mới
+                    break
+                if i + r > self._R:
+                    self._C, self._R = i, i + r
+        if i + r > self._R:
+            self._C, self._R = i, i + r
+        self._open, self._radius = i, r
+
+    def _finalize(self, radius):
+        # Nối P[k] và cập nhật sparse table: table[j][x] = chỉ số có P lớn nhất trong [x, x + 2^j)
+        P, table = self._P, self._table
+        k = len(P)
+        P.append(radius)
+        if not table:
+            table.append(array('i'))
+        table[0].append(k)
+        j = 1
+        while (1 << j) <= k + 1:
+            if j == len(table):
+                table.append(array('i'))
+            half = table[j - 1]
+            a, b = half[k - (1 << j) + 1], half[k - (1 << (j - 1)) + 1]
+            table[j].append(a if P[a] >= P[b] else b)
+            j += 1
+
+    def _argmax(self, lo, hi):
+        j = (hi - lo + 1).bit_length() - 1
+        level = self._table[j]
+        a, b = level[lo], level[hi - (1 << j) + 1]
+        return a if self._P[a] >= self._P[b] else b
+
+    def _witness(self, length):
+        # Tâm c (tương đối) có chuỗi đối xứng dài >= length nằm trong cửa sổ, hoặc None
+        P = self._P
+        l, n = self.left - self._base, len(self._chars)
+        i, r = self._open, self._radius
+        # Tâm đã chốt (kết thúc trước cuối u, chỉ bị cắt bởi biên trái)
+        lo, hi = 2 * l + length, min(2 * n - length, i - 1)
+        if lo <= hi:
+            k = self._argmax(lo, hi)
+            if P[k] >= length:
+                return k
+        # Tâm mở
+        if min(r, i - 2 * l) >= length:
+            return i
+        # Tâm c > i nằm trong chuỗi của tâm mở: bán kính (cắt tại cuối u) là min(P[2i - c], 2n - c)
+        lo, hi = 2 * i - 2 * n + length, min(2 * i - 2 * l - length, i - 1)
+        if lo <= hi:
+            m = self._argmax(lo, hi)
+            if P[m] >= length:
+                return 2 * i - m
+        return None
+
+    def longest(self):
+        """(start, length) của một chuỗi đối xứng dài nhất trong cửa sổ (start là chỉ số tuyệt đối)."""
+        if self._best is None:
+            # Tìm nhị phân: "có chuỗi dài >= len" là tính chất đơn điệu theo len
+            lo, hi, center = self._lower, min(self._upper, len(self)), None
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                found = self._witness(mid)
+                if found is None:
+                    hi = mid - 1
+                else:
+                    lo, center = mid, found
+            if lo == 0:
+                self._best = (self.left, 0)
+            else:
+                if center is None:
+                    center = self._witness(lo)
+                self._best = (self._base + (center - lo) // 2, lo)
+            self._lower = self._upper = lo
+        return self._best
+
+    def longest_palindrome(self):
+        start, length = self.longest()
+        offset = start - self._base
+        chars = self._chars[offset:offset + length]
+        return ''.join(chars) if all(isinstance(ch, str) for ch in chars) else chars
+
+
+def sliding_longest_palindrome(chars, width):
+    """Với mỗi ký tự của iterator, sinh chuỗi đối xứng dài nhất trong `width` ký tự gần nhất."""
+    window = SlidingWindow(width)
+    for ch in chars:
+        window.push(ch)
+        yield window.longest_palindrome()
+
+
+# Ví dụ sử dụng
+if __name__ == "__main__":
+    stream = "xxabacabaxyzzyxqq"
+    for t, palindrome in enumerate(sliding_longest_palindrome(stream, 6)):
+        print(f"{stream[max(0, t - 5):t + 1]:>6} -> '{palindrome}'")
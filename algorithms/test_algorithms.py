@@ -4,7 +4,12 @@ sys.path.append('.')
 from brute_force import longest_palindrome as brute
 from dynamic_programming import longest_palindrome as dp
 from expand_center import longest_palindrome as expand
-from manacher import longest_palindrome as manacher
+from manacher import longest_palindrome as manacher, longest_palindrome_stream
+import expand_center
+import manacher as manacher_module
+from eertree import Eertree, longest_palindrome as eertree
+from rolling_hash import longest_palindrome as rolling_hash
+from dp_bitset import longest_palindrome as dp_bitset
 
 test_cases = [
     ("babad", {"bab", "aba"}),
@@ -37,7 +42,10 @@ algorithms = [
     ("brute", brute),
     ("dp", dp),
     ("expand", expand),
-    ("manacher", manacher)
+    ("manacher", manacher),
+    ("eertree", eertree),
+    ("rolling_hash", rolling_hash),
+    ("dp_bitset", dp_bitset)
 ]
 
 def verify_palindrome(s, result):
@@ -57,5 +65,710 @@ def run_tests():
             assert result in expected_set, f"Test {idx} failed for {name}: got '{result}', expected {expected_set}"
         print(f"{name} passed all tests!\n")
 
+def run_eertree_tests():
+    import random
+    print("Testing eertree statistics...")
+    for _ in range(200):
+        # Nhiều nút và ký tự ngoài BMP: bảng băm cạnh phải tăng kích thước vài lần
+        alphabet = random.choice(["ab", "abcd", "a\u65e5\U0001F600"])
+        s = ''.join(random.choices(alphabet, k=random.randint(0, 60)))
+        tree = Eertree()
+        for k, ch in enumerate(s):
+            # Hậu tố đối xứng dài nhất sau mỗi ký tự
+            suffix = max(L for L in range(1, k + 2) if s[k + 1 - L:k + 1] == s[k + 1 - L:k + 1][::-1])
+            assert tree.append(ch) == suffix, f"Suffix mismatch for {s[:k + 1]!r}"
+        counts = {}
+        for i in range(len(s)):
+            for j in range(i + 1, len(s) + 1):
+                sub = s[i:j]
+                if sub == sub[::-1]:
+                    counts[sub] = counts.get(sub, 0) + 1
+        assert tree.distinct_count == len(counts), f"Distinct count mismatch for {s!r}"
+        for start, length, occ in tree.palindromes():
+            assert counts[s[start:start + length]] == occ, f"Occurrence mismatch for {s!r}"
+        for sub, occ in counts.items():
+            assert tree.count_of(sub) == occ
+        assert tree.count_of(s + "c") == 0
+    print("eertree passed all tests!\n")
+
+def run_dp_bitset_tests():
+    import random
+    print("Testing bit-parallel DP against dp...")
+    for _ in range(300):
+        s = ''.join(random.choices("abc"[:random.randint(1, 3)], k=random.randint(0, 30)))
+        result, meta = dp_bitset(s, trace=True)
+        assert result == dp(s), f"dp_bitset differs from dp for {s!r}"
+        # Mỗi đường chéo chứa đúng các vị trí bắt đầu chuỗi đối xứng độ dài đó
+        for event in meta["steps"]:
+            L = event["length"]
+            assert event["cells"] == [i for i in range(len(s) - L + 1) if verify_palindrome(s, s[i:i + L])]
+    # Tiếp tục từ đường chéo L với D[L-2], D[L-1] cho đúng phần còn lại
+    from dp_bitset import diagonals
+    s = "abaabacabaab"
+    full = list(diagonals(s))
+    masks = [(1 << (len(s) + 1)) - 1] + [D for _, D in full]
+    for L in range(2, len(full) + 1):
+        assert list(diagonals(s, (L, masks[L - 2], masks[L - 1]))) == full[L - 1:]
+    assert dp_bitset("a" * 3000) == "a" * 3000
+    print("dp_bitset diagonals passed all tests!\n")
+
+def run_stream_tests():
+    import io
+    import tempfile
+    print("Testing streaming manacher...")
+    for input_str, expected_set in test_cases:
+        chunks = [input_str[k:k + 3] for k in range(0, len(input_str), 3)]
+        assert longest_palindrome_stream(chunks) == manacher(input_str), f"Chunked stream failed for {input_str!r}"
+        assert longest_palindrome_stream(io.StringIO(input_str), chunk_size=2) in expected_set
+        data = input_str.encode()
+        assert longest_palindrome_stream(io.BytesIO(data), chunk_size=5) == manacher(data.decode('latin-1')).encode('latin-1')
+    with tempfile.TemporaryFile() as radii_file:
+        assert longest_palindrome_stream(io.StringIO("xyzabcdedcbapqr"), radii_file=radii_file) == "abcdedcba"
+    print("streaming manacher passed all tests!\n")
+
+def run_buffer_tests():
+    import mmap
+    import tempfile
+    print("Testing bytes/memoryview/mmap input...")
+    for module in (expand_center, manacher_module):
+        for input_str, _ in test_cases:
+            data = input_str.encode('latin-1', errors='replace')
+            expected = module.longest_palindrome(data.decode('latin-1')).encode('latin-1')
+            for buf in (data, bytearray(data), memoryview(data)):
+                result = module.longest_palindrome(buf)
+                assert isinstance(result, memoryview) and result.tobytes() == expected, f"{module.__name__} failed for {buf!r}"
+        with tempfile.TemporaryFile() as f:
+            f.write(b"xyzabcdedcbapqr")
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                assert module.longest_palindrome_span(mm) == (3, 9)
+                result = module.longest_palindrome(mm)
+                assert result == b"abcdedcba"
+                result.release()
+    print("buffer input passed all tests!\n")
+
+def run_batch_tests():
+    import random
+    from batch import longest_palindromes
+    print("Testing batch (NumPy) expand-center...")
+    inputs = [input_str for input_str, _ in test_cases]
+    inputs += [''.join(random.choices("ab😊", k=random.randint(0, 30))) for _ in range(500)]
+    starts, lengths = longest_palindromes(inputs, chunk_size=64)
+    for input_str, start, length in zip(inputs, starts, lengths):
+        assert input_str[start:start + length] == expand(input_str), f"Batch failed for {input_str!r}"
+    print("batch passed all tests!\n")
+
+def run_parallel_tests():
+    import random
+    import time
+    import parallel
+    print("Testing parallel manacher...")
+    threshold = parallel.MIN_PARALLEL_LEN
+    parallel.MIN_PARALLEL_LEN = 0
+    try:
+        inputs = [input_str for input_str, _ in test_cases]
+        inputs += [''.join(random.choices("ab", k=random.randint(50, 400))) for _ in range(10)]
+        inputs += ["a" * 500, "ab" * 300, "x" + "abc" * 100 + "cba" * 100 + "y"]
+        for input_str in inputs:
+            for workers in (2, 3):
+                result = parallel.longest_palindrome(input_str, workers=workers)
+                assert result == manacher(input_str), f"Parallel failed for {input_str!r}"
+            assert parallel.longest_palindrome_span(input_str, workers=2, overlap=0) == manacher_module.longest_palindrome_span(input_str)
+        # Một chuỗi đối xứng dài phủ cả đoạn, với đối xứng rơi trước phần khởi động: phải vẫn tuyến tính
+        half = "ab" * 10_000 + "x" + "ba" * 10_000
+        input_str = half + "c" + half[::-1]
+        counters = {}
+        start = time.perf_counter()
+        result = parallel.longest_palindrome_span(input_str, workers=2, counters=counters)
+        elapsed = time.perf_counter() - start
+        assert result == manacher_module.longest_palindrome_span(input_str)
+        assert counters["serial_fallbacks"] == 1
+        assert elapsed < 3, f"parallel took {elapsed:.2f}s on a covering palindrome of length {len(input_str)}"
+        # Đoạn tự bỏ cuộc khi hết ngân sách mở rộng, cả khi đối xứng rơi trước phần khởi động
+        # lẫn khi tâm đầu tiên mở rộng ra xa ngoài đoạn
+        m = 2 * len(input_str) + 1
+        assert parallel._scan_segment(input_str, m // 2, m // 2 + 20_000, 1 << 12) is None
+        assert parallel._scan_segment("a" * 200_000, 200_000, 220_000, 1 << 12) is None
+        assert parallel._scan_segment(input_str[:1000], 0, 2001, 0) is not None
+    finally:
+        parallel.MIN_PARALLEL_LEN = threshold
+    print("parallel passed all tests!\n")
+
+def run_index_tests():
+    import os
+    import random
+    import tempfile
+    from palindrome_index import PalindromeIndex
+    print("Testing PalindromeIndex...")
+    for _ in range(100):
+        s = ''.join(random.choices("ab", k=random.randint(0, 20)))
+        index = PalindromeIndex(s)
+        for i in range(len(s) + 1):
+            for j in range(i, len(s) + 1):
+                assert index.is_palindrome(i, j) == verify_palindrome(s, s[i:j])
+                start, length = index.longest_in_range(i, j)
+                expected = len(expand(s[i:j]))
+                assert length == expected and i <= start and start + length <= j, f"Range query failed for {s!r}[{i}:{j}]"
+                assert verify_palindrome(s, s[start:start + length])
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "index.lpsi")
+        PalindromeIndex("xyzabcdedcbapqr").save(path)
+        index = PalindromeIndex.load(path)
+        assert index.longest_in_range(0, 15) == (3, 9)
+        assert index.longest_in_range(0, 7) == (0, 1)
+    print("PalindromeIndex passed all tests!\n")
+
+def run_maximal_tests():
+    import random
+    from maximal import longest_occurrences, maximal_palindromes, top_k
+    print("Testing maximal palindrome enumeration...")
+    for _ in range(200):
+        s = ''.join(random.choices("abc"[:random.randint(1, 3)], k=random.randint(0, 30)))
+        n = len(s)
+        # Chuỗi đối xứng cực đại: mở rộng tối đa tại mỗi tâm (2n + 1 tâm)
+        expected = []
+        for c in range(2 * n + 1):
+            low, high = c // 2 - 1, (c + 1) // 2
+            while low >= 0 and high < n and s[low] == s[high]:
+                low -= 1
+                high += 1
+            if high - low - 1 > 0:
+                expected.append((low + 1, high - low - 1))
+        ranked = sorted(expected, key=lambda x: (-x[1], x[0]))
+        best = ranked[0][1] if ranked else 0
+        for backend in ("python", "numpy"):
+            assert list(maximal_palindromes(s, 2, backend=backend)) == [x for x in expected if x[1] >= 2]
+            assert list(longest_occurrences(s, backend=backend)) == [x for x in expected if x[1] == best]
+            assert list(top_k(s, 5, backend=backend)) == ranked[:5]
+    print("Maximal palindromes passed all tests!\n")
+
+def run_registry_tests():
+    import random
+    from registry import ENGINES, Result, choose_engine, solve
+    print("Testing engine registry...")
+    for _ in range(100):
+        s = ''.join(random.choices("abc"[:random.randint(1, 3)], k=random.randint(0, 40)))
+        expected = solve(s, "manacher")
+        for engine in ENGINES:
+            result = solve(s, engine)
+            assert result.engine == engine and result.length == expected.length, f"{engine} failed for {s!r}"
+            assert verify_palindrome(s, result.substring(s))
+        assert solve(s).length == expected.length
+    # Chính sách auto: ngắn -> expand_center, lặp lại nhiều hoặc rất dài -> manacher
+    assert choose_engine("babad")[0] == "expand_center"
+    assert choose_engine(''.join(random.choices("abcdefghij", k=5000)))[0] == "expand_center"
+    assert choose_engine("a" * 5000)[0] == "manacher"
+    assert choose_engine("ab" * 2500)[0] == "manacher"
+    assert choose_engine("x" * 200_000)[1]["reason"] == "long"
+    result = solve("xyzabcdedcbapqr")
+    assert isinstance(result, Result) and (result.start, result.length) == (3, 9)
+    assert "elapsed_ms" in result.stats and result.stats["auto"]["reason"] == "short"
+    try:
+        solve("abc", "quantum")
+        assert False, "unknown engine must raise"
+    except ValueError:
+        pass
+    print("Registry passed all tests!\n")
+
+def run_stats_tests():
+    import random
+    from manacher import manacher_radii
+    from palindrome_stats import palindrome_stats
+    print("Testing palindrome statistics...")
+    inputs = [input_str for input_str, _ in test_cases]
+    inputs += [''.join(random.choices("ab", k=random.randint(0, 40))) for _ in range(50)]
+    inputs += [''.join(random.choices("abc", k=random.randint(0, 40))) for _ in range(50)]
+    for input_str in inputs:
+        n = len(input_str)
+        starts, ends, histogram = [0] * n, [0] * n, [0] * (n + 1)
+        for i in range(n):
+            for j in range(i + 1, n + 1):
+                if input_str[i:j] == input_str[i:j][::-1]:
+                    starts[i] += 1
+                    ends[j - 1] += 1
+                    histogram[j - i] += 1
+        for stats in (palindrome_stats(input_str), palindrome_stats(radii=manacher_radii(input_str))):
+            assert stats["total"] == sum(histogram), f"total failed for {input_str!r}"
+            assert stats["starts"].tolist() == starts and stats["ends"].tolist() == ends, f"starts/ends failed for {input_str!r}"
+            assert stats["histogram"].tolist() == histogram, f"histogram failed for {input_str!r}"
+    print("palindrome statistics passed all tests!\n")
+
+def run_lce_tests():
+    import random
+    from lce import LCEIndex, longest_gapped_palindrome, longest_palindrome_k_mismatch
+    print("Testing LCE index...")
+
+    def mismatches(u, v):
+        return sum(a != b for a, b in zip(u, reversed(v)))
+
+    for _ in range(150):
+        s = ''.join(random.choices("abc"[:random.randint(1, 3)], k=random.randint(0, 16)))
+        n = len(s)
+        index = LCEIndex(s)
+        T = s + "\0" + s[::-1]
+        for i in range(len(T)):
+            for j in range(len(T)):
+                h = 0
+                while i + h < len(T) and j + h < len(T) and T[i + h] == T[j + h]:
+                    h += 1
+                assert index.lce(i, j) == h, f"LCE failed for {s!r} at {i}, {j}"
+        for k in range(3):
+            # Oracle: dài nhất rồi trái nhất, hai nửa lệch tối đa k cặp
+            expected = next(((i, L) for L in range(n, 0, -1) for i in range(n - L + 1)
+                             if mismatches(s[i:i + L // 2], s[i + L - L // 2:i + L]) <= k), (0, 0))
+            assert longest_palindrome_k_mismatch(s, k, index) == expected, f"k-mismatch failed for {s!r}, k={k}"
+            for min_gap, max_gap in ((0, 0), (0, 2), (2, 3)):
+                best = (0, 0, 0)
+                for gap in range(min_gap, max_gap + 1):
+                    for i in range(n):
+                        arm = max((a for a in range(1, (n - i - gap) // 2 + 1)
+                                   if mismatches(s[i:i + a], s[i + a + gap:i + 2 * a + gap]) <= k), default=0)
+                        if arm > best[1]:
+                            best = (i, arm, gap)
+                assert longest_gapped_palindrome(s, max_gap, min_gap, k, index) == best, f"Gapped failed for {s!r}"
+    assert longest_palindrome_k_mismatch("babad", 0)[1] == len(manacher("babad"))
+    assert longest_gapped_palindrome("xyzabcQWERcbazz", 5, min_gap=1) == (2, 4, 4)
+    print("LCE index passed all tests!\n")
+
+def run_dna_tests():
+    import os
+    import random
+    import tempfile
+    import dna
+    print("Testing DNA reverse-complement mode...")
+    complement = {"A": "T", "C": "G", "G": "C", "T": "A"}
+    ring = dna.RING
+    try:
+        # Vòng đệm nhỏ buộc nhánh "tâm đối xứng đã bị ghi đè" phải chạy
+        for dna.RING in (ring, 2, 8):
+            for _ in range(200):
+                s = ''.join(random.choices(random.choice(["ACGT", "AT", "ACGTN", "ATat"]), k=random.randint(0, 40)))
+                upper = s.upper()
+                expected = []
+                for c in range(len(s) + 1):
+                    low, high = c - 1, c
+                    while low >= 0 and high < len(s) and complement.get(upper[low]) == upper[high]:
+                        low -= 1
+                        high += 1
+                    if high > c:
+                        expected.append((low + 1, 2 * (high - c)))
+                assert list(dna.rc_palindromes(s)) == expected, f"DNA failed for {s!r}"
+                assert list(dna.rc_palindromes(s, 6)) == [x for x in expected if x[1] >= 6]
+                best = max((x[1] for x in expected), default=0)
+                assert dna.longest_rc_palindrome(s) == next((x for x in expected if x[1] == best), (0, 0))
+                for start, length in expected:
+                    assert upper[start:start + length] == dna.reverse_complement(upper[start:start + length])
+    finally:
+        dna.RING = ring
+    text = ''.join(random.choices("ACGTN", k=1001))
+    seq = dna.pack(text)
+    assert seq.decode() == text and seq.data.nbytes == 251
+    assert dna.longest_rc_palindrome("AT" * 5000) == (0, 10000)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "genome.fa")
+        with open(path, "w") as f:
+            f.write(">chr1 test\nACGTNN\nacgaattc\n; comment\n>plasmid\nTTGGATCCAA\n")
+        for chunk_size in (1, 4, 1 << 20):
+            records = list(dna.read_fasta(path, chunk_size))
+            assert [(name, s.decode()) for name, s in records] == [("chr1 test", "ACGTNNACGAATTC"), ("plasmid", "TTGGATCCAA")]
+            assert records[0][1].gaps == [(4, 6)]
+            assert dna.longest_rc_palindrome(records[1][1]) == (0, 10)
+    print("DNA mode passed all tests!\n")
+
+def run_sliding_window_tests():
+    import random
+    import sliding_window
+    from sliding_window import SlidingWindow, sliding_longest_palindrome
+    print("Testing sliding window...")
+    rebuild = sliding_window.MIN_REBUILD
+    try:
+        # MIN_REBUILD = 1 buộc bộ đệm được dựng lại rất thường xuyên
+        for sliding_window.MIN_REBUILD in (rebuild, 1):
+            for _ in range(100):
+                alphabet = random.choice(["a", "ab", "abc"])
+                window = SlidingWindow(random.choice([None, 3, 10]))
+                expected = ""
+                for _ in range(150):
+                    if expected and random.random() < 0.4:
+                        assert window.pop() == expected[0]
+                        expected = expected[1:]
+                    else:
+                        ch = random.choice(alphabet)
+                        window.push(ch)
+                        expected = (expected + ch)[-(window.capacity or len(expected) + 1):]
+                    if random.random() < 0.5:
+                        continue  # Nhiều thao tác giữa hai lần truy vấn
+                    start, length = window.longest()
+                    palindrome = window.longest_palindrome()
+                    assert length == len(expand(expected)), f"Sliding window failed for {expected!r}"
+                    assert palindrome == expected[start - window.left:start - window.left + length]
+                    assert verify_palindrome(expected, palindrome)
+    finally:
+        sliding_window.MIN_REBUILD = rebuild
+    text = "xxabacabaxyzzyxqq"
+    results = list(sliding_longest_palindrome(text, 6))
+    assert [len(p) for p in results] == [len(expand(text[max(0, t - 5):t + 1])) for t in range(len(text))]
+    assert results[7] == "bacab" and results[14] == "xyzzyx"
+    try:
+        SlidingWindow().pop()
+        assert False, "pop from an empty window must raise"
+    except IndexError:
+        pass
+    print("Sliding window passed all tests!\n")
+
+def run_counters_tests():
+    import random
+    from registry import ENGINES, solve
+    print("Testing operation counters...")
+
+    # Bản tham chiếu có đếm của từng vòng lặp, viết độc lập với các engine, để so với bộ đếm
+    def counted_manacher(s):
+        n, C, R = len(s), 0, 0
+        P = [0] * (2 * n + 1)
+        counts = {"comparisons": 0, "expansions": 0, "mirror_reuses": 0}
+        for i in range(2 * n + 1):
+            r = i & 1
+            if i < R:
+                counts["mirror_reuses"] += 1
+                r = min(R - i, P[2 * C - i])
+            low, high = (i - r) // 2 - 1, (i + r) // 2
+            while low >= 0 and high < n:
+                counts["comparisons"] += 1
+                if s[low] != s[high]:
+                    break
+                counts["expansions"] += 1
+                low, high = low - 1, high + 1
+            P[i] = high - low - 1
+            if i + P[i] > R:
+                C, R = i, i + P[i]
+        return counts
+
+    def counted_expand(s):
+        counts = {"comparisons": 0, "expansions": 0}
+        for i in range(len(s)):
+            for low, high in ((i, i), (i, i + 1)):
+                while low >= 0 and high < len(s):
+                    counts["comparisons"] += 1
+                    if s[low] != s[high]:
+                        break
+                    counts["expansions"] += 1
+                    low, high = low - 1, high + 1
+        return counts
+
+    def counted_brute_force(s):
+        counts = {"substrings": 0, "comparisons": 0}
+        for i in range(len(s)):
+            for j in range(i, len(s)):
+                counts["substrings"] += 1
+                low, high = i, j
+                while low < high:
+                    counts["comparisons"] += 1
+                    if s[low] != s[high]:
+                        break
+                    low, high = low + 1, high - 1
+        return counts
+
+    for _ in range(200):
+        s = ''.join(random.choices("abc"[:random.randint(1, 3)], k=random.randint(0, 40)))
+        n = len(s)
+        counters = {engine: solve(s, engine, counters=True).stats["counters"]
+                    for engine in ENGINES if engine != "parallel"}
+        assert counters["manacher"] == counted_manacher(s), s
+        assert counters["expand_center"] == counted_expand(s), s
+        assert counters["brute_force"] == counted_brute_force(s), s
+        assert counters["dynamic_programming"] == {"cells": n * (n + 1) // 2, "comparisons": n * (n - 1) // 2}
+        assert counters["dp_bitset"]["cells"] <= n * (n + 1) // 2
+        assert counters["eertree"]["nodes"] == len({s[i:j] for i in range(n) for j in range(i + 1, n + 1)
+                                                    if s[i:j] == s[i:j][::-1]})
+        assert counters["rolling_hash"]["verifications"] == min(n, 1)
+        assert counters["rolling_hash"]["fallbacks"] == 0
+    # Giả lập va chạm hash ở mọi lần thử: sau MAX_RETRIES lần Manacher trả lời và được đếm
+    import rolling_hash
+    radii = rolling_hash._radii
+    def colliding_radii(codes, seed, counters=None):
+        P = radii(codes, seed, counters)
+        P[6] = 6  # "abcbad" nhận nhầm là đối xứng
+        return P
+    rolling_hash._radii = colliding_radii
+    try:
+        counters = {}
+        assert rolling_hash.longest_palindrome_span("abcbad", counters=counters) == (0, 5)
+    finally:
+        rolling_hash._radii = radii
+    assert counters["verifications"] == counters["fallbacks"] * rolling_hash.MAX_RETRIES == rolling_hash.MAX_RETRIES
+    assert counters["comparisons"] == counted_manacher("abcbad")["comparisons"]
+    # Không bật counters thì stats không có khoá này
+    assert "counters" not in solve("abba", "manacher").stats
+    print("Counters passed all tests!\n")
+
+def run_bulk_tests():
+    import io
+    import json
+    import os
+    import random
+    import subprocess
+    import bulk
+    print("Testing bulk CLI...")
+    lines = [''.join(random.choices("abc", k=random.randint(0, 80))) for _ in range(500)]
+    lines[7] = "x" * 300 + "racecar"  # Dài hơn một khối
+    data = ("\r\n".join(lines[:10]) + "\n" + "\n".join(lines[10:])).encode("utf-8")  # Không có '\n' cuối
+    expected = [manacher(line) for line in lines]
+    for engine, workers, ordered in [("auto", 1, True), ("manacher", 2, True), ("batch", 2, False)]:
+        out = io.BytesIO()
+        progress = bulk.run([io.BytesIO(data)], out, engine, workers=workers, chunk_bytes=256, ordered=ordered)
+        records = [json.loads(line) for line in out.getvalue().decode("utf-8").splitlines()]
+        assert progress.records == len(lines) and progress.bytes == len(data)
+        if ordered:
+            assert [r["index"] for r in records] == list(range(len(lines)))
+        records.sort(key=lambda r: r["index"])
+        for r, line, palindrome in zip(records, lines, expected):
+            assert r["length"] == len(palindrome) and line[r["start"]:r["start"] + r["length"]] == r["palindrome"]
+            assert verify_palindrome(line, r["palindrome"])
+    # JSONL: kết quả được thêm vào bản ghi, dòng trống bị bỏ qua, lỗi báo số dòng
+    jsonl = b'{"id": 1, "s": "xabbay"}\n\n{"id": 2, "s": ""}\n'
+    out = io.BytesIO()
+    bulk.run([io.BytesIO(jsonl)], out, jsonl=True, field="s")
+    assert [json.loads(line) for line in out.getvalue().splitlines()] == [
+        {"id": 1, "s": "xabbay", "start": 1, "length": 4, "palindrome": "abba"},
+        {"id": 2, "s": "", "start": 0, "length": 0, "palindrome": ""}]
+    try:
+        bulk.run([io.BytesIO(b'{"id": 1}\n{"text": "a"\n')], io.BytesIO(), jsonl=True)
+        assert False, "missing field must raise"
+    except ValueError as e:
+        assert str(e).startswith("line 1:")
+    # Trường không phải chuỗi là lỗi dữ liệu, cả khi chạy song song
+    for workers in (1, 2):
+        try:
+            bulk.run([io.BytesIO(b'{"text": "aba"}\n{"text": 123}\n')], io.BytesIO(), jsonl=True, workers=workers)
+            assert False, "non-string field must raise"
+        except ValueError as e:
+            assert str(e).startswith("line 2:")
+    # Dòng dài hơn nhiều khối được nối đúng một lần
+    assert list(bulk.read_chunks(io.BytesIO(b"abcdefgh\nij\nk"), 3)) == [b"abcdefgh\n", b"ij\n", b"k"]
+    # python -m algorithms từ thư mục gốc của repo
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    done = subprocess.run([sys.executable, "-m", "algorithms", "-j", "2", "-e", "expand_center"],
+                          input=b"babad\ncbbd\n", capture_output=True, cwd=root, check=True)
+    assert [json.loads(line)["palindrome"] for line in done.stdout.splitlines()] == ["bab", "bb"]
+    missing = subprocess.run([sys.executable, "-m", "algorithms", os.path.join(root, "no-such-file.txt")],
+                             capture_output=True, cwd=root)
+    assert missing.returncode == 1 and missing.stderr.startswith(b"error:") and b"Traceback" not in missing.stderr
+    print("Bulk passed all tests!\n")
+
+def run_normalize_tests():
+    import random
+    import unicodedata
+    from array import array
+    import buffers
+    import normalize
+    print("Testing normalized palindromes...")
+
+    def keys_of(text, graphemes):
+        # Bản tham chiếu: chuẩn hoá từng đơn vị bằng Python thuần
+        units, i = [], 0
+        while i < len(text):
+            j = normalize._cluster_end(text, i) if graphemes else i + 1
+            if unicodedata.category(text[i])[0] in 'LNM':
+                folded = unicodedata.normalize('NFC', text[i:j].casefold())
+                units.append(folded if graphemes else text[i].casefold())
+            i = j
+        return units
+
+    def longest(units):
+        best = 0
+        for i in range(len(units)):
+            for j in range(i + best + 1, len(units) + 1):
+                if units[i:j] == units[i:j][::-1]:
+                    best = j - i
+        return best
+
+    cases = [
+        ("A man, a plan, a canal: Panama!", "A man, a plan, a canal: Panama"),
+        ("Aa", "Aa"),
+        ("No 'x' in Nixon", "No 'x' in Nixon"),
+        ("!!", ""),
+        ("", ""),
+    ]
+    for text, expected in cases:
+        for engine in normalize.ENGINES:
+            assert normalize.longest_palindrome(text, engine) == expected, f"{engine} failed for {text!r}"
+    # "é" dựng sẵn và "e" + U+0301 bằng nhau khi so theo cụm grapheme
+    text = "x\u00e9te\u0301y"
+    assert normalize.longest_palindrome(text, graphemes=True) == text[1:-1]
+    assert normalize.longest_palindrome(text) == "x"
+    # casefold mở rộng: "ß" -> "ss" là một khoá riêng (bằng "ẞ", khác hai chữ "s"), trỏ về đúng một vị trí
+    n = normalize.normalize("Stra\u00dfe")
+    assert n.keys.tolist()[:4] == [ord(c) for c in "stra"] and n.keys[4] >= normalize.UNICODE_SIZE
+    assert n.offsets.tolist() == [0, 1, 2, 3, 4, 5]
+    assert normalize.longest_palindrome("Straße: e\u1e9earts") == "Straße: e\u1e9earts"
+    assert normalize.longest_palindrome("Straße: ssarts") == "ss"
+    # Kết quả không bao giờ cắt ngang một ký tự mở rộng
+    for engine in normalize.ENGINES:
+        assert normalize.longest_palindrome("\u00dfas", engine) == "\u00df"
+        assert normalize.longest_palindrome("\ufb03" * 50 + "iff", engine) == "\ufb03" * 50
+    # Bảng tra được dùng lại giữa các lần gọi cùng tuỳ chọn; khoá của cụm không tích luỹ qua các lần gọi
+    tables = normalize._tables(True, True, True)
+    assert tables is normalize._tables(True, True, True)
+    normalize.normalize("xe\u0301y\U0001F44D\U0001F3FD", graphemes=True)
+    interned = dict(tables.interned)
+    normalize.normalize("ya\u0301x\U0001F44D\U0001F3FB", graphemes=True)
+    assert tables.interned == interned
+    # Cặp regional indicator (cờ) là một cụm, kể cả khi nhiều cờ đứng liền nhau
+    flags = "\U0001F1FB\U0001F1F3\U0001F1EF\U0001F1F5\U0001F1FB\U0001F1F3"
+    assert normalize.longest_palindrome(flags, ignore_punctuation=False, graphemes=True) == flags
+    assert len(normalize.normalize(flags, ignore_punctuation=False, graphemes=True)) == 3
+    # Mảng khoá gọn nhất có thể, offsets luôn là array('I')
+    assert normalize.normalize("abc").keys.typecode == 'B'
+    assert normalize.normalize("abcđ").keys.typecode == 'H'
+    assert normalize.normalize("ab\U0001D400").keys.typecode == 'I'
+    assert normalize.normalize("abc").offsets.typecode == 'I'
+    # buffers.as_sequence giữ nguyên phần tử số nguyên (không đổi sang byte)
+    seq = buffers.as_sequence(array('I', [70000, 5, 70000]))
+    assert list(seq) == [70000, 5, 70000]
+    def shape(keys):
+        # Khoá của cụm được cấp theo thứ tự gặp: chỉ so sánh khoá nào bằng khoá nào
+        ids = {}
+        return [ids.setdefault(k, len(ids)) for k in keys]
+
+    # Khối nhỏ (cụm grapheme cắt ngang ranh giới khối) cho cùng kết quả với bản tham chiếu
+    random.seed(24)
+    alphabet = ["a", "A", "b", "\u00e9", "e\u0301", "\u00df", "ss", " ", ",", "\u200d", "\U0001F1FB", "\U0001F1F3", "\U0001F44D\U0001F3FD"]
+    for _ in range(150):
+        text = "".join(random.choice(alphabet) for _ in range(random.randint(0, 14)))
+        for graphemes in (False, True):
+            whole = normalize.normalize(text, graphemes=graphemes)
+            for block_size in (1, 3):
+                blocked = normalize.normalize(text, graphemes=graphemes, block_size=block_size)
+                assert shape(blocked.keys) == shape(whole.keys) and blocked.offsets == whole.offsets, f"block_size={block_size} failed for {text!r}"
+            expected = longest(keys_of(text, graphemes))
+            assert len(whole) == len(keys_of(text, graphemes)), f"unit count differs for {text!r}"
+            for engine in normalize.ENGINES:
+                start, length = normalize.longest_palindrome_span(text, engine, graphemes=graphemes)
+                units = keys_of(text[start:start + length], graphemes)
+                assert len(units) == expected and units == units[::-1], f"{engine} failed for {text!r}"
+    # Nhiều casefold mở rộng: mỗi ký tự là một đơn vị, đoạn trả về gồm ký tự trọn vẹn
+    for _ in range(300):
+        text = "".join(random.choice("aAbB ,.\u00dfsS\u1e9e\u00e9\ufb03") for _ in range(random.randint(0, 12)))
+        expected = longest(keys_of(text, False))
+        for engine in normalize.ENGINES:
+            start, length = normalize.longest_palindrome_span(text, engine)
+            units = keys_of(text[start:start + length], False)
+            assert len(units) == expected and units == units[::-1], f"{engine} failed for {text!r}"
+    print("Normalized palindromes passed all tests!\n")
+
+def run_corpus_index_tests():
+    import os
+    import random
+    import tempfile
+    from collections import Counter
+    from corpus_index import CorpusIndex
+    print("Testing CorpusIndex...")
+
+    def longest(docs, k, common):
+        # Bản tham chiếu: đếm mọi chuỗi con đối xứng (theo lần xuất hiện hoặc theo văn bản)
+        counts = Counter()
+        for s in docs:
+            found = [s[i:j] for i in range(len(s)) for j in range(i + 1, len(s) + 1) if s[i:j] == s[i:j][::-1]]
+            counts.update(set(found) if common else found)
+        return max((len(w) for w, c in counts.items() if c >= k), default=0)
+
+    docs = ["xxracecaryyabbazz", "abba racecar", "level up, abba!"]
+    index = CorpusIndex(docs)
+    assert len(index) == 3
+    assert index.longest_common() == (0, 11, 4)  # "abba"
+    assert index.longest_common(2) == (0, 2, 7)  # "racecar"
+    assert index.longest_repeated(2) == (0, 2, 7)
+    assert index.longest_repeated(1) == (0, 2, 7)
+    # Không chuỗi đối xứng nào vượt qua ranh giới văn bản, kể cả khi hai phía giống nhau
+    assert CorpusIndex(["ab", "ba"]).longest_repeated(1)[2] == 1
+    assert CorpusIndex(["abc", "xyz"]).longest_common() == (0, 0, 0)
+    assert CorpusIndex([]).longest_repeated(1) == (0, 0, 0)
+    assert CorpusIndex([b"GAATTC", b"xGAATTCx"]).longest_common() == (0, 1, 2)  # "AA"
+    random.seed(25)
+    for _ in range(200):
+        docs = ["".join(random.choice("ab") for _ in range(random.randint(0, 12))) for _ in range(random.randint(1, 4))]
+        index = CorpusIndex(docs)
+        for k in (1, 2, 3):
+            for common in (False, True):
+                d, start, length = index.longest_common(k) if common else index.longest_repeated(k)
+                assert length == longest(docs, k, common), f"{docs} k={k} common={common}"
+                assert verify_palindrome(docs[d], docs[d][start:start + length])
+    # save/load qua np.memmap cho cùng kết quả
+    docs = ["abacabadabacaba", "cabadabac", "xyzabadabazyx"]
+    index = CorpusIndex(docs)
+    fd, path = tempfile.mkstemp()
+    os.close(fd)
+    try:
+        index.save(path)
+        loaded = CorpusIndex.load(path)
+        assert [loaded.document(d) for d in range(len(loaded))] == docs
+        for k in (1, 2, 3):
+            assert loaded.longest_repeated(k) == index.longest_repeated(k)
+            assert loaded.longest_common(k) == index.longest_common(k)
+        del loaded
+        with open(path, 'r+b') as f:
+            f.write(b'XXXX')
+        try:
+            CorpusIndex.load(path)
+            assert False, "bad magic must raise"
+        except ValueError:
+            pass
+    finally:
+        os.remove(path)
+    print("CorpusIndex passed all tests!\n")
+
+def run_benchmark_harness_tests():
+    import benchmark
+    print("Testing benchmark harness...")
+    stats = benchmark.summarize([0.003, 0.001, 0.002, 0.004, 0.100])
+    assert stats["median_ms"] == 3.0 and stats["p95_ms"] == 100.0
+    assert stats["ci_ms"][0] <= stats["median_ms"] <= stats["ci_ms"][1]
+    assert abs(benchmark.fit_exponent([(n, 5 * n ** 2) for n in (10, 100, 1000)]) - 2) < 1e-9
+    for family, generate in benchmark.FAMILIES.items():
+        assert len(generate(1000)) == 1000, family
+    assert benchmark.generate_fibonacci_string(8) == "abaababa"
+    report = benchmark.run_suite([50, 100], families=["same_char"], engines=["Manacher"], repeats=3, log=lambda *_: None)
+    assert len(report["results"]) == 2 and "Manacher" in report["exponents"]
+    assert benchmark.compare_to_baseline(report, report) == []
+    slower = {"results": [dict(r, ci_ms=[r["ci_ms"][1] * 2, r["ci_ms"][1] * 3]) for r in report["results"]]}
+    assert len(benchmark.compare_to_baseline(slower, report)) == 2
+    print("Benchmark harness passed all tests!\n")
+
+def run_large_tests():
+    import random
+    import string
+    print("Testing large and adversarial inputs against manacher...")
+    inputs = [
+        "a" * 1000 + "b" + "a" * 1000,
+        "abc" * 1000,
+        "a" * 3000,
+        ''.join(random.choices("ab", k=20000)),
+        ''.join(random.choices(string.ascii_lowercase, k=20000)),
+    ]
+    for input_str in inputs:
+        expected = manacher(input_str)
+        for name, algo in (("expand", expand), ("rolling_hash", rolling_hash)):
+            assert algo(input_str) == expected, f"{name} differs from manacher on input of length {len(input_str)}"
+    print("large inputs passed all tests!\n")
+
 if __name__ == "__main__":
     run_tests()
+    run_eertree_tests()
+    run_dp_bitset_tests()
+    run_stream_tests()
+    run_buffer_tests()
+    run_batch_tests()
+    run_parallel_tests()
+    run_index_tests()
+    run_maximal_tests()
+    run_registry_tests()
+    run_stats_tests()
+    run_lce_tests()
+    run_dna_tests()
+    run_sliding_window_tests()
+    run_counters_tests()
+    run_bulk_tests()
+    run_normalize_tests()
+    run_corpus_index_tests()
+    run_benchmark_harness_tests()
+    run_large_tests()
@@ -1,6 +1,15 @@
-from typing import Generator, Dict, Any, List
+from typing import Generator, Dict, Any, List, Optional
 
-def trace_brute_force(s: str) -> Generator[Dict[str, Any], None, None]:
+# Resumable tracing (used by trace_seek.py):
+# - checkpoints=True also yields {"type": "checkpoint", "state": {...}} at loop boundaries. These are
+#   not steps: the state is what the tracer needs to continue from the next step.
+# - resume=state (with the extra arrays added by trace_seek.restore) continues from that boundary,
+#   producing exactly the steps a full run would produce after it.
+
+def checkpoint(**state: Any) -> Dict[str, Any]:
+    return {"type": "checkpoint", "state": state}
+
+def trace_brute_force(s: str, checkpoints: bool = False, resume: Optional[Dict[str, Any]] = None) -> Generator[Dict[str, Any], None, None]:
     """
     Generator is a literable object meaning we can loop through it and it take the snapshot of the yields
     Here it is used to contain:
@@ -9,19 +18,24 @@ def trace_brute_force(s: str) -> Generator[Dict[str, Any], None, None]:
     - None: Here is the ReturnType of Generator (None here means we don't return anything)
     """
     n = len(s)
-    yield {"type": "init", "description": "Bắt đầu Thuật toán Vét cạn", "line": 1}
+    if resume is None:
+        yield {"type": "init", "description": "Bắt đầu Thuật toán Vét cạn", "line": 1}
     
-    # Handle empty string
-    if n == 0:
-        yield {"type": "result", "description": "Chuỗi rỗng - chuỗi đối xứng dài nhất là chuỗi rỗng", "line": 7, "start": 0, "end": 0, "length": 0}
-        return
+        # Handle empty string
+        if n == 0:
+            yield {"type": "result", "description": "Chuỗi rỗng - chuỗi đối xứng dài nhất là chuỗi rỗng", "line": 7, "start": 0, "end": 0, "length": 0}
+            return
     
-    max_len = 0
+    max_len = resume["max_len"] if resume else 0
     start_idx = 0
+    i0, j0 = (resume["i"], resume["j"]) if resume else (0, 0)
     
-    for i in range(n):
-        yield {"type": "loop_i", "description": f"Vòng lặp ngoài i={i}", "line": 2}
-        for j in range(i, n):
+    for i in range(i0, n):
+        if resume is None or i > i0:
+            yield {"type": "loop_i", "index": i, "description": f"Vòng lặp ngoài i={i}", "line": 2}
+        for j in range(j0 if i == i0 else i, n):
+            if checkpoints:
+                yield checkpoint(i=i, j=j, max_len=max_len)
             # Highlight the substring being checked
             yield {"type": "select", "indices": [i, j], "description": f"Kiểm tra chuỗi con s[{i}:{j+1}]", "line": 3}
             
@@ -51,40 +65,47 @@ def trace_brute_force(s: str) -> Generator[Dict[str, Any], None, None]:
                 else:
                      yield {"type": "found", "indices": [i, j], "description": "Tìm thấy chuỗi đối xứng, nhưng không dài hơn tối đa", "line": 5}
 
-def trace_expand_center(s: str) -> Generator[Dict[str, Any], None, None]:
+def trace_expand_center(s: str, checkpoints: bool = False, resume: Optional[Dict[str, Any]] = None) -> Generator[Dict[str, Any], None, None]:
     n = len(s)
-    yield {"type": "init", "description": "Bắt đầu Thuật toán Mở rộng quanh Tâm", "line": 1}
+    if resume is None:
+        yield {"type": "init", "description": "Bắt đầu Thuật toán Mở rộng quanh Tâm", "line": 1}
     
-    # Handle empty string
-    if n == 0:
-        yield {"type": "result", "description": "Chuỗi rỗng - chuỗi đối xứng dài nhất là chuỗi rỗng", "line": 10, "start": 0, "end": 0, "length": 0}
-        return
+        # Handle empty string
+        if n == 0:
+            yield {"type": "result", "description": "Chuỗi rỗng - chuỗi đối xứng dài nhất là chuỗi rỗng", "line": 10, "start": 0, "end": 0, "length": 0}
+            return
     
     start_idx = 0
-    max_len = 0
+    max_len = resume["max_len"] if resume else 0
+    i0, even0 = (resume["i"], resume["even"]) if resume else (0, False)
     
-    for i in range(n):
+    for i in range(i0, n):
         # Odd length
-        yield {"type": "center", "index": i, "description": f"Mở rộng quanh tâm {i}", "line": 3}
-        l, r = i, i
-        while l >= 0 and r < n:
-            yield {"type": "compare", "indices": [l, r], "description": f"So sánh s[{l}] và s[{r}]", "line": 6}
-            if s[l] == s[r]:
-                yield {"type": "match", "indices": [l, r], "description": "Khớp", "line": 6}
-                if r - l + 1 > max_len:
-                    max_len = r - l + 1
-                    start_idx = l
-                    yield {"type": "update_max", "start": l, "end": r, "length": max_len, "description": f"Độ dài tối đa mới: {max_len}", "line": 8}
-                l -= 1
-                r += 1
-                yield {"type": "expand", "indices": [l, r], "description": "Mở rộng ra ngoài", "line": 9}
-            else:
-                yield {"type": "mismatch", "indices": [l, r], "description": "Không khớp", "line": 6}
-                break
+        if i > i0 or not even0:
+            if checkpoints:
+                yield checkpoint(i=i, even=False, max_len=max_len)
+            yield {"type": "center", "index": i, "description": f"Mở rộng quanh tâm {i}", "line": 3}
+            l, r = i, i
+            while l >= 0 and r < n:
+                yield {"type": "compare", "indices": [l, r], "description": f"So sánh s[{l}] và s[{r}]", "line": 6}
+                if s[l] == s[r]:
+                    yield {"type": "match", "indices": [l, r], "description": "Khớp", "line": 6}
+                    if r - l + 1 > max_len:
+                        max_len = r - l + 1
+                        start_idx = l
+                        yield {"type": "update_max", "start": l, "end": r, "length": max_len, "description": f"Độ dài tối đa mới: {max_len}", "line": 8}
+                    l -= 1
+                    r += 1
+                    yield {"type": "expand", "indices": [l, r], "description": "Mở rộng ra ngoài", "line": 9}
+                else:
+                    yield {"type": "mismatch", "indices": [l, r], "description": "Không khớp", "line": 6}
+                    break
         
         # Even length
         l, r = i, i + 1
         if r < n:
+            if checkpoints:
+                yield checkpoint(i=i, even=True, max_len=max_len)
             yield {"type": "center", "indices": [l, r], "description": f"Mở rộng quanh tâm {i}, {i+1}", "line": 4}
             while l >= 0 and r < n:
                 yield {"type": "compare", "indices": [l, r], "description": f"So sánh s[{l}] và s[{r}]", "line": 6}
@@ -101,26 +122,34 @@ def trace_expand_center(s: str) -> Generator[Dict[str, Any], None, None]:
                     yield {"type": "mismatch", "indices": [l, r], "description": "Không khớp", "line": 6}
                     break
 
-def trace_dynamic_programming(s: str) -> Generator[Dict[str, Any], None, None]:
+def trace_dynamic_programming(s: str, checkpoints: bool = False, resume: Optional[Dict[str, Any]] = None) -> Generator[Dict[str, Any], None, None]:
     n = len(s)
-    yield {"type": "init", "description": "Bắt đầu Thuật toán Quy hoạch Động", "line": 1}
+    if resume is None:
+        yield {"type": "init", "description": "Bắt đầu Thuật toán Quy hoạch Động", "line": 1}
     
-    # Handle empty string
-    if n == 0:
-        yield {"type": "result", "description": "Chuỗi rỗng - chuỗi đối xứng dài nhất là chuỗi rỗng", "line": 9, "start": 0, "end": 0, "length": 0}
-        return
+        # Handle empty string
+        if n == 0:
+            yield {"type": "result", "description": "Chuỗi rỗng - chuỗi đối xứng dài nhất là chuỗi rỗng", "line": 9, "start": 0, "end": 0, "length": 0}
+            return
     
     dp = [[False] * n for _ in range(n)]
-    max_len = 1
+    max_len = resume["max_len"] if resume else 1
     start_idx = 0
+    # Resuming at (length0, i0): the cells the rest of the run reads are given in resume["cells"]
+    length0, i0 = (resume["length"], resume["i"]) if resume else (1, 0)
+    for row, col in resume["cells"] if resume else ():
+        dp[row][col] = True
     
     # Length 1
-    for i in range(n):
+    for i in range(n if length0 == 1 else 0):
         dp[i][i] = True
         yield {"type": "dp_update", "row": i, "col": i, "value": True, "description": f"Trường hợp cơ bản: s[{i}] là chuỗi đối xứng", "line": 2}
     
     # Length 2
-    for i in range(n - 1):
+    first = 0 if length0 < 2 else i0 if length0 == 2 else n
+    for i in range(first, n - 1):
+        if checkpoints:
+            yield checkpoint(length=2, i=i, max_len=max_len)
         yield {"type": "compare", "indices": [i, i+1], "description": f"Kiểm tra s[{i}] == s[{i+1}]", "line": 6}
         if s[i] == s[i+1]:
             dp[i][i+1] = True
@@ -135,10 +164,13 @@ def trace_dynamic_programming(s: str) -> Generator[Dict[str, Any], None, None]:
             yield {"type": "dp_update", "row": i, "col": i+1, "value": False, "description": "Đặt bảng dp", "line": 7}
 
     # Length 3+
-    for length in range(3, n + 1):
-        yield {"type": "loop_len", "description": f"Kiểm tra độ dài {length}", "line": 3}
-        for i in range(n - length + 1):
+    for length in range(max(3, length0), n + 1):
+        if length > length0:
+            yield {"type": "loop_len", "length": length, "description": f"Kiểm tra độ dài {length}", "line": 3}
+        for i in range(i0 if length == length0 else 0, n - length + 1):
             j = i + length - 1
+            if checkpoints:
+                yield checkpoint(length=length, i=i, max_len=max_len)
             yield {"type": "select", "indices": [i, j], "description": f"Kiểm tra chuỗi con s[{i}:{j+1}]", "line": 4}
             
             yield {"type": "compare", "indices": [i, j], "description": f"Kiểm tra s[{i}] == s[{j}]", "line": 6}
@@ -160,24 +192,59 @@ def trace_dynamic_programming(s: str) -> Generator[Dict[str, Any], None, None]:
                 yield {"type": "mismatch", "indices": [i, j], "description": "Hai đầu không khớp", "line": 6}
                 yield {"type": "dp_update", "row": i, "col": j, "value": False, "description": "Đặt bảng dp", "line": 7}
 
-def trace_manacher(s: str) -> Generator[Dict[str, Any], None, None]:
-    yield {"type": "init", "description": "Bắt đầu Thuật toán Manacher", "line": 1}
+def trace_dp_bitset(s: str, checkpoints: bool = False, resume: Optional[Dict[str, Any]] = None) -> Generator[Dict[str, Any], None, None]:
+    # The diagonal recurrence lives in algorithms/dp_bitset.py (on sys.path, see compute.py)
+    from dp_bitset import diagonals, set_bits
+
+    n = len(s)
+    if resume is None:
+        yield {"type": "init", "description": "Bắt đầu Thuật toán Quy hoạch Động bit song song", "line": 1}
+
+        # Handle empty string
+        if n == 0:
+            yield {"type": "result", "description": "Chuỗi rỗng - chuỗi đối xứng dài nhất là chuỗi rỗng", "line": 8, "start": 0, "end": 0, "length": 0}
+            return
+
+        yield {"type": "init_vars", "description": "Đã tính mặt nạ E[k] = (s[i] == s[i+k]) từ các mặt phẳng bit", "line": 2}
+    max_len = resume["max_len"] if resume else 0
+    previous_empty = not resume["old"] if resume else False
+    start = (resume["length"], resume["older"], resume["old"]) if resume else None
+    # One event per diagonal: only the True cells are sent, every other cell of the diagonal is False
+    for length, D in diagonals(s, start):
+        if checkpoints:
+            yield checkpoint(length=length, max_len=max_len)
+        cells = set_bits(D)
+        yield {"type": "dp_diagonal", "length": length, "cells": cells, "description": f"Đường chéo độ dài {length}: {len(cells)} chuỗi đối xứng", "line": 3 if length == 1 else 5}
+        if cells and length > max_len:
+            max_len = length
+            yield {"type": "update_max", "start": cells[0], "end": cells[0] + length - 1, "length": length, "description": f"Độ dài tối đa mới: {length}", "line": 6}
+        if not cells and previous_empty:
+            yield {"type": "check", "description": "Hai đường chéo liên tiếp rỗng - dừng", "line": 7}
+        previous_empty = not cells
+
+def trace_manacher(s: str, checkpoints: bool = False, resume: Optional[Dict[str, Any]] = None) -> Generator[Dict[str, Any], None, None]:
+    if resume is None:
+        yield {"type": "init", "description": "Bắt đầu Thuật toán Manacher", "line": 1}
     
-    # Handle empty string
-    if len(s) == 0:
-        yield {"type": "result", "description": "Chuỗi rỗng - chuỗi đối xứng dài nhất là chuỗi rỗng", "line": 8, "start": 0, "end": 0, "length": 0}
-        return
+        # Handle empty string
+        if len(s) == 0:
+            yield {"type": "result", "description": "Chuỗi rỗng - chuỗi đối xứng dài nhất là chuỗi rỗng", "line": 8, "start": 0, "end": 0, "length": 0}
+            return
     
     T = '#'.join('^{}$'.format(s))
     n = len(T)
-    P = [0] * n
-    C = 0
-    R = 0
+    # Resuming at center i: P[:i] is already final (resume["P"]), the rest is still 0
+    P = resume["P"] if resume else [0] * n
+    C = resume["C"] if resume else 0
+    R = resume["R"] if resume else 0
     
-    yield {"type": "transform", "string": T, "description": "Chuỗi đã chuyển đổi", "line": 1}
-    yield {"type": "init_vars", "description": "Đã khởi tạo P, C, R", "line": 2}
+    if resume is None:
+        yield {"type": "transform", "string": T, "description": "Chuỗi đã chuyển đổi", "line": 1}
+        yield {"type": "init_vars", "description": "Đã khởi tạo P, C, R", "line": 2}
     
-    for i in range(1, n - 1):
+    for i in range(resume["i"] if resume else 1, n - 1):
+        if checkpoints:
+            yield checkpoint(i=i, C=C, R=R)
         yield {"type": "select_center", "index": i, "description": f"Xử lý tâm {i} ('{T[i]}')", "line": 3}
         
         mirror = 2 * C - i
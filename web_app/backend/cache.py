@@ -0,0 +1,243 @@
+import hashlib
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+
+# The writer commits after this many writes or seconds, whichever comes first, and whenever it is idle
+COMMIT_EVERY = 64
+COMMIT_INTERVAL = 1.0
+
+
+class ResultCache:
+    """
+    LRU cache for serialized endpoint responses, bounded by total bytes.
+    - Keys are a content hash of (salt, algorithm, text), so long inputs are not kept as keys; the salt names the
+      response format version, so bodies stored by an older release are never served after an upgrade
+    - Values are the already-serialized response bodies, so a hit skips both the algorithm and JSON encoding
+    - db_path enables an on-disk SQLite tier: every value is also written there, and memory misses fall back to it.
+      The tier is an LRU too (by a `used` counter, bumped on disk hits), bounded by max_disk_bytes
+    - SQLite writes go through a background writer thread, so put() never blocks on disk; values not yet
+      written are still served from the pending map. The pending map is bounded by max_pending_bytes: when the
+      writer falls behind, further disk writes are dropped (counted in disk_dropped) instead of piling up in memory
+    """
+
+    def __init__(self, max_bytes: int, db_path: Optional[str] = None, salt: str = "",
+                 max_disk_bytes: int = 1 << 30, max_pending_bytes: int = 16 << 20):
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.max_pending_bytes = max_pending_bytes
+        self.salt = salt
+        self.size = 0
+        self.disk_size = 0
+        self.pending_size = 0
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+        self.disk_dropped = 0
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            # The first layout had no size column; its keys were unsalted, so nothing in it is reusable
+            self._db.execute("DROP TABLE IF EXISTS results")
+            self._db.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT UNIQUE NOT NULL, value BLOB NOT NULL, "
+                             "size INTEGER NOT NULL, used INTEGER NOT NULL DEFAULT 0)")
+            columns = [row[1] for row in self._db.execute("PRAGMA table_info(entries)")]
+            if "used" not in columns:
+                # Tables from before the `used` column kept their LRU order in rowid
+                self._db.execute("ALTER TABLE entries ADD COLUMN used INTEGER NOT NULL DEFAULT 0")
+                self._db.execute("UPDATE entries SET used = rowid")
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_used ON entries (used)")
+            self._db.commit()
+            self.disk_size, self._clock = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0), COALESCE(MAX(used), 0) FROM entries").fetchone()
+            self._db_lock = threading.Lock()
+            self._pending: Dict[str, bytes] = {}
+            self._touched: Set[str] = set()
+            self._writes: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue()
+            self._uncommitted = 0
+            self._committed_at = time.monotonic()
+            self._writer = threading.Thread(target=self._write_loop, name="result-cache-writer", daemon=True)
+            self._writer.start()
+
+    @property
+    def persistent(self) -> bool:
+        return self._db is not None
+
+    def key(self, text: str, algorithm: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(self.salt.encode())
+        digest.update(b"\0")
+        digest.update(algorithm.encode())
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            if self._db is None:
+                self.misses += 1
+                return None
+            value = self._pending.get(key)
+        if value is None:
+            with self._db_lock:
+                row = self._db.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                value = bytes(row[0])
+                # Move the row to the recent end of the disk LRU; only its `used` column is rewritten
+                self._touch(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._insert(key, value)
+            return value
+
+    def put(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._insert(key, value)
+        if self._db is not None:
+            self._enqueue(key, value)
+
+    def _enqueue(self, key: str, value: bytes) -> None:
+        with self._lock:
+            old = self._pending.get(key)
+            size = self.pending_size + len(value) - (len(old) if old is not None else 0)
+            if size > self.max_pending_bytes:
+                self.disk_dropped += 1
+                return
+            self._pending[key] = value
+            self.pending_size = size
+        self._writes.put(("put", key))
+
+    def _touch(self, key: str) -> None:
+        with self._lock:
+            if key in self._touched:
+                return
+            self._touched.add(key)
+        self._writes.put(("touch", key))
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._writes.get()
+            try:
+                if item is None:
+                    self._commit()
+                    return
+                op, key = item
+                if op == "touch":
+                    with self._lock:
+                        self._touched.discard(key)
+                    with self._db_lock:
+                        self._clock += 1
+                        self._db.execute("UPDATE entries SET used = ? WHERE key = ?", (self._clock, key))
+                else:
+                    with self._lock:
+                        value = self._pending.get(key)
+                    # None: an earlier item for the same key already wrote the newest value
+                    if value is not None:
+                        self._write(key, value)
+                        with self._lock:
+                            # A newer value for the same key may have been queued meanwhile
+                            if self._pending.get(key) is value:
+                                del self._pending[key]
+                                self.pending_size -= len(value)
+                self._uncommitted += 1
+                if (self._uncommitted >= COMMIT_EVERY or self._writes.empty()
+                        or time.monotonic() - self._committed_at >= COMMIT_INTERVAL):
+                    self._commit()
+            finally:
+                self._writes.task_done()
+
+    def _commit(self) -> None:
+        with self._db_lock:
+            self._db.commit()
+        self._uncommitted = 0
+        self._committed_at = time.monotonic()
+
+    def _write(self, key: str, value: bytes) -> None:
+        with self._db_lock:
+            row = self._db.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.disk_size -= row[0]
+            if len(value) <= self.max_disk_bytes:
+                self._clock += 1
+                self._db.execute("INSERT INTO entries (key, value, size, used) VALUES (?, ?, ?, ?)",
+                                 (key, value, len(value), self._clock))
+                self.disk_size += len(value)
+            while self.disk_size > self.max_disk_bytes:
+                rowid, size = self._db.execute("SELECT rowid, size FROM entries ORDER BY used LIMIT 1").fetchone()
+                self._db.execute("DELETE FROM entries WHERE rowid = ?", (rowid,))
+                self.disk_size -= size
+                self.disk_evictions += 1
+
+    def flush(self) -> None:
+        """Wait until every queued SQLite write is committed."""
+        if self._db is not None:
+            self._writes.join()
+
+    def close(self) -> None:
+        if self._db is not None:
+            self.flush()
+            self._writes.put(None)
+            self._writer.join()
+            self._db.close()
+            self._db = None
+
+    def _insert(self, key: str, value: bytes) -> None:
+        # Values bigger than the whole budget are only kept on disk
+        if len(value) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.size -= len(old)
+        self._entries[key] = value
+        self.size += len(value)
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self.flush()
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM entries")
+                self._db.commit()
+                self.disk_size = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "evictions": self.evictions,
+                "disk_evictions": self.disk_evictions,
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "max_bytes": self.max_bytes,
+                "disk_bytes": self.disk_size,
+                "max_disk_bytes": self.max_disk_bytes,
+                "pending_bytes": self.pending_size,
+                "max_pending_bytes": self.max_pending_bytes,
+                "disk_dropped": self.disk_dropped,
+            }
@@ -0,0 +1,102 @@
+"""
+CPU-bound work behind the endpoints. Everything here runs inside the compute process pool,
+so functions are top-level (picklable), take plain arguments and return the serialized body.
+"""
+import json
+import os
+import sys
+from typing import Any, Optional
+
+# Add parent directory to path to import original algorithms (also needed in spawned workers)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../algorithms')))
+
+try:
+    from registry import ENGINES, solve
+    from palindrome_stats import palindrome_stats
+except ImportError:
+    print("Error importing algorithms")
+
+from dp_tiles import viewport
+from algorithms_trace import trace_brute_force, trace_expand_center, trace_dynamic_programming, trace_dp_bitset, trace_manacher
+from trace_codec import encode_trace
+from trace_seek import build_index, trace_window
+
+TRACERS = {
+    "brute_force": trace_brute_force,
+    "expand_center": trace_expand_center,
+    "dynamic_programming": trace_dynamic_programming,
+    "dp_bitset": trace_dp_bitset,
+    "manacher": trace_manacher,
+}
+
+def json_bytes(data: Any) -> bytes:
+    # Same compact encoding as FastAPI's JSONResponse
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+def visualize_body(text: str, algo: str, compact: bool) -> bytes:
+    steps = list(TRACERS[algo](text))
+    return encode_trace(steps) if compact else json_bytes(steps)
+
+def trace_index_body(text: str, algo: str) -> bytes:
+    return json_bytes(build_index(TRACERS[algo], text))
+
+def trace_window_body(text: str, algo: str, index_body: bytes, start: int, count: int) -> bytes:
+    index = json.loads(index_body)
+    steps = trace_window(TRACERS[algo], algo, text, index, start, count)
+    return json_bytes({"from": start, "total": index["total"], "steps": steps})
+
+def trace_lines_body(text: str, algo: str, index_body: bytes, start: int, count: int, sse: bool) -> bytes:
+    """Steps start .. start + count - 1 as NDJSON lines, or SSE events, for /visualize/stream."""
+    steps = trace_window(TRACERS[algo], algo, text, json.loads(index_body), start, count)
+    return b"".join(b"data: " + json_bytes(step) + b"\n\n" if sse else json_bytes(step) + b"\n" for step in steps)
+
+def dp_tiles_body(text: str, row: int, col: int, rows: int, cols: int, step: Optional[int]) -> bytes:
+    return json_bytes(viewport(text, row, col, rows, cols, step))
+
+# (engine, giới hạn độ dài theo bội số của max_slow; None = không giới hạn)
+BENCHMARK_ENGINES = [
+    ("brute_force", 1),
+    ("dynamic_programming", 2),
+    # Bit-parallel DP: O(n) memory and ~n^2/64 word operations, so it runs on 10x longer inputs than DP
+    ("dp_bitset", 20),
+    # Expand Center is O(n^2) on runs like "aaaa...", so it gets a (generous) limit too
+    ("expand_center", 50),
+    ("manacher", None),
+]
+
+def benchmark_body(text: str, max_slow: int) -> bytes:
+    results = {}
+    counters = {}
+    for engine, factor in BENCHMARK_ENGINES:
+        if factor is not None and len(text) > max_slow * factor:
+            results[engine] = None # Too slow
+            counters[engine] = None
+        else:
+            results[engine] = solve(text, engine).stats["elapsed_ms"]
+            # Separate run so the counting pass never shows up in the timing
+            counters[engine] = solve(text, engine, counters=True).stats["counters"]
+    results["counters"] = counters
+    return json_bytes(results)
+
+def solve_body(text: str, engine: str) -> bytes:
+    result = solve(text, engine)
+    return json_bytes({
+        "start": result.start,
+        "length": result.length,
+        "palindrome": result.substring(text),
+        "engine": result.engine,
+        "stats": result.stats,
+    })
+
+def stats_body(text: str) -> bytes:
+    stats = palindrome_stats(text)
+    histogram = stats["histogram"].tolist()
+    longest = max((length for length, count in enumerate(histogram) if count), default=0)
+    return json_bytes({
+        "length": len(text),
+        "total": stats["total"],
+        "longest": longest,
+        "starts": stats["starts"].tolist(),
+        "ends": stats["ends"].tolist(),
+        "histogram": histogram[:longest + 1],  # Drop the all-zero tail
+    })
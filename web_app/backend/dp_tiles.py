@@ -0,0 +1,61 @@
+"""
+The DP table dp[i][j] (= s[i..j] is a palindrome) served as bit-packed TILE x TILE tiles, so a client
+can pan around a table far too large to send whole (or to rebuild from one trace event per cell).
+
+- dp[i][j] is read from the Manacher radius array: P[i + j + 1] >= j - i + 1, O(1) per cell after
+  one O(n) pass per text (shared with trace_seek)
+- Each tile row is 64 bits, packed little-endian: bit k of byte b is column col0 + 8b + k
+- step = number of cells filled so far, in the order of trace_dynamic_programming (diagonal by
+  diagonal, top to bottom); cells not filled yet are 0. Finished tiles are kept in a small cache,
+  the step mask is applied on top.
+"""
+import base64
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from trace_seek import text_radii
+
+TILE = 64
+_OFFSETS = np.arange(TILE)
+
+
+def cell_order(i: Any, j: Any, n: int) -> Any:
+    # Cells on the diagonals 1 .. L - 1 come first, then row i of diagonal L
+    L = j - i + 1
+    return (L - 1) * n - (L - 1) * (L - 2) // 2 + i
+
+
+@lru_cache(maxsize=1024)
+def _finished_tile(text: str, tile_row: int, tile_col: int) -> np.ndarray:
+    n = len(text)
+    P = np.frombuffer(text_radii(text), dtype=np.int32)
+    i = tile_row * TILE + _OFFSETS[:, None]
+    j = tile_col * TILE + _OFFSETS[None, :]
+    length = j - i + 1
+    inside = (length >= 1) & (j < n)
+    values = inside & (P[np.minimum(i + j + 1, 2 * n)] >= length)
+    values.flags.writeable = False  # Shared by every caller of the cache
+    return values
+
+
+def tile(text: str, tile_row: int, tile_col: int, step: Optional[int] = None) -> bytes:
+    values = _finished_tile(text, tile_row, tile_col)
+    if step is not None:
+        i = tile_row * TILE + _OFFSETS[:, None]
+        j = tile_col * TILE + _OFFSETS[None, :]
+        values = values & (cell_order(i, j, len(text)) < step)
+    return np.packbits(values, axis=1, bitorder="little").tobytes()
+
+
+def viewport(text: str, row: int, col: int, rows: int, cols: int, step: Optional[int] = None) -> Dict[str, Any]:
+    """Tiles covering rows row .. row + rows - 1 and columns col .. col + cols - 1.
+    Tiles outside the table or entirely below the diagonal (all zero) are left out."""
+    n = len(text)
+    tiles = []
+    for tile_row in range(row // TILE, min(row + rows - 1, n - 1) // TILE + 1):
+        for tile_col in range(max(col, tile_row * TILE) // TILE, min(col + cols - 1, n - 1) // TILE + 1):
+            bits = tile(text, tile_row, tile_col, step)
+            tiles.append({"row": tile_row, "col": tile_col, "bits": base64.b64encode(bits).decode("ascii")})
+    return {"n": n, "tile": TILE, "step": step, "tiles": tiles}
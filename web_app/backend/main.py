@@ -1,25 +1,31 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from bisect import bisect_right
+from typing import List, Dict, Any, Optional, AsyncIterator
 from fastapi.middleware.cors import CORSMiddleware
-import time
-import sys
+from contextlib import asynccontextmanager
+import json
 import os
+import time
 
-# Add parent directory to path to import original algorithms
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../algorithms')))
-
-try:
-    import brute_force
-    import expand_center
-    import dynamic_programming
-    import manacher
-except ImportError:
-    print("Error importing algorithms")
+from cache import ResultCache
+from compute import (ENGINES, TRACERS, json_bytes, visualize_body, benchmark_body, solve_body, stats_body,
+                     trace_index_body, trace_window_body, trace_lines_body, dp_tiles_body)
+from metrics import (ALGORITHM_DURATION, CACHE_RESULTS, COMPUTE_DURATION, INPUT_LENGTH,
+                     RequestLatencyMiddleware, render as render_metrics, render_gauges)
+from offload import ComputePool
+from trace_codec import VERSION as TRACE_CODEC_VERSION, template_table
+from trace_seek import TraceTooLong
 
-from algorithms_trace import trace_brute_force, trace_expand_center, trace_dynamic_programming, trace_manacher
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    pool.shutdown()
+    cache.close()
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # CORS Setup
 app.add_middleware(
@@ -29,10 +35,45 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(RequestLatencyMiddleware)
 
 # Constants
 MAX_VISUALIZATION_LEN_SLOW = 100
 MAX_VISUALIZATION_LEN_FAST = 1000
+# The compact trace (Accept: application/octet-stream) is ~20x smaller, so it allows longer inputs
+MAX_COMPACT_LEN_SLOW = 200
+MAX_COMPACT_LEN_FAST = 2000
+COMPACT_MEDIA_TYPE = "application/octet-stream"
+# /visualize/steps only sends a window of the trace, so the limits are set by the time of one full pass
+MAX_SEEK_LEN_SLOW = 1000
+MAX_SEEK_LEN_FAST = 100_000
+STEPS_WINDOW = 500  # Default number of steps per /visualize/steps call
+MAX_STEPS_WINDOW = 5000
+# DP tiles cost O(1) per cell after one Manacher pass, so the table size is bounded by the client, not the server
+MAX_DP_TILES_LEN = 5000
+MAX_DP_VIEWPORT = 512  # Rows and columns per /dp/tiles call
+# /benchmark runs Manacher on any input up to this length; the quadratic engines have lower limits (compute.py)
+MAX_BENCHMARK_LEN = 100_000
+# Palindrome statistics are O(n) (Manacher + NumPy difference arrays); the limit only bounds the response size
+MAX_STATS_LEN = 200_000
+STREAM_WINDOW = 4096  # Most trace events per chunk (and per compute call) after the first one
+CACHE_MAX_BYTES = int(os.environ.get("LPS_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+CACHE_DB_PATH = os.environ.get("LPS_CACHE_DB")  # Optional SQLite file so results survive restarts
+CACHE_MAX_DISK_BYTES = int(os.environ.get("LPS_CACHE_MAX_DISK_BYTES", 1024 * 1024 * 1024))
+# Bodies waiting for the SQLite writer; beyond this, disk writes are dropped rather than queued in memory
+CACHE_MAX_PENDING_BYTES = int(os.environ.get("LPS_CACHE_MAX_PENDING_BYTES", 16 * 1024 * 1024))
+# Part of every cache key: bump it whenever a cached response body changes shape,
+# so the SQLite tier never serves bodies written by an older release
+CACHE_FORMAT_VERSION = 2
+
+# Algorithm runs go to a process pool so a slow request cannot stall the event loop or other requests
+COMPUTE_WORKERS = int(os.environ.get("LPS_WORKERS", os.cpu_count() or 1))
+COMPUTE_MAX_PENDING = int(os.environ.get("LPS_MAX_PENDING", 4 * COMPUTE_WORKERS))  # Running + queued
+COMPUTE_TIMEOUT = float(os.environ.get("LPS_COMPUTE_TIMEOUT", 30))  # Seconds
+
+cache = ResultCache(CACHE_MAX_BYTES, CACHE_DB_PATH, salt=f"{CACHE_FORMAT_VERSION}:{TRACE_CODEC_VERSION}",
+                    max_disk_bytes=CACHE_MAX_DISK_BYTES, max_pending_bytes=CACHE_MAX_PENDING_BYTES)
+pool = ComputePool(COMPUTE_WORKERS, COMPUTE_MAX_PENDING, COMPUTE_TIMEOUT)
 
 class VisualizeRequest(BaseModel):
     text: str
@@ -41,67 +82,223 @@ class VisualizeRequest(BaseModel):
 class BenchmarkRequest(BaseModel):
     text: str
 
+class DPTilesRequest(BaseModel):
+    text: str
+    row: int = 0
+    col: int = 0
+    rows: int = 64
+    cols: int = 64
+    step: Optional[int] = None  # Cells filled so far; None = finished table
+
+class SolveRequest(BaseModel):
+    text: str
+    engine: str = "auto"
+
+# "parallel" would start its own process pool inside a compute worker
+SOLVE_ENGINES = {"auto"} | set(ENGINES) - {"parallel"}
+
+async def cached(key: str, operation: str) -> Optional[bytes]:
+    # A lookup that can reach the SQLite tier runs in the threadpool, off the event loop
+    body = await run_in_threadpool(cache.get, key) if cache.persistent else cache.get(key)
+    CACHE_RESULTS.inc(operation, "miss" if body is None else "hit")
+    return body
+
+async def compute(http_request: Request, operation: str, fn, *args) -> bytes:
+    start = time.perf_counter()
+    body = await pool.run(http_request, fn, *args)
+    COMPUTE_DURATION.observe(time.perf_counter() - start, operation)
+    return body
+
 @app.get("/")
 def read_root():
     return {"message": "Palindrome Visualizer API is running"}
 
-@app.post("/visualize")
-def visualize(request: VisualizeRequest):
-    text = request.text
-    algo = request.algorithm
+def get_tracer(text: str, algo: str, compact: bool = False, seek: bool = False):
     n = len(text)
+    if seek:
+        max_slow, max_fast = MAX_SEEK_LEN_SLOW, MAX_SEEK_LEN_FAST
+    else:
+        max_slow = MAX_COMPACT_LEN_SLOW if compact else MAX_VISUALIZATION_LEN_SLOW
+        max_fast = MAX_COMPACT_LEN_FAST if compact else MAX_VISUALIZATION_LEN_FAST
 
     # Validation
     if algo in ["brute_force", "dynamic_programming"]:
-        if n > MAX_VISUALIZATION_LEN_SLOW:
-            raise HTTPException(status_code=400, detail=f"Text too long for {algo}. Max length is {MAX_VISUALIZATION_LEN_SLOW}.")
-    elif n > MAX_VISUALIZATION_LEN_FAST:
-        raise HTTPException(status_code=400, detail=f"Text too long. Max length is {MAX_VISUALIZATION_LEN_FAST}.")
-
-    steps = []
-    
-    if algo == "brute_force":
-        steps = list(trace_brute_force(text))
-    elif algo == "expand_center":
-        steps = list(trace_expand_center(text))
-    elif algo == "dynamic_programming":
-        steps = list(trace_dynamic_programming(text))
-    elif algo == "manacher":
-        steps = list(trace_manacher(text))
-    else:
+        if n > max_slow:
+            raise HTTPException(status_code=400, detail=f"Text too long for {algo}. Max length is {max_slow}.")
+    elif n > max_fast:
+        raise HTTPException(status_code=400, detail=f"Text too long. Max length is {max_fast}.")
+
+    if algo not in TRACERS:
         raise HTTPException(status_code=400, detail="Unknown algorithm")
-    
-    return steps
+    return TRACERS[algo]
+
+@app.post("/visualize")
+async def visualize(request: VisualizeRequest, http_request: Request):
+    text = request.text
+    algo = request.algorithm
+    compact = COMPACT_MEDIA_TYPE in http_request.headers.get("accept", "")
+    tracer = get_tracer(text, algo, compact)
+    media_type = COMPACT_MEDIA_TYPE if compact else "application/json"
+
+    INPUT_LENGTH.observe(len(text), "visualize")
+    key = cache.key(text, algo + ":compact" if compact else algo)
+    body = await cached(key, "visualize")
+    if body is not None:
+        return Response(content=body, media_type=media_type)
+
+    body = await compute(http_request, "visualize", visualize_body, text, algo, compact)
+    cache.put(key, body)
+    return Response(content=body, media_type=media_type)
+
+@app.get("/visualize/templates")
+def visualize_templates():
+    # Needed once by clients to turn compact traces back into events
+    return {"version": TRACE_CODEC_VERSION, "templates": template_table()}
+
+async def trace_index(http_request: Request, text: str, algo: str, operation: str) -> bytes:
+    # Checkpoint index of the trace (see trace_seek.py): one full trace pass, cached
+    key = cache.key(text, algo + ":index")
+    index = await cached(key, operation)
+    if index is None:
+        try:
+            index = await compute(http_request, "visualize_index", trace_index_body, text, algo)
+        except TraceTooLong as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        cache.put(key, index)
+    return index
+
+@app.post("/visualize/steps")
+async def visualize_steps(
+    request: VisualizeRequest,
+    http_request: Request,
+    start: int = Query(0, alias="from", ge=0),
+    count: int = Query(STEPS_WINDOW, ge=1, le=MAX_STEPS_WINDOW),
+):
+    """
+    Steps from .. from + count - 1 of the trace, plus the total number of steps.
+    The first call for a text builds a checkpoint index (one full trace pass, cached); after that
+    each window resumes from the nearest checkpoint instead of replaying the trace from step 0.
+    """
+    text = request.text
+    algo = request.algorithm
+    get_tracer(text, algo, seek=True)
+    INPUT_LENGTH.observe(len(text), "visualize_steps")
+
+    index = await trace_index(http_request, text, algo, "visualize_steps")
+    body = await compute(http_request, "visualize_steps", trace_window_body, text, algo, index, start, count)
+    return Response(content=body, media_type="application/json")
+
+@app.post("/dp/tiles")
+async def dp_tiles(request: DPTilesRequest, http_request: Request):
+    """Bit-packed tiles of the DP table covering the requested viewport (see dp_tiles.py for the layout)."""
+    if len(request.text) > MAX_DP_TILES_LEN:
+        raise HTTPException(status_code=400, detail=f"Text too long. Max length is {MAX_DP_TILES_LEN}.")
+    if request.row < 0 or request.col < 0 or (request.step is not None and request.step < 0):
+        raise HTTPException(status_code=400, detail="row, col and step must not be negative")
+    if not (1 <= request.rows <= MAX_DP_VIEWPORT and 1 <= request.cols <= MAX_DP_VIEWPORT):
+        raise HTTPException(status_code=400, detail=f"rows and cols must be between 1 and {MAX_DP_VIEWPORT}")
+    INPUT_LENGTH.observe(len(request.text), "dp_tiles")
+    body = await compute(http_request, "dp_tiles", dp_tiles_body, request.text,
+                         request.row, request.col, request.rows, request.cols, request.step)
+    return Response(content=body, media_type="application/json")
+
+async def stream_steps(http_request: Request, text: str, algo: str, index: bytes, sse: bool,
+                       first: bytes) -> AsyncIterator[bytes]:
+    """
+    The rest of the trace after its first event, one compute-pool call per window, so every window has the
+    pool's timeout, admission control and disconnect handling. Windows end at the index checkpoints, so each
+    one resumes directly instead of replaying earlier steps; the next window is only computed once the
+    previous chunk has been sent (backpressure).
+    """
+    yield first
+    parsed = json.loads(index)
+    total = parsed["total"]
+    steps = [step for step, _ in parsed["checkpoints"]]
+    start = 1
+    while start < total:
+        if await http_request.is_disconnected():
+            return
+        k = bisect_right(steps, start)
+        end = min(total, start + STREAM_WINDOW, steps[k] if k < len(steps) else total)
+        try:
+            chunk = await compute(http_request, "visualize_stream", trace_lines_body, text, algo, index,
+                                  start, end - start, sse)
+        except HTTPException:
+            # The status line has already been sent: end the stream early (SSE clients see no end event)
+            return
+        yield chunk
+        start = end
+    if sse:
+        yield b"event: end\ndata: {}\n\n"
+
+@app.post("/visualize/stream")
+async def visualize_stream(request: VisualizeRequest, http_request: Request):
+    text = request.text
+    algo = request.algorithm
+    get_tracer(text, algo)
+    INPUT_LENGTH.observe(len(text), "visualize_stream")
+    sse = "text/event-stream" in http_request.headers.get("accept", "")
+    index = await trace_index(http_request, text, algo, "visualize_stream")
+    # The first event is computed before the response starts, so a busy pool or a timeout still gets its status
+    first = await compute(http_request, "visualize_stream", trace_lines_body, text, algo, index, 0, 1, sse)
+    media_type = "text/event-stream" if sse else "application/x-ndjson"
+    return StreamingResponse(stream_steps(http_request, text, algo, index, sse, first), media_type=media_type)
 
 @app.post("/benchmark")
-def benchmark(request: BenchmarkRequest):
+async def benchmark(request: BenchmarkRequest, http_request: Request):
     text = request.text
-    results = {}
-    
-    # Brute Force
-    if len(text) <= MAX_VISUALIZATION_LEN_SLOW:
-        start = time.time()
-        brute_force.longest_palindrome(text)
-        results["brute_force"] = (time.time() - start) * 1000 # ms
-    else:
-        results["brute_force"] = None # Too slow
+    if len(text) > MAX_BENCHMARK_LEN:
+        raise HTTPException(status_code=400, detail=f"Text too long. Max length is {MAX_BENCHMARK_LEN}.")
+    INPUT_LENGTH.observe(len(text), "benchmark")
+    key = cache.key(text, "benchmark")
+    body = await cached(key, "benchmark")
+    if body is not None:
+        return Response(content=body, media_type="application/json")
 
-    # DP
-    if len(text) <= MAX_VISUALIZATION_LEN_SLOW * 2: 
-        start = time.time()
-        dynamic_programming.longest_palindrome(text)
-        results["dynamic_programming"] = (time.time() - start) * 1000
-    else:
-        results["dynamic_programming"] = None
-
-    # Expand Center
-    start = time.time()
-    expand_center.longest_palindrome(text)
-    results["expand_center"] = (time.time() - start) * 1000
-
-    # Manacher
-    start = time.time()
-    manacher.longest_palindrome(text)
-    results["manacher"] = (time.time() - start) * 1000
-    
-    return results
+    body = await compute(http_request, "benchmark", benchmark_body, text, MAX_VISUALIZATION_LEN_SLOW)
+    for engine, elapsed_ms in json.loads(body).items():
+        if isinstance(elapsed_ms, (int, float)):
+            ALGORITHM_DURATION.observe(elapsed_ms / 1000, engine)
+    cache.put(key, body)
+    return Response(content=body, media_type="application/json")
+
+@app.post("/solve")
+async def solve_endpoint(request: SolveRequest, http_request: Request):
+    if request.engine not in SOLVE_ENGINES:
+        raise HTTPException(status_code=400, detail=f"Unknown engine. Expected one of {sorted(SOLVE_ENGINES)}.")
+    INPUT_LENGTH.observe(len(request.text), "solve")
+    key = cache.key(request.text, "solve:" + request.engine)
+    body = await cached(key, "solve")
+    if body is None:
+        body = await compute(http_request, "solve", solve_body, request.text, request.engine)
+        result = json.loads(body)
+        ALGORITHM_DURATION.observe(result["stats"]["elapsed_ms"] / 1000, result["engine"])
+        cache.put(key, body)
+    return Response(content=body, media_type="application/json")
+
+@app.post("/stats")
+async def palindrome_stats(request: BenchmarkRequest, http_request: Request):
+    if len(request.text) > MAX_STATS_LEN:
+        raise HTTPException(status_code=400, detail=f"Text too long. Max length is {MAX_STATS_LEN}.")
+    INPUT_LENGTH.observe(len(request.text), "stats")
+    key = cache.key(request.text, "stats")
+    body = await cached(key, "stats")
+    if body is None:
+        body = await compute(http_request, "stats", stats_body, request.text)
+        cache.put(key, body)
+    return Response(content=body, media_type="application/json")
+
+@app.get("/cache/stats")
+def cache_stats():
+    return cache.stats()
+
+@app.get("/pool/stats")
+def pool_stats():
+    return pool.stats()
+
+@app.get("/metrics")
+def metrics():
+    # Prometheus text format; cache and pool numbers are read at scrape time
+    gauges = render_gauges("lps_cache", "Result cache state (see /cache/stats).", cache.stats(), "field")
+    gauges += render_gauges("lps_pool", "Compute pool state (see /pool/stats).", pool.stats(), "field")
+    return Response(content=render_metrics(gauges), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,141 @@
+"""
+In-process metrics rendered in the Prometheus text exposition format (version 0.0.4).
+Only counters and histograms are needed, so they are implemented here instead of pulling in
+prometheus_client. Each uvicorn worker process keeps its own values.
+"""
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name, self.help, self.label_names = name, help, tuple(labels)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.label_names, labels)} {_number(value)}")
+        return lines
+
+
+class Histogram:
+    """Cumulative buckets (le = upper bound), plus _sum and _count, per label combination."""
+
+    def __init__(self, name: str, help: str, buckets: Iterable[float], labels: Sequence[str] = ()):
+        self.name, self.help, self.label_names = name, help, tuple(labels)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._series: Dict[LabelValues, List[float]] = {}  # bucket counts..., sum
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * len(self.buckets) + [0.0]
+            for k, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[k] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labels, series in sorted(self._series.items()):
+                for bound, count in zip(self.buckets, series):
+                    le = _labels(self.label_names, labels, f'le="{_number(bound)}"')
+                    lines.append(f"{self.name}_bucket{le} {count}")
+                suffix = _labels(self.label_names, labels)
+                lines.append(f"{self.name}_sum{suffix} {_number(series[-1])}")
+                lines.append(f"{self.name}_count{suffix} {series[-2]}")
+        return lines
+
+
+def render_gauges(name: str, help: str, values: Dict[str, float], label: str) -> List[str]:
+    # Point-in-time values read from elsewhere (cache and pool stats) when /metrics is scraped
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} gauge"]
+    for key, value in sorted(values.items()):
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            lines.append(f"{name}{_labels((label,), (key,))} {_number(value)}")
+    return lines
+
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+SIZE_BUCKETS = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+REQUEST_LATENCY = Histogram(
+    "lps_http_request_duration_seconds", "Time until the response starts, by route and status.",
+    LATENCY_BUCKETS, ("method", "route", "status"))
+ALGORITHM_DURATION = Histogram(
+    "lps_algorithm_duration_seconds", "Engine run time measured inside the compute worker.",
+    LATENCY_BUCKETS, ("algorithm",))
+COMPUTE_DURATION = Histogram(
+    "lps_compute_duration_seconds", "Time spent waiting for the compute pool, by operation (cache misses only).",
+    LATENCY_BUCKETS, ("operation",))
+INPUT_LENGTH = Histogram(
+    "lps_input_length_chars", "Length of the submitted text, by operation.",
+    SIZE_BUCKETS, ("operation",))
+CACHE_RESULTS = Counter(
+    "lps_cache_lookups_total", "Result cache lookups, by operation and outcome.", ("operation", "result"))
+
+METRICS = (REQUEST_LATENCY, ALGORITHM_DURATION, COMPUTE_DURATION, INPUT_LENGTH, CACHE_RESULTS)
+
+
+class RequestLatencyMiddleware:
+    """
+    Plain ASGI middleware, so streaming responses and disconnect detection pass through untouched.
+    Observes the time until the response starts, labelled with the matched route template so that
+    paths with arbitrary text cannot create new series.
+    """
+
+    def __init__(self, app: Callable):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+
+        async def send_and_observe(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                route = getattr(scope.get("route"), "path", "unmatched")
+                REQUEST_LATENCY.observe(time.perf_counter() - start, scope["method"], route, str(message["status"]))
+            await send(message)
+
+        await self.app(scope, receive, send_and_observe)
+
+
+def render(extra: Iterable[str] = ()) -> str:
+    lines: List[str] = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    lines.extend(extra)
+    return "\n".join(lines) + "\n"
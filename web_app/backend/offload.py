@@ -0,0 +1,141 @@
+import asyncio
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request
+
+POLL_INTERVAL = 0.1  # Seconds between client-disconnect checks while waiting
+
+
+def _report_pid(pids: Any) -> None:
+    # Worker initializer: tell the parent which process to terminate when the pool is recycled
+    pids.put(os.getpid())
+
+
+class ComputePool:
+    """
+    Bounded process pool for CPU-bound endpoint work.
+    - At most max_pending calls are queued or running; beyond that requests are rejected with 503 right away
+    - Each call has a wall-clock timeout (504), and is cancelled if the client disconnects while it waits
+    - A queued call is dropped on cancel. A call already running in a worker cannot be interrupted, so the
+      whole pool is recycled: its workers are terminated and the next call starts a fresh pool. Other calls
+      running in the old pool fail with 503 (retry), which keeps one runaway input from holding a slot forever
+    """
+
+    def __init__(self, workers: int, max_pending: int, timeout: float):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.pending = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.cancelled = 0
+        self.recycled = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pids: Dict[ProcessPoolExecutor, Any] = {}  # Executor -> queue of its worker PIDs
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        pids = multiprocessing.SimpleQueue()
+        executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_report_pid, initargs=(pids,))
+        self._pids[executor] = pids
+        return executor
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self.pending -= 1
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        return self._submit(fn, *args)[0]
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Tuple[Future, ProcessPoolExecutor]:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(status_code=503, detail="Server busy, try again later",
+                                    headers={"Retry-After": "1"})
+            # Workers are started lazily so importing the app does not fork
+            if self._executor is None:
+                self._executor = self._new_executor()
+            try:
+                future = self._executor.submit(fn, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. killed by the OS); start a fresh pool
+                self._pids.pop(self._executor, None)
+                self._executor = self._new_executor()
+                future = self._executor.submit(fn, *args)
+            executor = self._executor
+            self.pending += 1
+        future.add_done_callback(self._release)
+        return future, executor
+
+    def _stop(self, future: Future, executor: ProcessPoolExecutor) -> None:
+        # Drop a queued call, or recycle the pool if the call is already running
+        if future.cancel():
+            return
+        with self._lock:
+            if self._executor is not executor:
+                return  # Already recycled
+            self._executor = None
+            self.recycled += 1
+            pids = self._pids.pop(executor, None)
+        # ProcessPoolExecutor has no public way to stop a running call before Python 3.14 (terminate_workers),
+        # so terminate the workers by the PIDs they reported on startup
+        while pids is not None and not pids.empty():
+            try:
+                os.kill(pids.get(), signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        # Futures still attached to the old pool fail with BrokenProcessPool, which releases their slots
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, http_request: Optional[Request], fn: Callable[..., Any], *args: Any) -> Any:
+        future, executor = self._submit(fn, *args)
+        waiter = asyncio.wrap_future(future)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                self._stop(future, executor)
+                with self._lock:
+                    self.timeouts += 1
+                raise HTTPException(status_code=504, detail=f"Computation exceeded {self.timeout:g}s")
+            done, _ = await asyncio.wait({waiter}, timeout=min(POLL_INTERVAL, remaining))
+            if done:
+                try:
+                    return waiter.result()
+                except BrokenProcessPool:
+                    # The pool was recycled (or a worker crashed) while this call was running
+                    raise HTTPException(status_code=503, detail="Compute pool restarted, try again",
+                                        headers={"Retry-After": "1"})
+            if http_request is not None and await http_request.is_disconnected():
+                self._stop(future, executor)
+                with self._lock:
+                    self.cancelled += 1
+                # Nobody is listening; the status only shows up in access logs
+                raise HTTPException(status_code=499, detail="Client closed request")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+                "cancelled": self.cancelled,
+                "recycled": self.recycled,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._pids.pop(self._executor, None)
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
@@ -1,3 +1,4 @@
+import json
 from fastapi.testclient import TestClient
 from main import app
 
@@ -27,3 +28,271 @@ def test_benchmark():
     data = response.json()
     assert "brute_force" in data
     assert "expand_center" in data
+    assert data["counters"]["manacher"]["comparisons"] > 0
+    assert data["counters"]["brute_force"]["substrings"] == 6
+
+def test_benchmark_too_long():
+    response = client.post("/benchmark", json={"text": "a" * 100_001})
+    assert response.status_code == 400
+    # Expand Center is quadratic on runs, so it is skipped above its own limit
+    assert client.post("/benchmark", json={"text": "a" * 5001}).json()["expand_center"] is None
+
+def test_visualize_cached():
+    before = client.get("/cache/stats").json()
+    first = client.post("/visualize", json={"text": "racecar", "algorithm": "manacher"})
+    second = client.post("/visualize", json={"text": "racecar", "algorithm": "manacher"})
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    after = client.get("/cache/stats").json()
+    assert after["hits"] >= before["hits"] + 1
+    assert after["bytes"] <= after["max_bytes"]
+
+def test_result_cache_lru_and_disk(tmp_path):
+    from cache import ResultCache
+    cache = ResultCache(max_bytes=10, db_path=str(tmp_path / "cache.db"))
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    assert cache.get("a") == b"12345"  # "a" becomes most recent
+    cache.put("c", b"12345")           # evicts "b" from memory
+    assert cache.stats()["evictions"] == 1
+    assert cache.get("b") == b"12345"  # served from the SQLite tier
+    assert cache.stats()["disk_hits"] == 1
+    cache.flush()
+    assert ResultCache(max_bytes=10, db_path=str(tmp_path / "cache.db")).get("c") == b"12345"
+    assert cache.get("missing") is None
+    cache.close()
+
+def test_result_cache_salt_and_disk_bound(tmp_path):
+    from cache import ResultCache
+    # Keys from another format version never match
+    assert ResultCache(10, salt="1").key("aba", "manacher") != ResultCache(10, salt="2").key("aba", "manacher")
+    cache = ResultCache(max_bytes=0, db_path=str(tmp_path / "cache.db"), max_disk_bytes=10)
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    cache.flush()
+    assert cache.get("a") == b"12345"  # disk hit: "a" becomes most recent on disk
+    cache.put("c", b"12345")           # evicts "b", the least recently used row
+    cache.flush()
+    stats = cache.stats()
+    assert stats["disk_evictions"] == 1 and stats["disk_bytes"] == 10
+    assert cache.get("b") is None
+    assert cache.get("a") == cache.get("c") == b"12345"
+    cache.close()
+
+def test_result_cache_pending_bound_and_touch(tmp_path):
+    import sqlite3
+    from cache import ResultCache
+    path = str(tmp_path / "cache.db")
+    cache = ResultCache(max_bytes=100, db_path=path, max_pending_bytes=8)
+    with cache._db_lock:  # Hold the writer back so both puts stay pending
+        cache.put("a", b"12345")
+        cache.put("b", b"12345")  # Would take the pending map past its bound: kept in memory only
+        stats = cache.stats()
+        assert stats["pending_bytes"] == 5 and stats["disk_dropped"] == 1
+    cache.flush()
+    assert cache.stats()["pending_bytes"] == 0
+    cache.put("c", b"123")
+    cache.flush()
+    cache._entries.clear()
+    size, = sqlite3.connect(path).execute("SELECT size FROM entries WHERE key = 'a'").fetchone()
+    assert cache.get("a") == b"12345"  # Disk hit: only the `used` column of "a" changes
+    cache.flush()
+    rows = sqlite3.connect(path).execute("SELECT key, size FROM entries ORDER BY used").fetchall()
+    assert rows == [("c", 3), ("a", size)]
+    cache.close()
+
+def test_visualize_stream_ndjson():
+    expected = client.post("/visualize", json={"text": "abacaba", "algorithm": "expand_center"}).json()
+    with client.stream("POST", "/visualize/stream", json={"text": "abacaba", "algorithm": "expand_center"}) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        steps = [json.loads(line) for line in response.iter_lines() if line]
+    assert steps == expected
+
+def test_visualize_stream_windows():
+    # Long enough to span several checkpoint windows, each computed in the pool
+    text = "ab" * 150 + "c" + "ba" * 150
+    expected = client.post("/visualize", json={"text": text, "algorithm": "expand_center"}).json()
+    assert len(expected) > 3 * 4096
+    with client.stream("POST", "/visualize/stream", json={"text": text, "algorithm": "expand_center"}) as response:
+        steps = [json.loads(line) for line in response.iter_lines() if line]
+    assert steps == expected
+
+def test_visualize_stream_sse():
+    response = client.post("/visualize/stream", json={"text": "aba", "algorithm": "manacher"},
+                           headers={"Accept": "text/event-stream"})
+    assert response.status_code == 200
+    events = [block for block in response.text.split("\n\n") if block]
+    assert events[0].startswith("data: ")
+    assert json.loads(events[0][len("data: "):])["type"] == "init"
+    assert events[-1].startswith("event: end")
+
+def test_visualize_stream_validation():
+    response = client.post("/visualize/stream", json={"text": "a" * 101, "algorithm": "dynamic_programming"})
+    assert response.status_code == 400
+
+def test_trace_codec_round_trip():
+    from algorithms_trace import trace_brute_force, trace_expand_center, trace_dynamic_programming, trace_dp_bitset, trace_manacher
+    from trace_codec import encode_trace, decode_trace
+    for tracer in (trace_brute_force, trace_expand_center, trace_dynamic_programming, trace_dp_bitset, trace_manacher):
+        for text in ["", "a", "abba", "babad", "cbbd", "日本語本日", "ab" * 20]:
+            steps = list(tracer(text))
+            assert decode_trace(encode_trace(steps)) == steps
+
+def test_visualize_compact():
+    from trace_codec import decode_trace
+    text = "abacabadabacaba" * 6
+    expected = client.post("/visualize", json={"text": text, "algorithm": "dynamic_programming"})
+    response = client.post("/visualize", json={"text": text, "algorithm": "dynamic_programming"},
+                           headers={"Accept": "application/octet-stream"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/octet-stream"
+    assert decode_trace(response.content) == expected.json()
+    assert len(response.content) * 10 < len(expected.content)
+
+    # Longer inputs are accepted only in the compact format
+    long_text = "ab" * 75
+    assert client.post("/visualize", json={"text": long_text, "algorithm": "brute_force"}).status_code == 400
+    response = client.post("/visualize", json={"text": long_text, "algorithm": "brute_force"},
+                           headers={"Accept": "application/octet-stream"})
+    assert response.status_code == 200
+
+    templates = client.get("/visualize/templates").json()
+    assert templates["version"] == 1
+    assert {"type": "init", "line": 1, "description": "Bắt đầu Thuật toán Manacher", "fields": []} in templates["templates"]
+
+def test_compute_pool_admission_and_timeout():
+    import asyncio
+    import time
+    import pytest
+    from fastapi import HTTPException
+    from offload import ComputePool
+
+    pool = ComputePool(workers=1, max_pending=1, timeout=0.3)
+    try:
+        async def scenario():
+            running = asyncio.ensure_future(pool.run(None, time.sleep, 30))
+            await asyncio.sleep(0)
+            # The only slot is taken: reject immediately instead of queueing
+            with pytest.raises(HTTPException) as busy:
+                await pool.run(None, time.sleep, 0)
+            assert busy.value.status_code == 503
+            with pytest.raises(HTTPException) as slow:
+                await running
+            assert slow.value.status_code == 504
+            # The running call was killed with its pool, so its slot is free again right away
+            start = time.perf_counter()
+            while pool.stats()["pending"] and time.perf_counter() - start < 5:
+                await asyncio.sleep(0.01)
+            assert await pool.run(None, abs, -3) == 3
+            assert time.perf_counter() - start < 5
+
+        asyncio.run(scenario())
+        stats = pool.stats()
+        assert stats["rejected"] == 1 and stats["timeouts"] == 1 and stats["recycled"] == 1
+    finally:
+        pool.shutdown()
+
+def test_visualize_dp_bitset():
+    # Same table as the classic DP, one event per diagonal
+    classic = client.post("/visualize", json={"text": "abacdc", "algorithm": "dynamic_programming"}).json()
+    bitset = client.post("/visualize", json={"text": "abacdc", "algorithm": "dp_bitset"}).json()
+    true_cells = {(e["row"], e["col"]) for e in classic if e["type"] == "dp_update" and e["value"]}
+    assert true_cells == {(i, i + e["length"] - 1) for e in bitset if e["type"] == "dp_diagonal" for i in e["cells"]}
+    assert [e for e in bitset if e["type"] == "update_max"][-1]["length"] == 3
+
+    # 10x the classic DP limit
+    response = client.post("/visualize", json={"text": "ab" * 500, "algorithm": "dp_bitset"})
+    assert response.status_code == 200
+    assert response.json()[-1]["type"] == "dp_diagonal"
+
+def test_solve():
+    data = client.post("/solve", json={"text": "xyzabcdedcbapqr"}).json()
+    assert (data["start"], data["length"], data["palindrome"]) == (3, 9, "abcdedcba")
+    assert data["engine"] == "expand_center" and data["stats"]["auto"]["reason"] == "short"
+    data = client.post("/solve", json={"text": "ab" * 500}).json()
+    assert data["engine"] == "manacher" and data["length"] == 999
+    data = client.post("/solve", json={"text": "babad", "engine": "dp_bitset"}).json()
+    assert data["palindrome"] == "bab" and data["engine"] == "dp_bitset"
+    assert client.post("/solve", json={"text": "a", "engine": "parallel"}).status_code == 400
+
+def test_palindrome_stats():
+    data = client.post("/stats", json={"text": "abaaba"}).json()
+    assert data["total"] == 11 and data["longest"] == 6
+    assert data["starts"] == [3, 2, 2, 2, 1, 1]
+    assert data["ends"] == [1, 1, 2, 2, 2, 3]
+    assert data["histogram"] == [0, 6, 1, 2, 1, 0, 1]
+
+    # Far beyond the visualization limits
+    data = client.post("/stats", json={"text": "a" * 50_000}).json()
+    assert data["total"] == 50_000 * 50_001 // 2
+    assert client.post("/stats", json={"text": ""}).json()["total"] == 0
+
+def test_metrics():
+    client.post("/solve", json={"text": "metricsabba", "engine": "manacher"})
+    client.post("/solve", json={"text": "metricsabba", "engine": "manacher"})
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert 'lps_http_request_duration_seconds_count{method="POST",route="/solve",status="200"}' in text
+    assert 'lps_algorithm_duration_seconds_bucket{algorithm="manacher",le="+Inf"}' in text
+    assert 'lps_cache_lookups_total{operation="solve",result="hit"}' in text
+    assert 'lps_compute_duration_seconds_count{operation="solve"}' in text
+    assert 'lps_cache{field="max_bytes"}' in text
+    assert 'lps_pool{field="workers"}' in text
+
+def test_visualize_steps_seek():
+    from algorithms_trace import trace_manacher, trace_dynamic_programming
+    text = "abacabadabacaba" * 200  # Trace far longer than one checkpoint interval
+    full = list(trace_manacher(text))
+    for start in (0, 1, 9000, len(full) - 3):
+        response = client.post(f"/visualize/steps?from={start}&count=50", json={"text": text, "algorithm": "manacher"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["from"] == start and data["total"] == len(full)
+        assert data["steps"] == full[start:start + 50]
+
+    text = "abbaxyzzyx" * 30
+    full = list(trace_dynamic_programming(text))
+    data = client.post("/visualize/steps?from=20000&count=100", json={"text": text, "algorithm": "dynamic_programming"}).json()
+    assert data["steps"] == full[20000:20100]
+
+    assert client.post("/visualize/steps?count=100000", json={"text": "aba", "algorithm": "manacher"}).status_code == 422
+    assert client.post("/visualize/steps", json={"text": "a" * 1001, "algorithm": "brute_force"}).status_code == 400
+
+def test_trace_index_limit():
+    import pytest
+    from algorithms_trace import trace_expand_center
+    from trace_seek import TraceTooLong, build_index
+    index = build_index(trace_expand_center, "ab" * 500, every=100)
+    assert len(index["checkpoints"]) > 1 and all(step >= 100 * k for k, (step, _) in enumerate(index["checkpoints"]))
+    with pytest.raises(TraceTooLong):
+        build_index(trace_expand_center, "a" * 1000, max_steps=10_000)
+
+def test_dp_tiles():
+    import base64
+    import random
+    random.seed(3)
+    text = ''.join(random.choices("ab", k=150))
+    n = len(text)
+    order = [(i, i + L - 1) for L in range(1, n + 1) for i in range(n - L + 1)]  # Fill order of the DP trace
+    step = 7000
+    filled = set(order[:step])
+
+    response = client.post("/dp/tiles", json={"text": text, "row": 60, "col": 100, "rows": 100, "cols": 50, "step": step})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["n"] == n and data["tile"] == 64
+    # Rows 0..191 x columns 64..191, minus the tile below the diagonal and the tiles past the end
+    assert sorted((t["row"], t["col"]) for t in data["tiles"]) == [(0, 1), (0, 2), (1, 1), (1, 2), (2, 2)]
+    for t in data["tiles"]:
+        bits = base64.b64decode(t["bits"])
+        for r in range(64):
+            for c in range(64):
+                i, j = t["row"] * 64 + r, t["col"] * 64 + c
+                expected = j < n and i <= j and (i, j) in filled and text[i:j + 1] == text[i:j + 1][::-1]
+                assert bool(bits[r * 8 + c // 8] >> (c % 8) & 1) == expected
+
+    assert client.post("/dp/tiles", json={"text": "a" * 5001}).status_code == 400
+    assert client.post("/dp/tiles", json={"text": "aba", "rows": 1000}).status_code == 400
@@ -0,0 +1,215 @@
+"""
+Compact binary encoding for trace events (application/octet-stream).
+
+Every event of the trace_* generators is fully described by a template (type, line,
+description pattern, argument fields) plus a few integers. Instead of repeating keys and
+the Vietnamese description for each event, the payload stores:
+
+    header   magic "LPST", version u8, arg width u8 (2 = int16, 4 = int32), 2 pad bytes,
+             event count u32, argument count u32, string count u32      (little-endian)
+    ids      one u8 template id per event
+    args     the event arguments, in template field order, padded to the arg width
+    strings  for each string (only Manacher's transformed string): u32 byte length + UTF-8
+
+The template table is served once by GET /visualize/templates. A client rebuilds each
+event from its template: "indices" consumes two arguments, "value?" is a boolean,
+"string" is an index into the string table, "cells*" is a count followed by that many values. Description placeholders are filled from the
+event fields; i0/i1 are the two indices, i1_next is i1 + 1, count is the number of cells,
+and t_index/t0/t1 are the characters of the transformed string at index/i0/i1.
+"""
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List
+
+MAGIC = b"LPST"
+VERSION = 1
+_HEADER = struct.Struct("<4sBBxxIII")
+
+EMPTY_RESULT = "Chuỗi rỗng - chuỗi đối xứng dài nhất là chuỗi rỗng"
+SPAN = ("start", "end", "length")
+CELL = ("row", "col", "value?")
+
+# (type, line, description, fields)
+TEMPLATES = [
+    # Shared
+    ("match", 6, "Khớp", ("indices",)),
+    ("mismatch", 6, "Không khớp", ("indices",)),
+    ("update_max", 8, "Độ dài tối đa mới: {length}", SPAN),
+    # Brute force
+    ("init", 1, "Bắt đầu Thuật toán Vét cạn", ()),
+    ("result", 7, EMPTY_RESULT, SPAN),
+    ("loop_i", 2, "Vòng lặp ngoài i={index}", ("index",)),
+    ("select", 3, "Kiểm tra chuỗi con s[{i0}:{i1_next}]", ("indices",)),
+    ("check", 4, "Kiểm tra có phải chuỗi đối xứng...", ()),
+    ("compare", 4, "So sánh s[{i0}] và s[{i1}]", ("indices",)),
+    ("mismatch", 4, "Tìm thấy không khớp", ("indices",)),
+    ("match", 4, "Tìm thấy khớp", ("indices",)),
+    ("update_max", 6, "Độ dài tối đa mới: {length}", SPAN),
+    ("found", 5, "Tìm thấy chuỗi đối xứng, nhưng không dài hơn tối đa", ("indices",)),
+    # Expand center
+    ("init", 1, "Bắt đầu Thuật toán Mở rộng quanh Tâm", ()),
+    ("result", 10, EMPTY_RESULT, SPAN),
+    ("center", 3, "Mở rộng quanh tâm {index}", ("index",)),
+    ("center", 4, "Mở rộng quanh tâm {i0}, {i1}", ("indices",)),
+    ("compare", 6, "So sánh s[{i0}] và s[{i1}]", ("indices",)),
+    ("expand", 9, "Mở rộng ra ngoài", ("indices",)),
+    # Dynamic programming
+    ("init", 1, "Bắt đầu Thuật toán Quy hoạch Động", ()),
+    ("result", 9, EMPTY_RESULT, SPAN),
+    ("dp_update", 2, "Trường hợp cơ bản: s[{row}] là chuỗi đối xứng", CELL),
+    ("compare", 6, "Kiểm tra s[{i0}] == s[{i1}]", ("indices",)),
+    ("dp_update", 7, "Đặt bảng dp", CELL),
+    ("loop_len", 3, "Kiểm tra độ dài {length}", ("length",)),
+    ("select", 4, "Kiểm tra chuỗi con s[{i0}:{i1_next}]", ("indices",)),
+    ("match", 6, "Hai đầu khớp", ("indices",)),
+    ("dp_check", 6, "Chuỗi con bên trong là chuỗi đối xứng", CELL),
+    ("dp_check", 6, "Chuỗi con bên trong KHÔNG phải chuỗi đối xứng", CELL),
+    ("mismatch", 6, "Hai đầu không khớp", ("indices",)),
+    # Manacher
+    ("init", 1, "Bắt đầu Thuật toán Manacher", ()),
+    ("result", 8, EMPTY_RESULT, SPAN),
+    ("transform", 1, "Chuỗi đã chuyển đổi", ("string",)),
+    ("init_vars", 2, "Đã khởi tạo P, C, R", ()),
+    ("select_center", 3, "Xử lý tâm {index} ('{t_index}')", ("index",)),
+    ("calc_mirror", 4, "Chỉ số đối xứng = {mirror_index}", ("index", "mirror_index")),
+    ("mirror", 5, "Khởi tạo P[{index}] từ đối xứng", ("index", "mirror_index", "value")),
+    ("compare", 6, "So sánh {t0} và {t1}", ("indices",)),
+    ("update_center", 7, "Cập nhật Tâm thành {center}, Phải thành {right}", ("center", "right")),
+    ("update_max", None, "Độ dài tối đa cuối cùng: {length}", SPAN),
+    # Bit-parallel DP (its empty-input result shares Manacher's template)
+    ("init", 1, "Bắt đầu Thuật toán Quy hoạch Động bit song song", ()),
+    ("init_vars", 2, "Đã tính mặt nạ E[k] = (s[i] == s[i+k]) từ các mặt phẳng bit", ()),
+    ("dp_diagonal", 3, "Đường chéo độ dài {length}: {count} chuỗi đối xứng", ("length", "cells*")),
+    ("dp_diagonal", 5, "Đường chéo độ dài {length}: {count} chuỗi đối xứng", ("length", "cells*")),
+    ("update_max", 6, "Độ dài tối đa mới: {length}", SPAN),
+    ("check", 7, "Hai đường chéo liên tiếp rỗng - dừng", ()),
+]
+
+_BY_TYPE_LINE: Dict[Any, List[int]] = {}
+for _id, (_type, _line, _, _) in enumerate(TEMPLATES):
+    _BY_TYPE_LINE.setdefault((_type, _line), []).append(_id)
+
+
+def template_table() -> List[Dict[str, Any]]:
+    return [{"type": t, "line": line, "description": d, "fields": list(f)} for t, line, d, f in TEMPLATES]
+
+
+def _keys(fields) -> set:
+    return {"type", "description"} | {f.rstrip("?*") for f in fields}
+
+
+def render_description(template: str, event: Dict[str, Any], transformed: str) -> str:
+    values = dict(event)
+    if "indices" in event:
+        values["i0"], values["i1"] = event["indices"]
+        values["i1_next"] = values["i1"] + 1
+        if transformed:
+            values["t0"], values["t1"] = transformed[values["i0"]], transformed[values["i1"]]
+    if "cells" in event:
+        values["count"] = len(event["cells"])
+    if "index" in event and transformed:
+        values["t_index"] = transformed[event["index"]]
+    return template.format(**values)
+
+
+_CANDIDATES: Dict[Any, List[int]] = {}
+
+
+def _template_id(event: Dict[str, Any], transformed: str) -> int:
+    # Each yield site of a tracer always produces the same keys in the same order
+    signature = (event["type"], event.get("line"), tuple(event))
+    candidates = _CANDIDATES.get(signature)
+    if candidates is None:
+        keys = set(event) - {"line"}
+        candidates = [t for t in _BY_TYPE_LINE.get(signature[:2], ()) if keys == _keys(TEMPLATES[t][3])]
+        _CANDIDATES[signature] = candidates
+    # Only events that differ by description alone (e.g. the two dp_check wordings) need rendering
+    for template_id in candidates:
+        if len(candidates) == 1 or render_description(TEMPLATES[template_id][2], event, transformed) == event["description"]:
+            return template_id
+    raise ValueError(f"No compact template for trace event {event!r}")
+
+
+def encode_trace(steps: Iterable[Dict[str, Any]]) -> bytes:
+    ids = bytearray()
+    args = array("i")
+    strings: List[bytes] = []
+    transformed = ""
+    for event in steps:
+        if event["type"] == "transform":
+            transformed = event["string"]
+        template_id = _template_id(event, transformed)
+        ids.append(template_id)
+        for field in TEMPLATES[template_id][3]:
+            if field == "indices":
+                args.extend(event["indices"])
+            elif field == "cells*":
+                args.append(len(event["cells"]))
+                args.extend(event["cells"])
+            elif field == "string":
+                args.append(len(strings))
+                strings.append(event["string"].encode("utf-8"))
+            else:
+                args.append(int(event[field.rstrip("?")]))
+
+    width = 2 if all(-32768 <= a < 32768 for a in args) else 4
+    packed = array("h" if width == 2 else "i", args)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, width, len(ids), len(args), len(strings)))
+    out += ids
+    out += b"\0" * (-len(out) % width)
+    out += packed.tobytes()
+    for data in strings:
+        out += struct.pack("<I", len(data)) + data
+    return bytes(out)
+
+
+def decode_trace(payload: bytes) -> List[Dict[str, Any]]:
+    magic, version, width, count, arg_count, string_count = _HEADER.unpack_from(payload, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a compact trace payload")
+    offset = _HEADER.size
+    ids = payload[offset:offset + count]
+    offset += count
+    offset += -offset % width
+    args = array("h" if width == 2 else "i")
+    args.frombytes(payload[offset:offset + arg_count * width])
+    if sys.byteorder == "big":
+        args.byteswap()
+    offset += arg_count * width
+    strings = []
+    for _ in range(string_count):
+        (size,) = struct.unpack_from("<I", payload, offset)
+        strings.append(payload[offset + 4:offset + 4 + size].decode("utf-8"))
+        offset += 4 + size
+
+    steps = []
+    transformed = ""
+    position = 0
+    for template_id in ids:
+        event_type, line, description, fields = TEMPLATES[template_id]
+        event: Dict[str, Any] = {"type": event_type}
+        for field in fields:
+            if field == "indices":
+                event["indices"] = [args[position], args[position + 1]]
+                position += 2
+            elif field == "cells*":
+                count = args[position]
+                event["cells"] = list(args[position + 1:position + 1 + count])
+                position += 1 + count
+            elif field == "string":
+                transformed = event["string"] = strings[args[position]]
+                position += 1
+            elif field.endswith("?"):
+                event[field[:-1]] = bool(args[position])
+                position += 1
+            else:
+                event[field] = args[position]
+                position += 1
+        event["description"] = render_description(description, event, transformed)
+        if line is not None:
+            event["line"] = line
+        steps.append(event)
+    return steps
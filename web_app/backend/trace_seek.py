@@ -0,0 +1,98 @@
+"""
+Random access into long traces without replaying them from step 0.
+
+build_index runs a tracer once with checkpoints=True and keeps the tracer state at the first loop
+boundary after every CHECKPOINT_EVERY steps. trace_window then resumes the tracer from the nearest
+checkpoint at or before the requested step, so a seek costs O(CHECKPOINT_EVERY) trace steps
+(plus, at most, one loop iteration) instead of O(step).
+
+Checkpoints only hold a few integers. The arrays some tracers need to continue (Manacher's P prefix,
+the DP diagonals) are rebuilt by restore from one Manacher radius pass over the text, which each
+worker process keeps for the last few texts.
+"""
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+CHECKPOINT_EVERY = 4096
+# A full pass is needed to build the index, so the total trace length is bounded
+MAX_TRACE_STEPS = 5_000_000
+
+Tracer = Callable[..., Iterator[Dict[str, Any]]]
+
+
+class TraceTooLong(ValueError):
+    pass
+
+
+@lru_cache(maxsize=4)
+def text_radii(text: str):
+    # algorithms/manacher.py (on sys.path, see compute.py); P[k] is the palindrome length at center k
+    # of the virtual string '#s0#s1#...#'
+    from manacher import manacher_radii
+    return manacher_radii(text)
+
+
+def _diagonal(text: str, length: int) -> List[int]:
+    # Start positions of the palindromes of this length
+    P = text_radii(text)
+    return [a for a in range(len(text) - length + 1) if P[2 * a + length] >= length]
+
+
+def _mask(text: str, length: int) -> int:
+    # Same diagonal as a bitmask (bit a = start a), matching dp_bitset.diagonals; D[0] has n + 1 bits
+    if length == 0:
+        return (1 << (len(text) + 1)) - 1
+    bits = bytearray(b"0" * (len(text) - length + 1))
+    for a in _diagonal(text, length):
+        bits[a] = ord("1")
+    return int(bits[::-1] or b"0", 2)
+
+
+def restore(algorithm: str, text: str, state: Dict[str, Any]) -> Dict[str, Any]:
+    """Checkpoint state -> the resume argument of the tracer."""
+    resume = dict(state)
+    if algorithm == "manacher":
+        P = [0] * (2 * len(text) + 3)
+        # trace_manacher works on '^#s0#...#$': index t there is center t - 1 of the radius array
+        P[1:state["i"]] = text_radii(text)[:state["i"] - 1]
+        resume["P"] = P
+    elif algorithm == "dynamic_programming":
+        length, i = state["length"], state["i"]
+        # Cells read from here on: diagonals length - 2 and length - 1, and the finished part of this one
+        cells = [(a, a + L - 1) for L in range(max(1, length - 2), length) for a in _diagonal(text, L)]
+        cells += [(a, a + length - 1) for a in _diagonal(text, length) if a < i]
+        resume["cells"] = cells
+    elif algorithm == "dp_bitset":
+        resume["older"] = _mask(text, state["length"] - 2) if state["length"] >= 2 else 0
+        resume["old"] = _mask(text, state["length"] - 1)
+    return resume
+
+
+def build_index(tracer: Tracer, text: str, every: int = CHECKPOINT_EVERY,
+                max_steps: int = MAX_TRACE_STEPS) -> Dict[str, Any]:
+    """{"total": steps, "every": every, "checkpoints": [[step, state], ...]}; state None = from the start."""
+    checkpoints: List[List[Any]] = [[0, None]]
+    steps = 0
+    due = every
+    for event in tracer(text, checkpoints=True):
+        if event["type"] == "checkpoint":
+            if steps >= due:
+                checkpoints.append([steps, event["state"]])
+                due = steps + every
+            continue
+        steps += 1
+        if steps > max_steps:
+            raise TraceTooLong(f"Trace has more than {max_steps} steps")
+    return {"total": steps, "every": every, "checkpoints": checkpoints}
+
+
+def trace_window(tracer: Tracer, algorithm: str, text: str, index: Dict[str, Any],
+                 start: int, count: int) -> List[Dict[str, Any]]:
+    """Steps start .. start + count - 1 of the trace (fewer at the end)."""
+    checkpoints = index["checkpoints"]
+    step, state = checkpoints[bisect_right([c[0] for c in checkpoints], start) - 1]
+    resume: Optional[Dict[str, Any]] = None if state is None else restore(algorithm, text, state)
+    steps = tracer(text, resume=resume)
+    return list(islice(steps, start - step, start - step + count))
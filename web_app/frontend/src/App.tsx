@@ -5,16 +5,19 @@ import Visualizer from './components/Visualizer';
 import Benchmark from './components/Benchmark';
 import AlgorithmInfo from './components/AlgorithmInfo';
 import TestCaseSelector from './components/TestCaseSelector';
-import type { Algorithm, VisualizationStep, BenchmarkResult } from './types';
+import DPTileView, { MAX_TILED_SIZE } from './components/DPTileView';
+import type { Algorithm, VisualizationStep, BenchmarkResult, PalindromeStats } from './types';
 import { Activity } from 'lucide-react';
-
-const API_URL = 'http://localhost:8000';
+import { API_URL } from './api';
+import { COMPACT_MEDIA_TYPE, decodeTrace, maxTraceLength } from './traceCodec';
 
 function App() {
     const [text, setText] = useState('babad');
     const [algorithm, setAlgorithm] = useState<Algorithm>('expand_center');
     const [steps, setSteps] = useState<VisualizationStep[]>([]);
+    const [tableText, setTableText] = useState<string | null>(null); // DP table shown without a trace
     const [benchmarkResults, setBenchmarkResults] = useState<BenchmarkResult | null>(null);
+    const [stats, setStats] = useState<PalindromeStats | null>(null);
     const [loading, setLoading] = useState(false);
     const [error, setError] = useState<string | null>(null);
 
@@ -22,16 +25,36 @@ function App() {
         setLoading(true);
         setError(null);
         setSteps([]);
+        setTableText(null);
         setBenchmarkResults(null); // Clear benchmark when visualizing
+        setStats(null);
+        // Too long for a trace: the DP table alone is still available, its tiles come straight from /dp/tiles
+        const isDP = algorithm === 'dynamic_programming' || algorithm === 'dp_bitset';
+        if (isDP && text.length > maxTraceLength(algorithm) && text.length <= MAX_TILED_SIZE) {
+            setTableText(text);
+            setLoading(false);
+            return;
+        }
         try {
-            const response = await axios.post<VisualizationStep[]>(`${API_URL}/visualize`, {
-                text,
-                algorithm
+            // The compact binary trace is ~20x smaller than JSON and allows twice the input length
+            const response = await axios.post<ArrayBuffer>(`${API_URL}/visualize`, { text, algorithm }, {
+                headers: { Accept: COMPACT_MEDIA_TYPE },
+                responseType: 'arraybuffer',
             });
-            setSteps(response.data);
+            setSteps(await decodeTrace(response.data));
         } catch (err: any) {
             console.error(err);
-            setError(err.response?.data?.detail || 'An error occurred');
+            // Error bodies arrive as bytes too, because of responseType; a proxy may answer with HTML or nothing
+            const data = err.response?.data;
+            let detail = data?.detail;
+            if (data instanceof ArrayBuffer) {
+                try {
+                    detail = JSON.parse(new TextDecoder().decode(data)).detail;
+                } catch {
+                    detail = err.response?.statusText;
+                }
+            }
+            setError(detail || err.message || 'An error occurred');
         } finally {
             setLoading(false);
         }
@@ -40,16 +63,21 @@ function App() {
     const handleBenchmark = async () => {
         setLoading(true);
         setError(null);
+        setTableText(null);
         setBenchmarkResults(null);
+        setStats(null);
+        // Statistics are O(n) and fast: show them as soon as they arrive, even if the benchmark fails or times out
+        const statsRequest = axios.post<PalindromeStats>(`${API_URL}/stats`, { text })
+            .then(response => setStats(response.data))
+            .catch(err => console.error(err));
         try {
-            const response = await axios.post<BenchmarkResult>(`${API_URL}/benchmark`, {
-                text
-            });
+            const response = await axios.post<BenchmarkResult>(`${API_URL}/benchmark`, { text });
             setBenchmarkResults(response.data);
         } catch (err: any) {
             console.error(err);
             setError(err.response?.data?.detail || 'An error occurred');
         } finally {
+            await statsRequest;
             setLoading(false);
         }
     };
@@ -58,7 +86,9 @@ function App() {
         setText(testText);
         // Clear previous results when selecting a new test case
         setSteps([]);
+        setTableText(null);
         setBenchmarkResults(null);
+        setStats(null);
     };
 
     return (
@@ -109,8 +139,18 @@ function App() {
                             />
                         )}
 
+                        {tableText !== null && (
+                            <div className="bg-slate-800 p-6 rounded-lg shadow-lg">
+                                <p className="text-sm text-gray-400 mb-4">
+                                    Chuỗi dài {tableText.length} ký tự: không có minh họa từng bước, chỉ hiển thị bảng DP hoàn chỉnh.
+                                </p>
+                                <DPTileView text={tableText} />
+                            </div>
+                        )}
+
                         <Benchmark
                             results={benchmarkResults}
+                            stats={stats}
                             loading={loading && !steps.length}
                         />
                     </main>
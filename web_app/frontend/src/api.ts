@@ -0,0 +1 @@
+export const API_URL = 'http://localhost:8000';
@@ -48,6 +48,22 @@ const algorithmData: Record<Algorithm, AlgorithmMetadata> = {
             "Tìm tất cả chuỗi đối xứng"
         ]
     },
+    dp_bitset: {
+        name: "Quy hoạch động bit song song",
+        timeComplexity: "O(N²/64)",
+        spaceComplexity: "O(N)",
+        description: "Mỗi đường chéo của bảng DP là một dãy bit; cả đường chéo được tính bằng vài phép AND và dịch bit.",
+        characteristics: [
+            "Cùng công thức với Quy hoạch động",
+            "Chỉ giữ hai đường chéo",
+            "Dừng sớm khi hai đường chéo liên tiếp rỗng"
+        ],
+        bestFor: [
+            "Bài học DP trên chuỗi dài (≤ 1000 ký tự)",
+            "Liệt kê mọi chuỗi đối xứng theo độ dài",
+            "Khi bộ nhớ bị hạn chế"
+        ]
+    },
     expand_center: {
         name: "Mở rộng quanh tâm",
         timeComplexity: "O(N²)",
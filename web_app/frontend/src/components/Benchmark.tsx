@@ -1,13 +1,32 @@
 import React from 'react';
-import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, Cell } from 'recharts';
-import type { BenchmarkResult } from '../types';
+import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, Cell, AreaChart, Area } from 'recharts';
+import type { BenchmarkResult, PalindromeStats } from '../types';
 
 interface BenchmarkProps {
     results: BenchmarkResult | null;
+    stats?: PalindromeStats | null;
     loading: boolean;
 }
 
-const Benchmark: React.FC<BenchmarkProps> = ({ results, loading }) => {
+// Keep charts responsive for long inputs: sum per-position counts into at most this many buckets
+const MAX_COVERAGE_POINTS = 200;
+
+const coverageData = (stats: PalindromeStats) => {
+    const size = Math.max(1, Math.ceil(stats.length / MAX_COVERAGE_POINTS));
+    const data = [];
+    for (let i = 0; i < stats.length; i += size) {
+        let starts = 0;
+        let ends = 0;
+        for (let j = i; j < Math.min(i + size, stats.length); j++) {
+            starts += stats.starts[j];
+            ends += stats.ends[j];
+        }
+        data.push({ position: i, starts, ends });
+    }
+    return data;
+};
+
+const Benchmark: React.FC<BenchmarkProps> = ({ results, stats, loading }) => {
     if (loading) {
         return (
             <div className="bg-slate-800 p-6 rounded-lg shadow-lg mb-6 flex items-center justify-center h-64">
@@ -16,17 +35,20 @@ const Benchmark: React.FC<BenchmarkProps> = ({ results, loading }) => {
         );
     }
 
-    if (!results) return null;
+    // Statistics come from their own request, so they are shown even when the benchmark failed
+    if (!results && !stats) return null;
 
-    const data = [
-        { name: 'Brute Force', time: results.brute_force, color: '#ef4444' },
-        { name: 'DP', time: results.dynamic_programming, color: '#eab308' },
-        { name: 'Expand Center', time: results.expand_center, color: '#3b82f6' },
-        { name: 'Manacher', time: results.manacher, color: '#a855f7' },
+    const data = !results ? [] : [
+        { name: 'Brute Force', engine: 'brute_force', time: results.brute_force, color: '#ef4444' },
+        { name: 'DP', engine: 'dynamic_programming', time: results.dynamic_programming, color: '#eab308' },
+        { name: 'DP Bitset', engine: 'dp_bitset', time: results.dp_bitset, color: '#22c55e' },
+        { name: 'Expand Center', engine: 'expand_center', time: results.expand_center, color: '#3b82f6' },
+        { name: 'Manacher', engine: 'manacher', time: results.manacher, color: '#a855f7' },
     ].filter(item => item.time !== null);
 
     return (
         <div className="bg-slate-800 p-6 rounded-lg shadow-lg mb-6">
+            {results && (<>
             <h2 className="text-2xl font-bold mb-4 text-purple-400">Kết quả đo hiệu năng (ms)</h2>
             <div className="h-80 w-full">
                 <ResponsiveContainer width="100%" height="100%">
@@ -51,6 +73,65 @@ const Benchmark: React.FC<BenchmarkProps> = ({ results, loading }) => {
             <div className="mt-4 text-sm text-gray-400">
                 * Càng thấp càng tốt. Vét cạn và Quy hoạch động có thể bỏ qua với chuỗi dài.
             </div>
+
+            {results.counters && (
+                <div className="mt-6 pt-6 border-t border-slate-700">
+                    <h3 className="text-xl font-bold mb-2 text-blue-400">Số phép toán</h3>
+                    <table className="w-full text-sm font-mono text-gray-300">
+                        <tbody>
+                            {data.map(item => {
+                                const counts = results.counters![item.engine];
+                                if (!counts) return null;
+                                return (
+                                    <tr key={item.name} className="border-b border-slate-700">
+                                        <td className="py-1 pr-4" style={{ color: item.color }}>{item.name}</td>
+                                        <td className="py-1">
+                                            {Object.entries(counts).map(([name, value]) => `${name}: ${value.toLocaleString()}`).join(' • ')}
+                                        </td>
+                                    </tr>
+                                );
+                            })}
+                        </tbody>
+                    </table>
+                </div>
+            )}
+            </>)}
+
+            {stats && (
+                <div className={results ? 'mt-6 pt-6 border-t border-slate-700' : ''}>
+                    <h3 className="text-xl font-bold mb-2 text-green-400">Thống kê chuỗi con đối xứng</h3>
+                    <p className="text-sm text-gray-300 mb-4">
+                        Tổng số: <span className="font-mono font-bold">{stats.total.toLocaleString()}</span>
+                        {' '}• Dài nhất: <span className="font-mono font-bold">{stats.longest}</span>
+                    </p>
+                    <div className="grid grid-cols-1 lg:grid-cols-2 gap-4">
+                        <div className="h-64">
+                            <ResponsiveContainer width="100%" height="100%">
+                                <BarChart data={stats.histogram.map((count, length) => ({ length, count })).filter(item => item.count > 0)}>
+                                    <CartesianGrid strokeDasharray="3 3" stroke="#334155" />
+                                    <XAxis dataKey="length" stroke="#94a3b8" />
+                                    <YAxis stroke="#94a3b8" />
+                                    <Tooltip contentStyle={{ backgroundColor: '#1e293b', borderColor: '#334155', color: '#f8fafc' }} />
+                                    <Bar dataKey="count" name="Số chuỗi theo độ dài" fill="#22c55e" />
+                                </BarChart>
+                            </ResponsiveContainer>
+                        </div>
+                        <div className="h-64">
+                            <ResponsiveContainer width="100%" height="100%">
+                                <AreaChart data={coverageData(stats)}>
+                                    <CartesianGrid strokeDasharray="3 3" stroke="#334155" />
+                                    <XAxis dataKey="position" stroke="#94a3b8" />
+                                    <YAxis stroke="#94a3b8" />
+                                    <Tooltip contentStyle={{ backgroundColor: '#1e293b', borderColor: '#334155', color: '#f8fafc' }} />
+                                    <Legend />
+                                    <Area type="monotone" dataKey="starts" name="Bắt đầu tại vị trí" stroke="#3b82f6" fill="#3b82f6" fillOpacity={0.3} />
+                                    <Area type="monotone" dataKey="ends" name="Kết thúc tại vị trí" stroke="#a855f7" fill="#a855f7" fillOpacity={0.3} />
+                                </AreaChart>
+                            </ResponsiveContainer>
+                        </div>
+                    </div>
+                </div>
+            )}
         </div>
     );
 };
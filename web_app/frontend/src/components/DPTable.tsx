@@ -1,22 +1,42 @@
 import React from 'react';
 import type { VisualizationStep } from '../types';
+import DPTileView, { MAX_TILED_SIZE } from './DPTileView';
 
 interface DPTableProps {
     n: number;
+    text?: string;
     steps: VisualizationStep[];
     currentIndex: number;
 }
 
-const DPTable: React.FC<DPTableProps> = ({ n, steps, currentIndex }) => {
+// Cells filled up to currentIndex, in trace order (one dp_update per cell, or a whole diagonal at once)
+const filledCells = (n: number, steps: VisualizationStep[], currentIndex: number) => {
+    let filled = 0;
+    for (let i = 0; i <= currentIndex && i < steps.length; i++) {
+        const step = steps[i];
+        if (step.type === 'dp_update') filled++;
+        else if (step.type === 'dp_diagonal' && step.length !== undefined) filled += n - step.length + 1;
+    }
+    return filled;
+};
+
+const DPTable: React.FC<DPTableProps> = ({ n, text, steps, currentIndex }) => {
     // Limit table size for performance  
     const maxTableSize = 20;
     const showTable = n <= maxTableSize;
 
+    // Larger tables are fetched from the server as bit-packed tiles, only for the visible part
+    if (!showTable && text !== undefined && n <= MAX_TILED_SIZE) {
+        // After the last step every cell is decided, including the diagonals skipped when dp_bitset stops early
+        const finished = currentIndex >= steps.length - 1;
+        return <DPTileView text={text} step={finished ? undefined : filledCells(n, steps, currentIndex)} />;
+    }
+
     if (!showTable) {
         return (
             <div className="bg-slate-900 p-4 rounded-lg h-full border border-slate-700 flex flex-col justify-center items-center text-gray-500">
                 <p className="text-center mb-2">Bảng DP quá lớn để hiển thị</p>
-                <p className="text-xs text-gray-600">Độ dài chuỗi: {n} (tối đa: {maxTableSize})</p>
+                <p className="text-xs text-gray-600">Độ dài chuỗi: {n} (tối đa: {MAX_TILED_SIZE})</p>
             </div>
         );
     }
@@ -28,6 +48,14 @@ const DPTable: React.FC<DPTableProps> = ({ n, steps, currentIndex }) => {
         const step = steps[i];
         if (step.type === 'dp_update' && step.row !== undefined && step.col !== undefined) {
             dp[step.row][step.col] = step.value;
+        } else if (step.type === 'dp_diagonal' && step.length !== undefined && step.cells) {
+            // Whole diagonal at once: listed cells are palindromes, the rest of the diagonal is not
+            for (let row = 0; row + step.length <= n; row++) {
+                dp[row][row + step.length - 1] = false;
+            }
+            for (const row of step.cells) {
+                dp[row][row + step.length - 1] = true;
+            }
         }
     }
 
@@ -0,0 +1,92 @@
+import React, { useEffect, useRef, useState } from 'react';
+import axios from 'axios';
+import { ChevronUp, ChevronDown, ChevronLeft, ChevronRight } from 'lucide-react';
+import { API_URL } from '../api';
+import type { DPTiles } from '../types';
+
+export const MAX_TILED_SIZE = 5000; // Same as MAX_DP_TILES_LEN in the backend
+
+const TILE = 64;
+const VIEW = 2 * TILE; // Cells per side of the visible window
+const CELL = 4; // Pixels per cell
+
+interface DPTileViewProps {
+    text: string;
+    step?: number; // Cells filled so far, in the order of the DP trace; omitted when the whole table is known
+}
+
+// Position of cell (i, j) in the fill order: diagonals 1 .. L-1 first, then row i of diagonal L
+const cellOrder = (i: number, j: number, n: number) => {
+    const L = j - i + 1;
+    return (L - 1) * n - ((L - 1) * (L - 2)) / 2 + i;
+};
+
+const DPTileView: React.FC<DPTileViewProps> = ({ text, step }) => {
+    const n = text.length;
+    const [origin, setOrigin] = useState({ row: 0, col: 0 });
+    const [tiles, setTiles] = useState<Map<string, Uint8Array>>(new Map());
+    const canvasRef = useRef<HTMLCanvasElement>(null);
+
+    // Finished tiles only change with the text or the viewport; the step is applied while drawing
+    useEffect(() => {
+        let cancelled = false;
+        axios.post<DPTiles>(`${API_URL}/dp/tiles`, { text, row: origin.row, col: origin.col, rows: VIEW, cols: VIEW })
+            .then(response => {
+                if (cancelled) return;
+                const decoded = new Map<string, Uint8Array>();
+                for (const tile of response.data.tiles) {
+                    decoded.set(`${tile.row},${tile.col}`, Uint8Array.from(atob(tile.bits), c => c.charCodeAt(0)));
+                }
+                setTiles(decoded);
+            })
+            .catch(() => {
+                if (!cancelled) setTiles(new Map());
+            });
+        return () => { cancelled = true; };
+    }, [text, origin]);
+
+    useEffect(() => {
+        const ctx = canvasRef.current?.getContext('2d');
+        if (!ctx) return;
+        ctx.clearRect(0, 0, VIEW * CELL, VIEW * CELL);
+        for (let r = 0; r < VIEW; r++) {
+            for (let c = 0; c < VIEW; c++) {
+                const i = origin.row + r;
+                const j = origin.col + c;
+                if (j >= n || j < i) continue; // Only the upper triangle exists
+                const bits = tiles.get(`${Math.floor(i / TILE)},${Math.floor(j / TILE)}`);
+                const value = bits ? (bits[(i % TILE) * (TILE / 8) + ((j % TILE) >> 3)] >> (j & 7)) & 1 : 0;
+                if (step !== undefined && cellOrder(i, j, n) >= step) ctx.fillStyle = '#1e293b';
+                else ctx.fillStyle = value ? '#4ade80' : 'rgba(127, 29, 29, 0.4)';
+                ctx.fillRect(c * CELL, r * CELL, CELL - 1, CELL - 1);
+            }
+        }
+    }, [tiles, step, origin, n]);
+
+    const move = (rows: number, cols: number) => {
+        const limit = Math.max(0, Math.floor((n - 1) / TILE) * TILE);
+        setOrigin(prev => ({
+            row: Math.min(limit, Math.max(0, prev.row + rows)),
+            col: Math.min(limit, Math.max(0, prev.col + cols)),
+        }));
+    };
+
+    const button = 'p-1 hover:bg-slate-700 rounded text-gray-300';
+    return (
+        <div className="bg-slate-900 p-4 rounded-lg h-full border border-slate-700 flex flex-col">
+            <h3 className="text-gray-400 mb-3 font-bold uppercase text-xs tracking-wider">Bảng DP</h3>
+            <div className="flex items-center gap-2 mb-2 text-xs text-gray-400">
+                <button className={button} onClick={() => move(-TILE, 0)}><ChevronUp size={16} /></button>
+                <button className={button} onClick={() => move(TILE, 0)}><ChevronDown size={16} /></button>
+                <button className={button} onClick={() => move(0, -TILE)}><ChevronLeft size={16} /></button>
+                <button className={button} onClick={() => move(0, TILE)}><ChevronRight size={16} /></button>
+                <span className="font-mono">
+                    dp[{origin.row}..{Math.min(n, origin.row + VIEW) - 1}][{origin.col}..{Math.min(n, origin.col + VIEW) - 1}] / {n}×{n}
+                </span>
+            </div>
+            <canvas ref={canvasRef} width={VIEW * CELL} height={VIEW * CELL} className="self-start" />
+        </div>
+    );
+};
+
+export default DPTileView;
@@ -38,6 +38,7 @@ const InputSection: React.FC<InputSectionProps> = ({
                     >
                         <option value="brute_force">Brute Force (O(N³), O(1))</option>
                         <option value="dynamic_programming">Dynamic Programming (O(N²), O(N²))</option>
+                        <option value="dp_bitset">Bit-parallel DP (O(N²/64), O(N))</option>
                         <option value="expand_center">Expand Around Center (O(N²), O(1))</option>
                         <option value="manacher">Manacher's Algorithm (O(N), O(N))</option>
                     </select>
@@ -44,6 +44,14 @@ const ALGORITHM_CODE: Record<Algorithm, string> = {
         dp[i][j] = true
         updateMax(i, j)`,
 
+    dp_bitset: `function bitsetDP(s):
+  E[k] = bits(s[i] == s[i+k]) # XOR bit-planes
+  D[0] = D[1] = all ones
+  for len from 2 to n:
+    D[len] = (D[len-2] >> 1) & E[len-1]
+    if D[len] != 0: updateMax(lowestBit(D[len]), len)
+    if D[len] == 0 and D[len-1] == 0: break`,
+
     manacher: `function manacher(s):
   T = transform(s) # ^#a#b#a#$
   P = array(length(T), 0)
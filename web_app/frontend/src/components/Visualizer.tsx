@@ -228,9 +228,9 @@ const Visualizer: React.FC<VisualizerProps> = ({ text, steps, algorithm }) => {
             </div>
 
             {/* DP Table - Below if Dynamic Programming is selected */}
-            {algorithm === 'dynamic_programming' && (
+            {(algorithm === 'dynamic_programming' || algorithm === 'dp_bitset') && (
                 <div className="mt-6 h-[400px]">
-                    <DPTable n={text.length} steps={steps} currentIndex={currentStepIndex} />
+                    <DPTable n={text.length} text={text} steps={steps} currentIndex={currentStepIndex} />
                 </div>
             )}
         </div>
@@ -0,0 +1,123 @@
+import axios from 'axios';
+import { API_URL } from './api';
+import type { Algorithm, VisualizationStep } from './types';
+
+// Decoder for the compact trace of POST /visualize (Accept: application/octet-stream),
+// the counterpart of decode_trace in web_app/backend/trace_codec.py
+export const COMPACT_MEDIA_TYPE = 'application/octet-stream';
+
+// Longest input with a compact trace, as MAX_COMPACT_LEN_SLOW / MAX_COMPACT_LEN_FAST in the backend
+export const maxTraceLength = (algorithm: Algorithm) =>
+    algorithm === 'brute_force' || algorithm === 'dynamic_programming' ? 200 : 2000;
+
+const MAGIC = 'LPST';
+const VERSION = 1;
+const HEADER_SIZE = 20;
+
+interface Template {
+    type: VisualizationStep['type'];
+    line: number | null;
+    description: string;
+    fields: string[];
+}
+
+interface TemplateTable {
+    version: number;
+    templates: Template[];
+}
+
+let templates: Promise<Template[]> | null = null;
+
+// GET /visualize/templates is fetched once per page load
+const loadTemplates = (): Promise<Template[]> => {
+    if (!templates) {
+        templates = axios.get<TemplateTable>(`${API_URL}/visualize/templates`)
+            .then(response => {
+                if (response.data.version !== VERSION) {
+                    throw new Error(`Unsupported compact trace version ${response.data.version}`);
+                }
+                return response.data.templates;
+            })
+            .catch(err => {
+                templates = null; // Retry on the next trace
+                throw err;
+            });
+    }
+    return templates;
+};
+
+// Same placeholders as render_description; the transformed string is indexed by code point, like Python
+const renderDescription = (template: string, event: VisualizationStep, transformed: string[]): string => {
+    const values: Record<string, unknown> = { ...event };
+    if (event.indices) {
+        const [i0, i1] = event.indices;
+        Object.assign(values, { i0, i1, i1_next: i1 + 1 });
+        if (transformed.length) Object.assign(values, { t0: transformed[i0], t1: transformed[i1] });
+    }
+    if (event.cells) values.count = event.cells.length;
+    if (event.index !== undefined && transformed.length) values.t_index = transformed[event.index];
+    return template.replace(/\{(\w+)\}/g, (_, name: string) => String(values[name]));
+};
+
+export const decodeTrace = async (payload: ArrayBuffer): Promise<VisualizationStep[]> => {
+    const table = await loadTemplates();
+    const view = new DataView(payload);
+    const magic = String.fromCharCode(...new Uint8Array(payload, 0, 4));
+    if (magic !== MAGIC || view.getUint8(4) !== VERSION) {
+        throw new Error('Not a compact trace payload');
+    }
+    const width = view.getUint8(5);
+    const count = view.getUint32(8, true);
+    const argCount = view.getUint32(12, true);
+    const stringCount = view.getUint32(16, true);
+
+    let offset = HEADER_SIZE;
+    const ids = new Uint8Array(payload, offset, count);
+    offset += count;
+    offset += (width - (offset % width)) % width;
+    const args = new Int32Array(argCount);
+    for (let k = 0; k < argCount; k++) {
+        args[k] = width === 2 ? view.getInt16(offset + 2 * k, true) : view.getInt32(offset + 4 * k, true);
+    }
+    offset += argCount * width;
+    const decoder = new TextDecoder();
+    const strings: string[] = [];
+    for (let k = 0; k < stringCount; k++) {
+        const size = view.getUint32(offset, true);
+        strings.push(decoder.decode(new Uint8Array(payload, offset + 4, size)));
+        offset += 4 + size;
+    }
+
+    const steps: VisualizationStep[] = [];
+    let transformed: string[] = [];
+    let position = 0;
+    for (const id of ids) {
+        const template = table[id];
+        const event = { type: template.type } as VisualizationStep;
+        const fields = event as unknown as Record<string, unknown>;
+        for (const field of template.fields) {
+            if (field === 'indices') {
+                event.indices = [args[position], args[position + 1]];
+                position += 2;
+            } else if (field === 'cells*') {
+                const cells = args[position];
+                event.cells = Array.from(args.subarray(position + 1, position + 1 + cells));
+                position += 1 + cells;
+            } else if (field === 'string') {
+                event.string = strings[args[position]];
+                transformed = Array.from(event.string);
+                position += 1;
+            } else if (field.endsWith('?')) {
+                fields[field.slice(0, -1)] = args[position] !== 0;
+                position += 1;
+            } else {
+                fields[field] = args[position];
+                position += 1;
+            }
+        }
+        event.description = renderDescription(template.description, event, transformed);
+        if (template.line !== null) event.line = template.line;
+        steps.push(event);
+    }
+    return steps;
+};
@@ -1,5 +1,5 @@
 export interface VisualizationStep {
-    type: 'init' | 'select' | 'compare' | 'match' | 'mismatch' | 'update_max' | 'found' | 'center' | 'transform' | 'mirror' | 'update_center' | 'dp_update' | 'dp_check' | 'loop_i' | 'check' | 'expand' | 'loop_len' | 'calc_mirror' | 'init_vars' | 'select_center';
+    type: 'init' | 'select' | 'compare' | 'match' | 'mismatch' | 'update_max' | 'found' | 'center' | 'transform' | 'mirror' | 'update_center' | 'dp_update' | 'dp_check' | 'loop_i' | 'check' | 'expand' | 'loop_len' | 'calc_mirror' | 'init_vars' | 'select_center' | 'dp_diagonal';
     description: string;
     indices?: number[];
     index?: number;
@@ -13,14 +13,42 @@ export interface VisualizationStep {
     string?: string;
     row?: number;
     col?: number;
+    cells?: number[];
     line?: number;
 }
 
+// POST /visualize/steps?from=&count=: one window of a trace too long to send whole
+export interface StepWindow {
+    from: number;
+    total: number;
+    steps: VisualizationStep[];
+}
+
+// POST /dp/tiles: TILE x TILE bit-packed cells per tile, 8 bytes per row, bit k of byte b = column col * TILE + 8b + k
+export interface DPTiles {
+    n: number;
+    tile: number;
+    step: number | null;
+    tiles: { row: number; col: number; bits: string }[];
+}
+
 export interface BenchmarkResult {
     brute_force: number | null;
     dynamic_programming: number | null;
-    expand_center: number;
+    dp_bitset: number | null;
+    expand_center: number | null;
     manacher: number;
+    // Operation counts per engine (null when the engine was skipped)
+    counters?: Record<string, Record<string, number> | null>;
+}
+
+export interface PalindromeStats {
+    length: number;
+    total: number;
+    longest: number;
+    starts: number[];
+    ends: number[];
+    histogram: number[];
 }
 
-export type Algorithm = 'brute_force' | 'dynamic_programming' | 'expand_center' | 'manacher';
+export type Algorithm = 'brute_force' | 'dynamic_programming' | 'dp_bitset' | 'expand_center' | 'manacher';